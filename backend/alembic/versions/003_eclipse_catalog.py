@@ -0,0 +1,37 @@
+"""Eclipse catalog
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'eclipses',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('eclipse_type', sa.String(10), nullable=False),
+        sa.Column('subtype', sa.String(20), nullable=False),
+        sa.Column('julian_day', sa.Float(), nullable=False),
+        sa.Column('eclipse_time', sa.DateTime(), nullable=False),
+        sa.Column('longitude', sa.Float(), nullable=False),
+        sa.Column('rasi', sa.Integer(), nullable=False),
+        sa.Column('nakshatra', sa.String(50), nullable=True),
+        sa.Column('nakshatra_pada', sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_eclipses_julian_day', 'eclipses', ['julian_day'])
+
+
+def downgrade():
+    op.drop_index('ix_eclipses_julian_day', 'eclipses')
+    op.drop_table('eclipses')
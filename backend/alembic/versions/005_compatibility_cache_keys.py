@@ -0,0 +1,33 @@
+"""Compatibility reports keyed by chart hash pair
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('compatibility_reports', sa.Column('chart_hash1', sa.String(64), nullable=True))
+    op.add_column('compatibility_reports', sa.Column('chart_hash2', sa.String(64), nullable=True))
+    op.add_column('compatibility_reports', sa.Column('engine_version', sa.String(20), nullable=True))
+    op.add_column('compatibility_reports', sa.Column('reverse_ashtakoot', sa.JSON(), nullable=True))
+    op.create_index('ix_compatibility_reports_chart_hash1', 'compatibility_reports', ['chart_hash1'])
+    op.create_index('ix_compatibility_reports_chart_hash2', 'compatibility_reports', ['chart_hash2'])
+
+
+def downgrade():
+    op.drop_index('ix_compatibility_reports_chart_hash2', 'compatibility_reports')
+    op.drop_index('ix_compatibility_reports_chart_hash1', 'compatibility_reports')
+    op.drop_column('compatibility_reports', 'reverse_ashtakoot')
+    op.drop_column('compatibility_reports', 'engine_version')
+    op.drop_column('compatibility_reports', 'chart_hash2')
+    op.drop_column('compatibility_reports', 'chart_hash1')
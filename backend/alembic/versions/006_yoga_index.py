@@ -0,0 +1,27 @@
+"""Materialized yoga index
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('natal_charts', sa.Column('yogas_indexed_at', sa.DateTime(), nullable=True))
+    op.create_index('ix_yogas_natal_chart_id', 'yogas', ['natal_chart_id'])
+    op.create_index('ix_yogas_yoga_name', 'yogas', ['yoga_name'])
+
+
+def downgrade():
+    op.drop_index('ix_yogas_yoga_name', 'yogas')
+    op.drop_index('ix_yogas_natal_chart_id', 'yogas')
+    op.drop_column('natal_charts', 'yogas_indexed_at')
@@ -0,0 +1,36 @@
+"""Versioned yoga rule sets
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'yoga_rule_sets',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('content_hash', sa.String(64), nullable=False),
+        sa.Column('rules', sa.JSON(), nullable=False),
+        sa.Column('rule_count', sa.Integer(), nullable=True),
+        sa.Column('is_active', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_yoga_rule_sets_content_hash', 'yoga_rule_sets', ['content_hash'], unique=True)
+    op.add_column('natal_charts', sa.Column('yoga_rule_set', sa.String(64), nullable=True))
+
+
+def downgrade():
+    op.drop_column('natal_charts', 'yoga_rule_set')
+    op.drop_index('ix_yoga_rule_sets_content_hash', 'yoga_rule_sets')
+    op.drop_table('yoga_rule_sets')
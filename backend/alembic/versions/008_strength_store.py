@@ -0,0 +1,27 @@
+"""Persisted strength results with engine version
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('strengths', sa.Column('engine_version', sa.String(32), nullable=True))
+    op.create_index('ix_strengths_natal_chart_id', 'strengths', ['natal_chart_id'])
+    op.add_column('natal_charts', sa.Column('strength_engine_version', sa.String(32), nullable=True))
+
+
+def downgrade():
+    op.drop_column('natal_charts', 'strength_engine_version')
+    op.drop_index('ix_strengths_natal_chart_id', 'strengths')
+    op.drop_column('strengths', 'engine_version')
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from datetime import datetime, date, timedelta
-from typing import Optional
+from typing import List, Optional
 from app.core.database import get_db
 from app.core.auth import get_current_user
 from app.models.user import User
@@ -431,6 +431,63 @@ async def get_planner(
     }
 
 
+@router.get("/group")
+async def get_group_planner(
+    profile_ids: List[int] = Query(..., description="Profile IDs of the group members"),
+    start: str = Query(..., description="Start date YYYY-MM-DD"),
+    days: int = Query(30, ge=1, le=365, description="Number of days"),
+    include_golden: bool = Query(False, description="Include GOLDEN windows common to all members"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get jointly favourable days for a group of profiles.
+    Returns a [members x days] score matrix, days ranked by min/mean score,
+    and optionally the GOLDEN windows shared by every member.
+    """
+    profile_ids = list(dict.fromkeys(profile_ids))
+    profiles = db.query(Profile).filter(
+        Profile.id.in_(profile_ids),
+        Profile.user_id == current_user.id
+    ).all()
+
+    if len(profiles) != len(profile_ids):
+        raise HTTPException(status_code=404, detail="One or more profiles not found")
+
+    try:
+        start_date = datetime.strptime(start, "%Y-%m-%d").date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+    profiles_by_id = {p.id: p for p in profiles}
+    members = []
+    for profile_id in profile_ids:
+        profile = profiles_by_id[profile_id]
+        chart, moon_rasi, asc_rasi = get_chart_data(profile, db)
+        members.append({
+            "profile_id": profile.id,
+            "natal_moon_rasi": moon_rasi,
+            "natal_asc_rasi": asc_rasi,
+            "current_dasha": get_current_dasha(profile, db, start_date)
+        })
+
+    # Transits are shared by every member of the group
+    transits_by_day = [
+        get_transiting_planets(start_date + timedelta(days=i))
+        for i in range(days)
+    ]
+
+    group = align27_calculator.generate_group_planner(
+        start_date, days, members, transits_by_day, include_golden
+    )
+
+    return {
+        "start_date": start_date.isoformat(),
+        "days": days,
+        **group
+    }
+
+
 @router.get("/ics")
 async def get_ics_export(
     profile_id: int,
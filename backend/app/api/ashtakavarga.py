@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Optional
 from app.core.database import get_db
 from app.core.auth import get_current_user
 from app.models.user import User
 from app.models.profile import Profile
 from app.api.charts import get_or_compute_chart
 from app.modules.ashtakavarga.calculator import ashtakavarga_calculator
+from app.modules.ashtakavarga.transits import transit_ashtakavarga, MAX_TIMELINE_DAYS
+from app.modules.ephemeris.calculator import ephemeris
 from app.models.chart import PlanetaryPosition
 
 router = APIRouter(prefix="/api/ashtakavarga", tags=["ashtakavarga"])
@@ -33,6 +37,7 @@ async def get_bav(
     ).all()
     
     planetary_positions = {pos.planet: {"rasi": pos.rasi, "longitude": pos.longitude} for pos in positions}
+    planetary_positions["ASCENDANT"] = {"rasi": int(natal_chart.ascendant / 30.0) + 1, "longitude": natal_chart.ascendant}
     
     # Calculate BAV
     result = ashtakavarga_calculator.calculate_all(planetary_positions)
@@ -64,6 +69,7 @@ async def get_sav(
     ).all()
     
     planetary_positions = {pos.planet: {"rasi": pos.rasi, "longitude": pos.longitude} for pos in positions}
+    planetary_positions["ASCENDANT"] = {"rasi": int(natal_chart.ascendant / 30.0) + 1, "longitude": natal_chart.ascendant}
     
     result = ashtakavarga_calculator.calculate_all(planetary_positions)
     
@@ -95,6 +101,7 @@ async def get_ashtakavarga_summary(
     ).all()
     
     planetary_positions = {pos.planet: {"rasi": pos.rasi, "longitude": pos.longitude} for pos in positions}
+    planetary_positions["ASCENDANT"] = {"rasi": int(natal_chart.ascendant / 30.0) + 1, "longitude": natal_chart.ascendant}
     
     result = ashtakavarga_calculator.calculate_all(planetary_positions)
     
@@ -116,3 +123,55 @@ async def get_ashtakavarga_summary(
             "overall_strength": "Good" if result["summary"]["total_points"] > 300 else "Moderate"
         }
     }
+
+@router.get("/{profile_id}/transits")
+async def get_transit_ashtakavarga(
+    profile_id: int,
+    start: Optional[str] = Query(None, description="ISO date, defaults to today"),
+    end: Optional[str] = Query(None, description="ISO date, defaults to start + years"),
+    years: int = Query(1, ge=1, le=50),
+    step: int = Query(1, ge=1, le=30, description="Days between samples"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get transit bindus and kakshyas of the seven planets over a range, as
+    arrays aligned with start_jd + i * step
+    """
+    profile = db.query(Profile).filter(
+        Profile.id == profile_id,
+        Profile.user_id == current_user.id
+    ).first()
+    
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    
+    try:
+        start_dt = datetime.fromisoformat(start) if start else datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        jd_start = ephemeris.get_julian_day(start_dt)
+        jd_end = ephemeris.get_julian_day(datetime.fromisoformat(end)) if end else jd_start + years * 365.25
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use ISO format.")
+    
+    if jd_end <= jd_start:
+        raise HTTPException(status_code=400, detail="End must be after start")
+    if jd_end - jd_start > MAX_TIMELINE_DAYS:
+        raise HTTPException(status_code=400, detail="Range must not exceed 50 years")
+    
+    natal_chart = get_or_compute_chart(profile, db)
+    
+    positions = db.query(PlanetaryPosition).filter(
+        PlanetaryPosition.natal_chart_id == natal_chart.id
+    ).all()
+    
+    planetary_positions = {pos.planet: {"rasi": pos.rasi, "longitude": pos.longitude} for pos in positions}
+    planetary_positions["ASCENDANT"] = {"rasi": int(natal_chart.ascendant / 30.0) + 1, "longitude": natal_chart.ascendant}
+    
+    timeline = transit_ashtakavarga.timeline(planetary_positions, jd_start, jd_end, float(step))
+    
+    return {
+        "profile_id": profile_id,
+        "start": ephemeris.get_datetime(jd_start).isoformat(),
+        "end": ephemeris.get_datetime(jd_end).isoformat(),
+        **timeline
+    }
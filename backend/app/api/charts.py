@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from datetime import datetime
 from typing import Optional
@@ -11,6 +11,9 @@ from app.models.profile import Profile
 from app.models.chart import NatalChart, PlanetaryPosition, DivisionalChart
 from app.modules.charts.calculator import chart_calculator
 from app.modules.ephemeris.calculator import ephemeris
+from app.modules.rectification.calculator import rectification_calculator
+from app.modules.yoga.index import yoga_index
+from app.modules.strength.store import strength_store
 
 router = APIRouter(prefix="/api/charts", tags=["charts"])
 
@@ -141,21 +144,78 @@ async def get_chart_bundle(
         ]
     }
 
-def get_or_compute_chart(profile: Profile, db: Session) -> NatalChart:
-    """Get cached chart or compute new one"""
-    # Build datetime from profile
-    birth_datetime = datetime.combine(
-        profile.birth_date.date(),
-        datetime.strptime(profile.birth_time, "%H:%M:%S").time()
-    )
-    
-    # Generate hash
-    chart_hash = chart_calculator.generate_chart_hash(
-        birth_datetime,
+@router.get("/{profile_id}/sensitivity")
+async def get_chart_sensitivity(
+    profile_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get minutes of birth-time error that would move each point across a boundary"""
+    profile = db.query(Profile).filter(
+        Profile.id == profile_id,
+        Profile.user_id == current_user.id
+    ).first()
+
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    natal_chart = get_or_compute_chart(profile, db)
+
+    if natal_chart.sensitivity is None:
+        # Charts cached before sensitivity was stored; their positions are
+        # stored, so only the ascendant speed is computed
+        positions = db.query(PlanetaryPosition).filter(
+            PlanetaryPosition.natal_chart_id == natal_chart.id
+        ).all()
+        speeds = {pos.planet: pos.speed for pos in positions}
+        # Older charts stored Ketu's speed with the opposite sign; the nodes move together
+        speeds["KETU"] = speeds.get("RAHU", speeds.get("KETU"))
+        
+        points = {"ASCENDANT": (
+            natal_chart.ascendant,
+            ephemeris.get_ascendant_speed(natal_chart.julian_day, profile.latitude, profile.longitude)
+        )}
+        points.update({pos.planet: (pos.longitude, speeds[pos.planet]) for pos in positions})
+        natal_chart.sensitivity = chart_calculator.calculate_sensitivity(points)
+        db.commit()
+
+    return natal_chart.sensitivity
+
+@router.get("/{profile_id}/rectification")
+async def get_rectification_variants(
+    profile_id: int,
+    window_minutes: int = Query(120, ge=1, le=360),
+    reference_date: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get distinct chart variants across a birth time window"""
+    profile = db.query(Profile).filter(
+        Profile.id == profile_id,
+        Profile.user_id == current_user.id
+    ).first()
+
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    try:
+        reference = datetime.fromisoformat(reference_date) if reference_date else datetime.utcnow()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+    return rectification_calculator.scan(
+        chart_calculator.profile_birth_datetime(profile),
         profile.latitude,
         profile.longitude,
-        profile.ayanamsa
+        window_minutes=window_minutes,
+        reference=reference
     )
+
+def get_or_compute_chart(profile: Profile, db: Session) -> NatalChart:
+    """Get cached chart or compute new one"""
+    # Build datetime and hash from profile
+    birth_datetime = chart_calculator.profile_birth_datetime(profile)
+    chart_hash = chart_calculator.profile_chart_hash(profile)
     
     # Check cache
     natal_chart = db.query(NatalChart).filter(
@@ -182,6 +242,7 @@ def get_or_compute_chart(profile: Profile, db: Session) -> NatalChart:
         ascendant=chart_data["ascendant"],
         mc=chart_data["mc"],
         house_cusps=chart_data["house_cusps"],
+        sensitivity=chart_data["sensitivity"],
         created_at=datetime.utcnow()
     )
     db.add(natal_chart)
@@ -221,6 +282,12 @@ def get_or_compute_chart(profile: Profile, db: Session) -> NatalChart:
         )
         db.add(div_chart)
     
+    # Materialize yogas for the cross-profile index
+    yoga_index.index_charts(db, [natal_chart])
+    
+    # Strength results are computed once per chart
+    strength_store.store_charts(db, [natal_chart])
+    
     db.commit()
     db.refresh(natal_chart)
     
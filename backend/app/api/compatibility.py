@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 from datetime import datetime
 from typing import Optional
@@ -8,8 +9,11 @@ from app.models.user import User
 from app.models.profile import Profile
 from app.models.compatibility import CompatibilityReport
 from app.api.charts import get_or_compute_chart
-from app.modules.compatibility.calculator import compatibility_calculator
-from app.models.chart import PlanetaryPosition
+from app.modules.compatibility.calculator import compatibility_calculator, COMPATIBILITY_ENGINE_VERSION
+from app.modules.compatibility.matching import match_indexes, MatchIndex
+from app.modules.synastry.calculator import synastry_calculator
+from app.modules.charts.calculator import chart_calculator
+from app.models.chart import NatalChart, PlanetaryPosition
 
 router = APIRouter(prefix="/api/compatibility", tags=["compatibility"])
 
@@ -60,6 +64,42 @@ async def check_manglik_status(
         "manglik_status": manglik
     }
 
+@router.get("/{profile_id}/matches")
+async def get_matches(
+    profile_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    min_score: float = Query(0.0, ge=0, le=36),
+    manglik_match: bool = False,
+    exclude_nadi_dosha: bool = False,
+    seeker_side: str = Query("male", description="Score the profile as the male or female chart"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Rank all of the user's other profiles as matches for one profile"""
+    if seeker_side not in ("male", "female"):
+        raise HTTPException(status_code=400, detail="seeker_side must be 'male' or 'female'")
+    
+    index = sync_match_index(current_user.id, db)
+    
+    with index.lock:
+        if index.row(profile_id) is None:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        
+        matches = index.search(
+            profile_id,
+            seeker_side=seeker_side,
+            limit=limit,
+            min_score=min_score,
+            manglik_match=manglik_match,
+            exclude_nadi_dosha=exclude_nadi_dosha
+        )
+    
+    return {
+        "profile_id": profile_id,
+        "candidates": len(index) - 1,
+        "matches": matches
+    }
+
 @router.get("/{profile1_id}/{profile2_id}")
 async def get_compatibility(
     profile1_id: int,
@@ -82,111 +122,12 @@ async def get_compatibility(
     if not profile1 or not profile2:
         raise HTTPException(status_code=404, detail="One or both profiles not found")
     
-    # Check cache
-    cached = db.query(CompatibilityReport).filter(
-        CompatibilityReport.profile1_id == profile1_id,
-        CompatibilityReport.profile2_id == profile2_id
-    ).first()
-    
-    if cached:
-        return {
-            "profile1": {"id": profile1.id, "name": profile1.name},
-            "profile2": {"id": profile2.id, "name": profile2.name},
-            "ashtakoot": cached.ashtakoot_scores,
-            "total_score": cached.total_score,
-            "manglik_analysis": cached.manglik_analysis,
-            "dasha_sandhi": cached.dasha_sandhi,
-            "recommendations": cached.recommendations
-        }
-    
-    # Get charts for both profiles
-    natal_chart1 = get_or_compute_chart(profile1, db)
-    natal_chart2 = get_or_compute_chart(profile2, db)
-    
-    # Get planetary positions
-    positions1 = db.query(PlanetaryPosition).filter(
-        PlanetaryPosition.natal_chart_id == natal_chart1.id
-    ).all()
-    
-    positions2 = db.query(PlanetaryPosition).filter(
-        PlanetaryPosition.natal_chart_id == natal_chart2.id
-    ).all()
-    
-    # Build chart data structures
-    chart1 = {
-        "ascendant": natal_chart1.ascendant,
-        "planets": {pos.planet: {
-            "rasi": pos.rasi,
-            "nakshatra": pos.nakshatra,
-            "longitude": pos.longitude,
-            "dignity": pos.dignity
-        } for pos in positions1}
-    }
-    
-    chart2 = {
-        "ascendant": natal_chart2.ascendant,
-        "planets": {pos.planet: {
-            "rasi": pos.rasi,
-            "nakshatra": pos.nakshatra,
-            "longitude": pos.longitude,
-            "dignity": pos.dignity
-        } for pos in positions2}
-    }
-    
-    # Calculate Ashtakoot
-    ashtakoot = compatibility_calculator.calculate_ashtakoot(chart1, chart2)
-    
-    # Check Manglik for both
-    manglik1 = compatibility_calculator.check_manglik(chart1)
-    manglik2 = compatibility_calculator.check_manglik(chart2)
-    
-    manglik_analysis = {
-        "profile1": manglik1,
-        "profile2": manglik2,
-        "both_manglik": manglik1["is_manglik"] and manglik2["is_manglik"],
-        "manglik_match": manglik1["is_manglik"] == manglik2["is_manglik"],
-        "recommendation": get_manglik_recommendation(manglik1, manglik2)
-    }
-    
-    # Check Dasha Sandhi (simplified)
-    dasha_sandhi = check_dasha_sandhi(profile1, profile2)
-    
-    # Generate recommendations
-    recommendations = generate_recommendations(ashtakoot, manglik_analysis)
-    
-    # Format scores for storage
-    ashtakoot_scores = {
-        koot: {"score": score[0], "description": score[1]}
-        for koot, score in ashtakoot["scores"].items()
-    }
-    
-    # Cache result
-    report = CompatibilityReport(
-        profile1_id=profile1_id,
-        profile2_id=profile2_id,
-        total_score=ashtakoot["total"],
-        ashtakoot_scores=ashtakoot_scores,
-        manglik_analysis=manglik_analysis,
-        dasha_sandhi=dasha_sandhi,
-        recommendations=recommendations,
-        created_at=datetime.utcnow()
-    )
-    db.add(report)
-    db.commit()
+    report = get_or_compute_report(profile1, profile2, db)
     
     return {
         "profile1": {"id": profile1.id, "name": profile1.name},
         "profile2": {"id": profile2.id, "name": profile2.name},
-        "ashtakoot": {
-            "scores": ashtakoot_scores,
-            "total": ashtakoot["total"],
-            "max": ashtakoot["max"],
-            "percentage": round(ashtakoot["percentage"], 1),
-            "compatibility": ashtakoot["compatibility"]
-        },
-        "manglik_analysis": manglik_analysis,
-        "dasha_sandhi": dasha_sandhi,
-        "recommendations": recommendations
+        **report
     }
 
 
@@ -224,8 +165,14 @@ async def get_detailed_compatibility(
         PlanetaryPosition.natal_chart_id == natal_chart2.id
     ).all()
     
+    # Ashtakoot and Manglik come from the cached base report
+    report = get_or_compute_report(profile1, profile2, db)
+    
     # Build detailed analysis
     detailed = {
+        "ashtakoot": report["ashtakoot"],
+        "total_score": report["total_score"],
+        "manglik_analysis": report["manglik_analysis"],
         "moon_comparison": compare_moons(positions1, positions2),
         "venus_mars_analysis": analyze_venus_mars(positions1, positions2),
         "seventh_house_analysis": analyze_seventh_houses(natal_chart1, natal_chart2, positions1, positions2),
@@ -246,6 +193,239 @@ async def get_detailed_compatibility(
     return detailed
 
 
+@router.get("/{profile1_id}/{profile2_id}/synastry")
+async def get_synastry(
+    profile1_id: int,
+    profile2_id: int,
+    limit: int = 20,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get cross-chart aspects, house overlays and nakshatra relationships"""
+    profile1 = db.query(Profile).filter(
+        Profile.id == profile1_id,
+        Profile.user_id == current_user.id
+    ).first()
+    
+    profile2 = db.query(Profile).filter(
+        Profile.id == profile2_id,
+        Profile.user_id == current_user.id
+    ).first()
+    
+    if not profile1 or not profile2:
+        raise HTTPException(status_code=404, detail="One or both profiles not found")
+    
+    synastry = synastry_calculator.compare(
+        get_chart_vector(profile1, db),
+        get_chart_vector(profile2, db),
+        limit=limit
+    )
+    
+    return {
+        "profile1": {"id": profile1.id, "name": profile1.name},
+        "profile2": {"id": profile2.id, "name": profile2.name},
+        **synastry
+    }
+
+
+def get_or_compute_report(profile1: Profile, profile2: Profile, db: Session) -> dict:
+    """
+    Get the compatibility report of two profiles, with profile1 as the male chart.
+
+    Reports are stored once per unordered pair of chart hashes and engine
+    version, holding the Ashtakoot for both orientations, so (A, B) and
+    (B, A) share a row. Rows left behind by a birth data edit are removed.
+    """
+    natal_chart1 = get_or_compute_chart(profile1, db)
+    natal_chart2 = get_or_compute_chart(profile2, db)
+    
+    invalidate_stale_reports(profile1.id, natal_chart1.chart_hash, db)
+    invalidate_stale_reports(profile2.id, natal_chart2.chart_hash, db)
+    
+    swapped = natal_chart1.chart_hash > natal_chart2.chart_hash
+    first, second = (natal_chart2, natal_chart1) if swapped else (natal_chart1, natal_chart2)
+    
+    report = db.query(CompatibilityReport).filter(
+        CompatibilityReport.chart_hash1 == first.chart_hash,
+        CompatibilityReport.chart_hash2 == second.chart_hash,
+        CompatibilityReport.engine_version == COMPATIBILITY_ENGINE_VERSION
+    ).first()
+    
+    if not report:
+        chart1 = build_compatibility_chart(first, db)
+        chart2 = build_compatibility_chart(second, db)
+        
+        forward = compatibility_calculator.calculate_ashtakoot(chart1, chart2)
+        reverse = compatibility_calculator.calculate_ashtakoot(chart2, chart1)
+        
+        manglik1 = compatibility_calculator.check_manglik(chart1)
+        manglik2 = compatibility_calculator.check_manglik(chart2)
+        manglik_analysis = {
+            "profile1": manglik1,
+            "profile2": manglik2,
+            "both_manglik": manglik1["is_manglik"] and manglik2["is_manglik"],
+            "manglik_match": manglik1["is_manglik"] == manglik2["is_manglik"],
+            "recommendation": get_manglik_recommendation(manglik1, manglik2)
+        }
+        
+        report = CompatibilityReport(
+            profile1_id=first.profile_id,
+            profile2_id=second.profile_id,
+            chart_hash1=first.chart_hash,
+            chart_hash2=second.chart_hash,
+            engine_version=COMPATIBILITY_ENGINE_VERSION,
+            total_score=forward["total"],
+            ashtakoot_scores=format_ashtakoot_scores(forward),
+            reverse_ashtakoot={"scores": format_ashtakoot_scores(reverse), "total": reverse["total"]},
+            manglik_analysis=manglik_analysis,
+            dasha_sandhi=check_dasha_sandhi(profile1, profile2),
+            recommendations=generate_recommendations(
+                {"scores": format_ashtakoot_scores(forward), "total": forward["total"]}, manglik_analysis
+            ),
+            created_at=datetime.utcnow()
+        )
+        db.add(report)
+        db.commit()
+    
+    # Orient the stored report so that profile1 is the male chart
+    if swapped:
+        scores, total = report.reverse_ashtakoot["scores"], report.reverse_ashtakoot["total"]
+        manglik_analysis = {
+            **report.manglik_analysis,
+            "profile1": report.manglik_analysis["profile2"],
+            "profile2": report.manglik_analysis["profile1"]
+        }
+    else:
+        scores, total = report.ashtakoot_scores, report.total_score
+        manglik_analysis = report.manglik_analysis
+    
+    recommendations = generate_recommendations({"scores": scores, "total": total}, manglik_analysis)
+    
+    return {
+        "ashtakoot": scores,
+        "total_score": total,
+        "max_score": 36,
+        "percentage": round((total / 36) * 100, 1),
+        "compatibility": "Excellent" if total >= 25 else "Good" if total >= 18 else "Average" if total >= 12 else "Poor",
+        "manglik_analysis": manglik_analysis,
+        "dasha_sandhi": report.dasha_sandhi,
+        "recommendations": recommendations
+    }
+
+
+def invalidate_stale_reports(profile_id: int, chart_hash: str, db: Session):
+    """Delete a profile's reports computed from other birth data or an older engine"""
+    stale = db.query(CompatibilityReport).filter(
+        or_(
+            and_(
+                CompatibilityReport.profile1_id == profile_id,
+                or_(CompatibilityReport.chart_hash1.is_(None), CompatibilityReport.chart_hash1 != chart_hash)
+            ),
+            and_(
+                CompatibilityReport.profile2_id == profile_id,
+                or_(CompatibilityReport.chart_hash2.is_(None), CompatibilityReport.chart_hash2 != chart_hash)
+            ),
+            and_(
+                or_(CompatibilityReport.profile1_id == profile_id, CompatibilityReport.profile2_id == profile_id),
+                or_(
+                    CompatibilityReport.engine_version.is_(None),
+                    CompatibilityReport.engine_version != COMPATIBILITY_ENGINE_VERSION
+                )
+            )
+        )
+    )
+    
+    if stale.delete(synchronize_session=False):
+        db.commit()
+
+
+def format_ashtakoot_scores(ashtakoot: dict) -> dict:
+    """Format Ashtakoot koota scores for storage"""
+    return {
+        koot: {"score": score[0], "description": score[1]}
+        for koot, score in ashtakoot["scores"].items()
+    }
+
+
+def sync_match_index(user_id: int, db: Session) -> MatchIndex:
+    """
+    Bring a user's match index up to date. Profiles are versioned by count,
+    newest id and newest update; when that changes only profiles created or
+    updated since the last sync are reloaded, and only those with new birth
+    data are recomputed.
+    """
+    index = match_indexes.get(user_id)
+    count, max_id, max_updated = db.query(
+        func.count(Profile.id), func.max(Profile.id), func.max(Profile.updated_at)
+    ).filter(Profile.user_id == user_id).one()
+    version = (count, max_id, max_updated)
+    
+    with index.lock:
+        if index.version == version:
+            return index
+        
+        changed = db.query(Profile).filter(Profile.user_id == user_id)
+        if index.version is not None and index.version[2] is not None:
+            _, synced_id, synced_updated = index.version
+            changed = changed.filter(or_(
+                Profile.id > synced_id,
+                Profile.updated_at >= synced_updated,
+                Profile.updated_at.is_(None)
+            ))
+        
+        for profile in changed.all():
+            signature = chart_calculator.profile_chart_hash(profile)
+            row = index.row(profile.id)
+            if row is None or index.signatures[row] != signature:
+                index.upsert(profile.id, profile.name, signature, get_compatibility_chart(profile, db))
+            else:
+                index.names[row] = profile.name
+        
+        if len(index) != count:
+            current = {row[0] for row in db.query(Profile.id).filter(Profile.user_id == user_id)}
+            index.remove(set(index.profile_ids.tolist()) - current)
+        
+        index.version = version
+    
+    return index
+
+
+def get_compatibility_chart(profile: Profile, db: Session) -> dict:
+    """Get a profile's chart in the form used by the compatibility calculator"""
+    return build_compatibility_chart(get_or_compute_chart(profile, db), db)
+
+
+def build_compatibility_chart(natal_chart: NatalChart, db: Session) -> dict:
+    """Build the compatibility calculator's chart from a stored natal chart"""
+    positions = db.query(PlanetaryPosition).filter(
+        PlanetaryPosition.natal_chart_id == natal_chart.id
+    ).all()
+    
+    return {
+        "ascendant": natal_chart.ascendant,
+        "planets": {pos.planet: {
+            "rasi": pos.rasi,
+            "nakshatra": pos.nakshatra,
+            "longitude": pos.longitude,
+            "dignity": pos.dignity
+        } for pos in positions}
+    }
+
+
+def get_chart_vector(profile: Profile, db: Session):
+    """Get a profile's ascendant and planet longitudes as a synastry vector"""
+    natal_chart = get_or_compute_chart(profile, db)
+    
+    positions = db.query(PlanetaryPosition).filter(
+        PlanetaryPosition.natal_chart_id == natal_chart.id
+    ).all()
+    
+    return synastry_calculator.chart_vector(
+        natal_chart.ascendant,
+        {pos.planet: pos.longitude for pos in positions}
+    )
+
+
 def get_manglik_recommendation(manglik1: dict, manglik2: dict) -> str:
     """Generate recommendation based on Manglik status"""
     if not manglik1["is_manglik"] and not manglik2["is_manglik"]:
@@ -292,10 +472,10 @@ def generate_recommendations(ashtakoot: dict, manglik: dict) -> list:
     # Check specific koots
     scores = ashtakoot.get("scores", {})
     
-    if scores.get("nadi", (0,))[0] == 0:
+    if scores.get("nadi", {}).get("score", 0) == 0:
         recommendations.append("Nadi dosha present - health and progeny may need attention.")
     
-    if scores.get("bhakoot", (0,))[0] == 0:
+    if scores.get("bhakoot", {}).get("score", 0) == 0:
         recommendations.append("Bhakoot dosha present - financial harmony may need focus.")
     
     return recommendations
@@ -0,0 +1,93 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Optional
+from app.core.database import get_db
+from app.core.auth import get_current_user
+from app.models.user import User
+from app.models.profile import Profile
+from app.models.chart import PlanetaryPosition
+from app.api.charts import get_or_compute_chart
+from app.modules.ephemeris.calculator import ephemeris
+from app.modules.eclipses.calculator import eclipse_catalog
+
+router = APIRouter(prefix="/api/eclipses", tags=["eclipses"])
+
+
+def parse_range(start: Optional[str], end: Optional[str], default_start: float, default_years: int):
+    """Parse optional ISO dates into a Julian Day range"""
+    try:
+        jd_start = ephemeris.get_julian_day(datetime.fromisoformat(start)) if start else default_start
+        jd_end = ephemeris.get_julian_day(datetime.fromisoformat(end)) if end else jd_start + default_years * 365.25
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use ISO format.")
+    
+    if jd_end <= jd_start:
+        raise HTTPException(status_code=400, detail="End must be after start")
+    
+    return jd_start, jd_end
+
+
+@router.get("/catalog")
+async def get_eclipse_catalog(
+    start: Optional[str] = Query(None, description="ISO date, defaults to today"),
+    end: Optional[str] = Query(None, description="ISO date, defaults to start + 5 years"),
+    include_penumbral: bool = False,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get eclipses in a date range"""
+    eclipse_catalog.load(db)
+    jd_start, jd_end = parse_range(start, end, ephemeris.get_julian_day(datetime.utcnow()), 5)
+    
+    return {
+        "start": ephemeris.get_datetime(jd_start).isoformat(),
+        "end": ephemeris.get_datetime(jd_end).isoformat(),
+        "eclipses": eclipse_catalog.in_range(jd_start, jd_end, include_penumbral)
+    }
+
+
+@router.get("/{profile_id}")
+async def get_natal_eclipses(
+    profile_id: int,
+    orb: float = Query(3.0, gt=0, le=15),
+    start: Optional[str] = Query(None, description="ISO date, defaults to birth"),
+    end: Optional[str] = Query(None, description="ISO date, defaults to start + 100 years"),
+    include_penumbral: bool = False,
+    only_hits: bool = True,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get eclipses falling within orb of natal planets or the ascendant, with their houses"""
+    profile = db.query(Profile).filter(
+        Profile.id == profile_id,
+        Profile.user_id == current_user.id
+    ).first()
+    
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    
+    natal_chart = get_or_compute_chart(profile, db)
+    
+    positions = db.query(PlanetaryPosition).filter(
+        PlanetaryPosition.natal_chart_id == natal_chart.id
+    ).all()
+    
+    natal_points = {pos.planet: pos.longitude for pos in positions}
+    natal_points["ASCENDANT"] = natal_chart.ascendant
+    
+    eclipse_catalog.load(db)
+    jd_start, jd_end = parse_range(start, end, natal_chart.julian_day, 100)
+    
+    eclipses = eclipse_catalog.natal_hits(
+        natal_points, natal_chart.ascendant, orb, jd_start, jd_end,
+        include_penumbral=include_penumbral, only_hits=only_hits
+    )
+    
+    return {
+        "profile_id": profile_id,
+        "orb": orb,
+        "start": ephemeris.get_datetime(jd_start).isoformat(),
+        "end": ephemeris.get_datetime(jd_end).isoformat(),
+        "eclipses": eclipses
+    }
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.auth import get_current_user
+from app.models.user import User
+from app.models.profile import Profile
+from app.modules.charts.calculator import chart_calculator
+from app.modules.kp.calculator import kp_calculator
+
+router = APIRouter(prefix="/api/kp", tags=["kp"])
+
+
+@router.get("/{profile_id}/table")
+async def get_kp_table(
+    profile_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get sign, star, sub and sub-sub lords of planets and Placidus cusps (KP ayanamsa)"""
+    profile = db.query(Profile).filter(
+        Profile.id == profile_id,
+        Profile.user_id == current_user.id
+    ).first()
+
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    birth_datetime = chart_calculator.profile_birth_datetime(profile)
+
+    return {
+        "profile_id": profile_id,
+        **kp_calculator.calculate_table(birth_datetime, profile.latitude, profile.longitude)
+    }
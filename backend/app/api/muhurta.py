@@ -0,0 +1,115 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import List, Optional
+import pytz
+from app.core.database import get_db
+from app.core.auth import get_current_user
+from app.models.user import User
+from app.models.profile import Profile
+from app.models.chart import PlanetaryPosition
+from app.api.charts import get_or_compute_chart
+from app.modules.muhurta.calculator import (
+    muhurta_calculator, AVOIDABLE, DEFAULT_AVOID, HORA_SEQUENCE, WEEKDAY_NAMES
+)
+
+router = APIRouter(prefix="/api/muhurta", tags=["muhurta"])
+
+
+class MuhurtaSearchRequest(BaseModel):
+    start: str  # YYYY-MM-DD
+    days: int = Field(30, ge=1, le=366)
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
+    timezone: Optional[str] = None
+    profile_id: Optional[int] = None  # Natal Tara/Chandra Bala and default location
+    tithis: Optional[List[int]] = None  # 1-30
+    nakshatras: Optional[List[int]] = None  # 1-27
+    weekdays: Optional[List[str]] = None  # MONDAY ... SUNDAY
+    hora_lords: Optional[List[str]] = None
+    avoid: List[str] = DEFAULT_AVOID
+    min_duration_minutes: int = Field(30, ge=1)
+    limit: int = Field(20, ge=1, le=200)
+
+
+@router.post("/search")
+async def search_muhurta(
+    request: MuhurtaSearchRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Search ranked muhurta windows matching panchang, hora and natal constraints.
+    Rahu Kaal, Yamaganda and Gulika are avoided unless overridden.
+    """
+    try:
+        start_date = datetime.strptime(request.start, "%Y-%m-%d").date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+    latitude, longitude, timezone = request.latitude, request.longitude, request.timezone
+    natal_moon_longitude = None
+
+    if request.profile_id is not None:
+        profile = db.query(Profile).filter(
+            Profile.id == request.profile_id,
+            Profile.user_id == current_user.id
+        ).first()
+
+        if not profile:
+            raise HTTPException(status_code=404, detail="Profile not found")
+
+        natal_chart = get_or_compute_chart(profile, db)
+        moon = db.query(PlanetaryPosition).filter(
+            PlanetaryPosition.natal_chart_id == natal_chart.id,
+            PlanetaryPosition.planet == "MOON"
+        ).first()
+        natal_moon_longitude = moon.longitude if moon else None
+
+        if latitude is None or longitude is None:
+            latitude, longitude = profile.latitude, profile.longitude
+        timezone = timezone or profile.timezone
+
+    if latitude is None or longitude is None:
+        raise HTTPException(status_code=400, detail="Provide latitude and longitude or a profile_id")
+
+    timezone = timezone or "UTC"
+    if timezone not in pytz.all_timezones_set:
+        raise HTTPException(status_code=400, detail="Unknown timezone")
+
+    invalid = [p for p in request.avoid if p not in AVOIDABLE]
+    invalid += [d for d in request.weekdays or [] if d.upper() not in WEEKDAY_NAMES]
+    invalid += [l for l in request.hora_lords or [] if l.upper() not in HORA_SEQUENCE]
+    invalid += [t for t in request.tithis or [] if not 1 <= t <= 30]
+    invalid += [n for n in request.nakshatras or [] if not 1 <= n <= 27]
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"Invalid constraint values: {invalid}")
+
+    weekdays = None
+    if request.weekdays is not None:
+        weekdays = [WEEKDAY_NAMES.index(d.upper()) for d in request.weekdays]
+
+    try:
+        windows = muhurta_calculator.search(
+            start_date, request.days, latitude, longitude, timezone,
+            tithis=request.tithis,
+            nakshatras=request.nakshatras,
+            weekdays=weekdays,
+            hora_lords=request.hora_lords,
+            avoid=request.avoid,
+            natal_moon_longitude=natal_moon_longitude,
+            min_duration_minutes=request.min_duration_minutes,
+            limit=request.limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "start_date": request.start,
+        "days": request.days,
+        "latitude": latitude,
+        "longitude": longitude,
+        "timezone": timezone,
+        "windows": windows
+    }
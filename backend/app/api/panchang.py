@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import datetime
+import pytz
+from app.core.auth import get_current_user
+from app.models.user import User
+from app.modules.panchang.calculator import panchang_calculator
+
+router = APIRouter(prefix="/api/panchang", tags=["panchang"])
+
+
+@router.get("/range")
+async def get_panchang_range(
+    start: str = Query(..., description="Start date in YYYY-MM-DD format"),
+    days: int = Query(30, ge=1, le=366, description="Number of days"),
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    timezone: str = Query("UTC", description="IANA timezone name"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get panchang (vara, tithi, nakshatra, yoga, karana at sunrise, with end times)
+    for a range of dates at a location.
+
+    Returns columns of parallel arrays; limb columns hold 0-based indices into names.
+    """
+    try:
+        start_date = datetime.strptime(start, "%Y-%m-%d").date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+    if timezone not in pytz.all_timezones_set:
+        raise HTTPException(status_code=400, detail="Unknown timezone")
+
+    try:
+        days_data = panchang_calculator.calculate_range(start_date, days, latitude, longitude, timezone)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "start_date": start,
+        "days": days,
+        "latitude": latitude,
+        "longitude": longitude,
+        "timezone": timezone,
+        **panchang_calculator.to_columns(days_data)
+    }
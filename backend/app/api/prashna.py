@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import datetime
+from typing import Optional
+from app.core.auth import get_current_user
+from app.models.user import User
+from app.modules.prashna.calculator import prashna_calculator
+
+router = APIRouter(prefix="/api/prashna", tags=["prashna"])
+
+
+@router.get("/chart")
+async def get_prashna_chart(
+    latitude: float = Query(..., ge=-90, le=90),
+    longitude: float = Query(..., ge=-180, le=180),
+    ayanamsa: str = Query("LAHIRI"),
+    moment: Optional[str] = Query(None, description="ISO datetime, UTC unless an offset is given; defaults to now"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the Prashna chart for a moment at a location.
+
+    Charts are cached per UTC minute and location cell and never stored
+    in the database.
+    """
+    try:
+        when = datetime.fromisoformat(moment) if moment else datetime.utcnow()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid datetime format. Use ISO 8601")
+
+    try:
+        return prashna_calculator.calculate(when, latitude, longitude, ayanamsa.upper())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
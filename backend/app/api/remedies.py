@@ -9,7 +9,7 @@ from app.models.profile import Profile
 from app.models.remedy import Remedy
 from app.api.charts import get_or_compute_chart
 from app.modules.remedies.calculator import remedies_calculator
-from app.modules.strength.calculator import strength_calculator
+from app.modules.strength.store import strength_store
 from app.models.chart import PlanetaryPosition
 
 router = APIRouter(prefix="/api/remedies", tags=["remedies"])
@@ -46,7 +46,7 @@ async def get_remedies(
     } for pos in positions}
     
     # Calculate Shadbala for weakness analysis
-    shadbala = strength_calculator.calculate_shadbala(planets, natal_chart.julian_day)
+    shadbala = strength_store.get(db, natal_chart)["shadbala"]
     
     # Generate all remedies
     all_remedies = remedies_calculator.generate_all_remedies(planets, shadbala)
@@ -96,18 +96,7 @@ async def get_quick_remedies(
     
     natal_chart = get_or_compute_chart(profile, db)
     
-    positions = db.query(PlanetaryPosition).filter(
-        PlanetaryPosition.natal_chart_id == natal_chart.id
-    ).all()
-    
-    planets = {pos.planet: {
-        "longitude": pos.longitude,
-        "rasi": pos.rasi,
-        "is_retrograde": bool(pos.is_retrograde),
-        "dignity": pos.dignity
-    } for pos in positions}
-    
-    shadbala = strength_calculator.calculate_shadbala(planets, natal_chart.julian_day)
+    shadbala = strength_store.get(db, natal_chart)["shadbala"]
     weak_planets = remedies_calculator.get_weak_planets(shadbala)
     
     quick_remedies = {}
@@ -138,18 +127,6 @@ async def get_gemstone_recommendations(
     
     natal_chart = get_or_compute_chart(profile, db)
     
-    positions = db.query(PlanetaryPosition).filter(
-        PlanetaryPosition.natal_chart_id == natal_chart.id
-    ).all()
-    
-    planets = {pos.planet: {
-        "longitude": pos.longitude,
-        "rasi": pos.rasi,
-        "dignity": pos.dignity
-    } for pos in positions}
-    
-    shadbala = strength_calculator.calculate_shadbala(planets, natal_chart.julian_day)
-    
     # Find ascendant lord
     asc_rasi = int(natal_chart.ascendant / 30.0) + 1
     lords = {
@@ -210,17 +187,7 @@ async def get_mantra_recommendations(
     
     natal_chart = get_or_compute_chart(profile, db)
     
-    positions = db.query(PlanetaryPosition).filter(
-        PlanetaryPosition.natal_chart_id == natal_chart.id
-    ).all()
-    
-    planets = {pos.planet: {
-        "longitude": pos.longitude,
-        "rasi": pos.rasi,
-        "dignity": pos.dignity
-    } for pos in positions}
-    
-    shadbala = strength_calculator.calculate_shadbala(planets, natal_chart.julian_day)
+    shadbala = strength_store.get(db, natal_chart)["shadbala"]
     weak_planets = remedies_calculator.get_weak_planets(shadbala)
     
     mantras = {}
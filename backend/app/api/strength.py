@@ -5,11 +5,64 @@ from app.core.auth import get_current_user
 from app.models.user import User
 from app.models.profile import Profile
 from app.api.charts import get_or_compute_chart
-from app.modules.strength.calculator import strength_calculator
+from app.modules.strength.calculator import strength_calculator, SHADBALA_PLANETS
+from app.modules.strength.store import strength_store
 from app.models.chart import PlanetaryPosition
 
 router = APIRouter(prefix="/api/strength", tags=["strength"])
 
+# Batch fields returned per [profile x planet]
+BATCH_FIELDS = [
+    "sthana_bala", "dig_bala", "kala_bala", "chesta_bala", "naisargika_bala", "drik_bala",
+    "total_shashtiamsas", "total_rupas", "strength_ratio", "is_strong"
+]
+
+@router.get("/batch")
+async def get_strength_batch(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get Shadbala and Bhavabala for all of the user's profiles at once, as
+    [profile x planet] and [profile x house] matrices (None where a planet
+    is missing)
+    """
+    profiles = db.query(Profile).filter(
+        Profile.user_id == current_user.id
+    ).order_by(Profile.id).all()
+    
+    charts = [get_or_compute_chart(profile, db) for profile in profiles]
+    
+    planets_by_chart = {chart.id: {} for chart in charts}
+    positions = db.query(PlanetaryPosition).filter(
+        PlanetaryPosition.natal_chart_id.in_(list(planets_by_chart))
+    ).all()
+    for pos in positions:
+        planets_by_chart[pos.natal_chart_id][pos.planet] = {
+            "longitude": pos.longitude,
+            "rasi": pos.rasi,
+            "is_retrograde": bool(pos.is_retrograde),
+            "dignity": pos.dignity
+        }
+    
+    arrays = strength_calculator.planet_arrays([planets_by_chart[chart.id] for chart in charts])
+    shadbala = strength_calculator.calculate_shadbala_batch(arrays)
+    present = shadbala["present"]
+    
+    return {
+        "planets": SHADBALA_PLANETS,
+        "profile_ids": [profile.id for profile in profiles],
+        "natal_chart_ids": [chart.id for chart in charts],
+        "shadbala": {
+            field: [
+                [value if ok else None for value, ok in zip(row, mask)]
+                for row, mask in zip(shadbala[field].tolist(), present.tolist())
+            ]
+            for field in BATCH_FIELDS
+        },
+        "bhavabala": strength_calculator.calculate_bhavabala_batch(len(charts)).tolist()
+    }
+
 @router.get("/{profile_id}/shadbala")
 async def get_shadbala(
     profile_id: int,
@@ -27,18 +80,7 @@ async def get_shadbala(
     
     natal_chart = get_or_compute_chart(profile, db)
     
-    positions = db.query(PlanetaryPosition).filter(
-        PlanetaryPosition.natal_chart_id == natal_chart.id
-    ).all()
-    
-    planets = {pos.planet: {
-        "longitude": pos.longitude,
-        "rasi": pos.rasi,
-        "is_retrograde": bool(pos.is_retrograde),
-        "dignity": pos.dignity
-    } for pos in positions}
-    
-    shadbala = strength_calculator.calculate_shadbala(planets, natal_chart.julian_day)
+    shadbala = strength_store.get(db, natal_chart)["shadbala"]
     
     return {"shadbala": shadbala}
 
@@ -59,7 +101,7 @@ async def get_bhavabala(
     
     natal_chart = get_or_compute_chart(profile, db)
     
-    bhavabala = strength_calculator.calculate_bhavabala(natal_chart.house_cusps)
+    bhavabala = strength_store.get(db, natal_chart)["bhavabala"]
     
     return {"bhavabala": bhavabala}
 
@@ -80,14 +122,7 @@ async def get_vargabala(
     
     natal_chart = get_or_compute_chart(profile, db)
     
-    from app.models.chart import DivisionalChart
-    divisional_charts = db.query(DivisionalChart).filter(
-        DivisionalChart.natal_chart_id == natal_chart.id
-    ).all()
-    
-    div_data = {dc.division: dc.planetary_positions for dc in divisional_charts}
-    
-    vargabala = strength_calculator.calculate_vargabala(div_data)
+    vargabala = strength_store.get(db, natal_chart)["vargabala"]
     
     return {"vargabala": vargabala}
 
@@ -108,16 +143,7 @@ async def get_ishtakashta(
     
     natal_chart = get_or_compute_chart(profile, db)
     
-    positions = db.query(PlanetaryPosition).filter(
-        PlanetaryPosition.natal_chart_id == natal_chart.id
-    ).all()
-    
-    planets = {pos.planet: {
-        "longitude": pos.longitude,
-        "dignity": pos.dignity
-    } for pos in positions}
-    
-    ishtakashta = strength_calculator.calculate_ishtakashta(planets)
+    ishtakashta = strength_store.get(db, natal_chart)["ishtakashta"]
     
     return {"ishtakashta": ishtakashta}
 
@@ -138,19 +164,7 @@ async def get_avasthas(
     
     natal_chart = get_or_compute_chart(profile, db)
     
-    positions = db.query(PlanetaryPosition).filter(
-        PlanetaryPosition.natal_chart_id == natal_chart.id
-    ).all()
-    
-    planets = {pos.planet: {
-        "longitude": pos.longitude,
-        "rasi": pos.rasi,
-        "dignity": pos.dignity,
-        "is_retrograde": bool(pos.is_retrograde),
-        "is_combust": bool(pos.is_combust)
-    } for pos in positions}
-    
-    avasthas = strength_calculator.calculate_avasthas(planets)
+    avasthas = strength_store.get(db, natal_chart)["avasthas"]
     
     return {"avasthas": avasthas}
 
@@ -171,21 +185,10 @@ async def get_strength_summary(
     
     natal_chart = get_or_compute_chart(profile, db)
     
-    positions = db.query(PlanetaryPosition).filter(
-        PlanetaryPosition.natal_chart_id == natal_chart.id
-    ).all()
-    
-    planets = {pos.planet: {
-        "longitude": pos.longitude,
-        "rasi": pos.rasi,
-        "is_retrograde": bool(pos.is_retrograde),
-        "dignity": pos.dignity,
-        "is_combust": bool(pos.is_combust)
-    } for pos in positions}
-    
-    shadbala = strength_calculator.calculate_shadbala(planets, natal_chart.julian_day)
-    ishtakashta = strength_calculator.calculate_ishtakashta(planets)
-    avasthas = strength_calculator.calculate_avasthas(planets)
+    strengths = strength_store.get(db, natal_chart)
+    shadbala = strengths["shadbala"]
+    ishtakashta = strengths["ishtakashta"]
+    avasthas = strengths["avasthas"]
     
     # Determine strongest/weakest planets
     planet_strengths = [(p, data["total"]) for p, data in shadbala.items()]
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
+from pydantic import BaseModel, Field
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import List, Optional
 
 from app.core.database import get_db
 from app.core.auth import get_current_user
@@ -9,11 +10,30 @@ from app.models.user import User
 from app.models.profile import Profile
 from app.models.chart import PlanetaryPosition
 from app.modules.ephemeris.calculator import ephemeris
+from app.modules.transits.calculator import transit_calculator
+from app.modules.transits.ingress import INGRESS_STEPS
+from app.modules.transits.heatmap import transit_heatmap, MAX_HEATMAP_MONTHS
+from app.modules.yoga.rulesets import yoga_rule_sets
+from app.modules.yoga.transits import transit_yoga_engine, DEFAULT_TRANSIT_PLANETS
 from app.api.charts import get_or_compute_chart
 from app.api.dashas import get_current_dasha, get_or_compute_dashas
 
 router = APIRouter(prefix="/api/transits", tags=["transits"])
 
+
+class ContactSpec(BaseModel):
+    transit_planet: str
+    natal_point: str  # Natal planet or ASCENDANT
+    orb: float = Field(..., gt=0, le=30)
+
+
+class ContactSearchRequest(BaseModel):
+    contacts: List[ContactSpec] = Field(..., min_length=1, max_length=50)
+    start: Optional[str] = None  # ISO date, defaults to birth
+    end: Optional[str] = None  # ISO date, defaults to start + years
+    years: int = Field(100, ge=1, le=150)
+
+
 @router.get("/today/{profile_id}")
 async def get_today_transits(
     profile_id: int,
@@ -144,6 +164,215 @@ async def get_transits_range(
         "transits": transits
     }
 
+@router.get("/sade-sati/{profile_id}/timeline")
+async def get_sade_sati_timeline(
+    profile_id: int,
+    years: int = Query(100, ge=1, le=150, description="Years from birth"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get lifetime Sade Sati and Dhaiya/Kantaka periods from exact Saturn ingresses"""
+    profile = db.query(Profile).filter(
+        Profile.id == profile_id,
+        Profile.user_id == current_user.id
+    ).first()
+    
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    
+    natal_chart = get_or_compute_chart(profile, db)
+    
+    natal_moon = db.query(PlanetaryPosition).filter(
+        PlanetaryPosition.natal_chart_id == natal_chart.id,
+        PlanetaryPosition.planet == "MOON"
+    ).first()
+    
+    jd_start = natal_chart.julian_day
+    jd_end = jd_start + years * 365.25
+    
+    try:
+        timeline = transit_calculator.saturn_moon_timeline(natal_moon.rasi, jd_start, jd_end)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "profile_id": profile_id,
+        "natal_moon_rasi": natal_moon.rasi,
+        "years": years,
+        **timeline
+    }
+
+@router.post("/contacts/{profile_id}")
+async def find_transit_contacts(
+    profile_id: int,
+    request: ContactSearchRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Find all periods when transiting planets are within orb of natal points,
+    with orb entry, exact hits and orb exit
+    """
+    profile = db.query(Profile).filter(
+        Profile.id == profile_id,
+        Profile.user_id == current_user.id
+    ).first()
+    
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    
+    natal_chart = get_or_compute_chart(profile, db)
+    
+    positions = db.query(PlanetaryPosition).filter(
+        PlanetaryPosition.natal_chart_id == natal_chart.id
+    ).all()
+    
+    natal_points = {pos.planet: pos.longitude for pos in positions}
+    natal_points["ASCENDANT"] = natal_chart.ascendant
+    
+    for spec in request.contacts:
+        if spec.transit_planet.upper() not in INGRESS_STEPS:
+            raise HTTPException(status_code=400, detail=f"Unknown transit planet: {spec.transit_planet}")
+        if spec.natal_point.upper() not in natal_points:
+            raise HTTPException(status_code=400, detail=f"Unknown natal point: {spec.natal_point}")
+    
+    try:
+        jd_start = ephemeris.get_julian_day(datetime.fromisoformat(request.start)) if request.start else natal_chart.julian_day
+        jd_end = ephemeris.get_julian_day(datetime.fromisoformat(request.end)) if request.end else jd_start + request.years * 365.25
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use ISO format.")
+    
+    if jd_end <= jd_start:
+        raise HTTPException(status_code=400, detail="End must be after start")
+    
+    results = transit_calculator.find_contacts(
+        [spec.dict() for spec in request.contacts], natal_points, jd_start, jd_end
+    )
+    
+    return {
+        "profile_id": profile_id,
+        "start": ephemeris.get_datetime(jd_start).isoformat(),
+        "end": ephemeris.get_datetime(jd_end).isoformat(),
+        "results": results
+    }
+
+@router.get("/yogas/{profile_id}")
+async def get_transit_yogas(
+    profile_id: int,
+    start: Optional[str] = Query(None, description="ISO date, defaults to today"),
+    end: Optional[str] = Query(None, description="ISO date, defaults to start + years"),
+    years: int = Query(1, ge=1, le=50),
+    planets: Optional[str] = Query(None, description="Comma-separated transit planets"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Find the windows in which transiting planets form yogas with the natal
+    chart, e.g. Gaja Kesari from transit Jupiter to the natal Moon
+    """
+    profile = db.query(Profile).filter(
+        Profile.id == profile_id,
+        Profile.user_id == current_user.id
+    ).first()
+    
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    
+    transit_planets = [p.strip().upper() for p in planets.split(",")] if planets else DEFAULT_TRANSIT_PLANETS
+    for planet in transit_planets:
+        if planet not in INGRESS_STEPS:
+            raise HTTPException(status_code=400, detail=f"Unknown transit planet: {planet}")
+    
+    try:
+        start_dt = datetime.fromisoformat(start) if start else datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        jd_start = ephemeris.get_julian_day(start_dt)
+        jd_end = ephemeris.get_julian_day(datetime.fromisoformat(end)) if end else jd_start + years * 365.25
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use ISO format.")
+    
+    if jd_end <= jd_start:
+        raise HTTPException(status_code=400, detail="End must be after start")
+    if jd_end - jd_start > 50 * 365.25:
+        raise HTTPException(status_code=400, detail="Range must not exceed 50 years")
+    
+    natal_chart = get_or_compute_chart(profile, db)
+    
+    positions = db.query(PlanetaryPosition).filter(
+        PlanetaryPosition.natal_chart_id == natal_chart.id
+    ).all()
+    
+    natal_planets = {pos.planet: {
+        "rasi": pos.rasi,
+        "longitude": pos.longitude,
+        "dignity": pos.dignity
+    } for pos in positions}
+    
+    yoga_rule_sets.sync(db)
+    try:
+        windows = transit_yoga_engine.find_windows(
+            natal_planets, natal_chart.ascendant, jd_start, jd_end, transit_planets
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "profile_id": profile_id,
+        "start": ephemeris.get_datetime(jd_start).isoformat(),
+        "end": ephemeris.get_datetime(jd_end).isoformat(),
+        "transit_planets": transit_planets,
+        "windows": windows,
+        "count": len(windows)
+    }
+
+@router.get("/{profile_id}/heatmap")
+async def get_transit_heatmap(
+    profile_id: int,
+    start: Optional[str] = Query(None, description="ISO date; its month is the first column, defaults to this month"),
+    years: int = Query(5, ge=1, le=30),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get a monthly favourability matrix: SAV of the signs transited by Saturn
+    and Jupiter, dasha lords, Sade Sati and a combined score
+    """
+    profile = db.query(Profile).filter(
+        Profile.id == profile_id,
+        Profile.user_id == current_user.id
+    ).first()
+    
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    
+    try:
+        start_date = datetime.fromisoformat(start).date() if start else datetime.utcnow().date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use ISO format.")
+    
+    months = min(years * 12, MAX_HEATMAP_MONTHS)
+    natal_chart = get_or_compute_chart(profile, db)
+    
+    heatmap = transit_heatmap.get(natal_chart.chart_hash, start_date, months)
+    if heatmap is None:
+        positions = db.query(PlanetaryPosition).filter(
+            PlanetaryPosition.natal_chart_id == natal_chart.id
+        ).all()
+        
+        natal_positions = {pos.planet: {"rasi": pos.rasi, "longitude": pos.longitude} for pos in positions}
+        natal_positions["ASCENDANT"] = {"rasi": int(natal_chart.ascendant / 30.0) + 1, "longitude": natal_chart.ascendant}
+        
+        dashas = get_or_compute_dashas(natal_chart, profile, "VIMSHOTTARI", db)
+        try:
+            heatmap = transit_heatmap.build(natal_chart.chart_hash, natal_positions, dashas, start_date, months)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "profile_id": profile_id,
+        "months": months,
+        **heatmap
+    }
+
 def check_sade_sati(saturn_rasi: int, moon_rasi: int) -> dict:
     """Check Sade Sati phase"""
     diff = (saturn_rasi - moon_rasi) % 12
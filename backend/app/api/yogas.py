@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.core.database import get_db
@@ -7,14 +7,80 @@ from app.models.user import User
 from app.models.profile import Profile
 from app.api.charts import get_or_compute_chart
 from app.modules.yoga.detector import yoga_detector
-from app.models.chart import PlanetaryPosition
+from app.modules.yoga.compiler import YogaRuleError
+from app.modules.yoga.index import yoga_index
+from app.modules.yoga.rulesets import yoga_rule_sets
+from app.models.chart import NatalChart
+from app.models.yoga import Yoga
 
 router = APIRouter(prefix="/api/yogas", tags=["yogas"])
 
+def get_chart_yogas(natal_chart: NatalChart, db: Session) -> List[dict]:
+    """Materialized yogas of a chart, indexing it first if needed"""
+    yoga_index.ensure_indexed(db, [natal_chart])
+    
+    rows = db.query(Yoga).filter(Yoga.natal_chart_id == natal_chart.id).order_by(Yoga.id).all()
+    
+    # Rows of recomputed rules are appended; keep rule file order
+    order = {name: i for i, name in enumerate(yoga_detector.rule_set.names)}
+    rows.sort(key=lambda row: order.get(row.yoga_name, len(order)))
+    
+    return [{
+        "name": row.yoga_name,
+        "type": row.yoga_type,
+        "description": row.description,
+        "strength": row.strength,
+        "forming_planets": row.forming_planets,
+        "rule_reference": row.rule_reference
+    } for row in rows]
+
+@router.get("/search")
+async def search_yogas(
+    yoga: List[str] = Query(..., description="Yoga name, repeatable"),
+    match: str = "all",
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Find the current user's profiles having all (AND) or any (OR) of the given yogas"""
+    if match not in ("all", "any"):
+        raise HTTPException(status_code=400, detail="match must be 'all' or 'any'")
+    
+    profiles = db.query(Profile).filter(Profile.user_id == current_user.id).all()
+    
+    # Charts are computed on first use; compute any this user has not opened yet
+    charted = {profile.id for profile, _ in yoga_index.profile_charts(db, profiles)}
+    for profile in profiles:
+        if profile.id not in charted:
+            get_or_compute_chart(profile, db)
+    
+    results = yoga_index.search(db, profiles, yoga, match_all=match == "all")
+    
+    return {
+        "yogas": yoga,
+        "match": match,
+        "profiles": results,
+        "count": len(results)
+    }
+
+@router.get("/rules")
+async def get_yoga_rules(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get all yoga rules (admin)"""
+    version = yoga_rule_sets.sync(db)
+    return {
+        "version": version,
+        "rules": yoga_detector.rules,
+        "count": len(yoga_detector.rules)
+    }
+
 @router.get("/{profile_id}")
 async def get_yogas(
     profile_id: int,
     category: Optional[str] = None,
+    planet: Optional[List[str]] = Query(None, description="Only yogas whose rules reference this planet, repeatable"),
+    house: Optional[List[int]] = Query(None, description="Only yogas whose rules reference this house, repeatable"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -29,25 +95,20 @@ async def get_yogas(
     
     natal_chart = get_or_compute_chart(profile, db)
     
-    # Get planetary positions
-    positions = db.query(PlanetaryPosition).filter(
-        PlanetaryPosition.natal_chart_id == natal_chart.id
-    ).all()
-    
-    planets = {pos.planet: {
-        "rasi": pos.rasi,
-        "longitude": pos.longitude,
-        "dignity": pos.dignity,
-        "is_retrograde": bool(pos.is_retrograde)
-    } for pos in positions}
-    
-    # Detect yogas
-    yogas = yoga_detector.detect_yogas(planets, natal_chart.ascendant)
+    yogas = get_chart_yogas(natal_chart, db)
     
     # Filter by category if provided
     if category:
         yogas = [y for y in yogas if y["type"] == category]
     
+    # Filter through the rule set's planet and house indexes
+    if planet or house:
+        names = {
+            compiled.name
+            for compiled in yoga_detector.rule_set.select([p.upper() for p in planet or []], house)
+        }
+        yogas = [y for y in yogas if y["name"] in names]
+    
     return {
         "yogas": yogas,
         "count": len(yogas),
@@ -71,18 +132,7 @@ async def get_yoga_categories(
     
     natal_chart = get_or_compute_chart(profile, db)
     
-    positions = db.query(PlanetaryPosition).filter(
-        PlanetaryPosition.natal_chart_id == natal_chart.id
-    ).all()
-    
-    planets = {pos.planet: {
-        "rasi": pos.rasi,
-        "longitude": pos.longitude,
-        "dignity": pos.dignity,
-        "is_retrograde": bool(pos.is_retrograde)
-    } for pos in positions}
-    
-    yogas = yoga_detector.detect_yogas(planets, natal_chart.ascendant)
+    yogas = get_chart_yogas(natal_chart, db)
     
     # Group by category
     categories = {}
@@ -95,19 +145,40 @@ async def get_yoga_categories(
     
     return {"categories": categories}
 
-@router.get("/rules")
-async def get_yoga_rules(current_user: User = Depends(get_current_user)):
-    """Get all yoga rules (admin)"""
-    return {
-        "rules": yoga_detector.rules,
-        "count": len(yoga_detector.rules)
-    }
-
 @router.post("/rules/reload")
-async def reload_yoga_rules(current_user: User = Depends(get_current_user)):
-    """Reload yoga rules from file (admin)"""
-    yoga_detector.rules = yoga_detector.load_rules()
+async def reload_yoga_rules(
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Reload yoga rules from file and publish them as the active version for
+    all workers (admin). Yogas of changed rules are recomputed in the
+    background.
+    """
+    yoga_rule_sets.sync(db)
+    old_rules, old_version = yoga_detector.rules, yoga_detector.version
+    try:
+        rules_loaded = yoga_detector.reload()
+    except YogaRuleError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    changes = yoga_index.diff_rules(old_rules, yoga_detector.rules)
+    if yoga_detector.version == old_version:
+        return {
+            "status": "unchanged",
+            "version": old_version,
+            "rules_loaded": rules_loaded,
+            "changes": changes
+        }
+    
+    yoga_rule_sets.publish(db, yoga_detector.rules)
+    background_tasks.add_task(yoga_index.refresh_in_background, old_rules, yoga_detector.rules)
+    
     return {
         "status": "success",
-        "rules_loaded": len(yoga_detector.rules)
+        "version": yoga_detector.version,
+        "previous_version": old_version,
+        "rules_loaded": rules_loaded,
+        "changes": changes
     }
@@ -5,8 +5,9 @@ from sqlalchemy.orm import Session
 from datetime import datetime
 from typing import List
 import os
+import threading
 
-from app.core.database import get_db, engine
+from app.core.database import get_db, engine, SessionLocal
 from app.core.auth import (
     verify_password, get_password_hash, create_access_token,
     create_refresh_token, get_current_user
@@ -14,6 +15,8 @@ from app.core.auth import (
 from app.models.user import User
 from app.models.profile import Profile
 from app.models import Base
+from app.modules.yoga.rulesets import yoga_rule_sets
+from app.modules.strength.store import strength_store
 
 # Import routers
 from app.api import charts, dashas, transits, export as export_router
@@ -21,6 +24,7 @@ from app.api import ashtakavarga, yogas, strength, varshaphala, compatibility, r
 from app.api import align27
 from app.api import kb, chat, ml  # Batch 5
 from app.api import dashboard  # Batch 6
+from app.api import panchang, muhurta, eclipses, prashna, kp
 
 app = FastAPI(
     title="AstroOS API",
@@ -61,10 +65,27 @@ app.include_router(ml.router)
 # Include routers - Batch 6
 app.include_router(dashboard.router)
 
+# Include routers - Panchang
+app.include_router(panchang.router)
+app.include_router(muhurta.router)
+app.include_router(eclipses.router)
+app.include_router(prashna.router)
+app.include_router(kp.router)
+
 @app.on_event("startup")
 async def startup():
     """Create tables on startup if they don't exist"""
     Base.metadata.create_all(bind=engine)
+    
+    # Run the active yoga rule set, shared by all workers
+    db = SessionLocal()
+    try:
+        yoga_rule_sets.sync(db)
+    finally:
+        db.close()
+    
+    # Recompute strengths stored by an older engine version
+    threading.Thread(target=strength_store.refresh_in_background, daemon=True).start()
 
 @app.get("/api/health")
 async def health_check():
@@ -3,7 +3,7 @@ from app.models.user import User
 from app.models.profile import Profile
 from app.models.chart import NatalChart, PlanetaryPosition, DivisionalChart
 from app.models.dasha import Dasha
-from app.models.yoga import Yoga
+from app.models.yoga import Yoga, YogaRuleSet
 from app.models.ashtakavarga import AshtakavargaTable
 from app.models.strength import Strength
 from app.models.transit import Transit
@@ -15,15 +15,17 @@ from app.models.kb import KBSource, KBChunk, KBEmbedding
 from app.models.chat import ChatSession, ChatMessage
 from app.models.ml import MLTrainingExample, MLModel
 from app.models.dashboard import DashboardWidget, UserDashboardLayout, DashboardInsightCache
+from app.models.eclipse import Eclipse
 
 __all__ = [
     "Base",
     "User", "Profile", "NatalChart", "PlanetaryPosition", "DivisionalChart",
-    "Dasha", "Yoga", "AshtakavargaTable", "Strength", "Transit",
+    "Dasha", "Yoga", "YogaRuleSet", "AshtakavargaTable", "Strength", "Transit",
     "VarshaphalaRecord", "CompatibilityReport", "Remedy",
     "DayScore", "Moment", "RitualRecommendation",
     "KBSource", "KBChunk", "KBEmbedding",
     "ChatSession", "ChatMessage",
     "MLTrainingExample", "MLModel",
-    "DashboardWidget", "UserDashboardLayout", "DashboardInsightCache"
+    "DashboardWidget", "UserDashboardLayout", "DashboardInsightCache",
+    "Eclipse"
 ]
@@ -15,6 +15,10 @@ class NatalChart(Base):
     ascendant = Column(Float)
     mc = Column(Float)
     house_cusps = Column(JSON)  # List of 12 house cusps
+    sensitivity = Column(JSON)  # Minutes of birth-time error to each boundary
+    yogas_indexed_at = Column(DateTime)  # When Yoga rows were last materialized
+    yoga_rule_set = Column(String(64))  # Content hash of the rule set they were materialized with
+    strength_engine_version = Column(String(32))  # Engine version of the stored Strength rows
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
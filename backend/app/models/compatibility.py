@@ -7,8 +7,12 @@ class CompatibilityReport(Base):
     id = Column(Integer, primary_key=True, index=True)
     profile1_id = Column(Integer, ForeignKey("profiles.id"), nullable=False)
     profile2_id = Column(Integer, ForeignKey("profiles.id"), nullable=False)
+    chart_hash1 = Column(String(64), index=True)  # Ordered pair: chart_hash1 <= chart_hash2
+    chart_hash2 = Column(String(64), index=True)
+    engine_version = Column(String(20))
     total_score = Column(Float)
     ashtakoot_scores = Column(JSON)  # Varna, Vashya, Tara, Yoni, etc.
+    reverse_ashtakoot = Column(JSON)  # Scores and total with chart 2 as the male chart
     manglik_analysis = Column(JSON)  # Manglik status and cancellations
     dasha_sandhi = Column(JSON)  # Changed to JSON for dict storage
     recommendations = Column(JSON)  # Changed to JSON for list storage
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, Float, DateTime
+from app.core.database import Base
+
+class Eclipse(Base):
+    __tablename__ = "eclipses"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    eclipse_type = Column(String(10), nullable=False)  # SOLAR, LUNAR
+    subtype = Column(String(20), nullable=False)  # TOTAL, ANNULAR, HYBRID, PARTIAL, PENUMBRAL
+    julian_day = Column(Float, nullable=False, index=True)  # Instant of maximum eclipse (UT)
+    eclipse_time = Column(DateTime, nullable=False)
+    longitude = Column(Float, nullable=False)  # Sidereal longitude of the eclipsed body
+    rasi = Column(Integer, nullable=False)
+    nakshatra = Column(String(50))
+    nakshatra_pada = Column(Integer)
@@ -6,12 +6,13 @@ class Strength(Base):
     __tablename__ = "strengths"
     
     id = Column(Integer, primary_key=True, index=True)
-    natal_chart_id = Column(Integer, ForeignKey("natal_charts.id"), nullable=False)
+    natal_chart_id = Column(Integer, ForeignKey("natal_charts.id"), nullable=False, index=True)
     strength_type = Column(String(50))  # Shadbala, Bhavabala, Vargabala, etc.
     planet = Column(String(50), nullable=True)  # For planet-specific strengths
     house = Column(Integer, nullable=True)  # For house-specific strengths
     value = Column(Float)
     components = Column(JSON)  # Breakdown of strength components
+    engine_version = Column(String(32))  # Strength engine version that computed it
     
     # Relationships
     natal_chart = relationship("NatalChart", back_populates="strengths")
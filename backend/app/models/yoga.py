@@ -1,13 +1,14 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, JSON, DateTime
 from sqlalchemy.orm import relationship
+from datetime import datetime
 from app.core.database import Base
 
 class Yoga(Base):
     __tablename__ = "yogas"
     
     id = Column(Integer, primary_key=True, index=True)
-    natal_chart_id = Column(Integer, ForeignKey("natal_charts.id"), nullable=False)
-    yoga_name = Column(String(255), nullable=False)
+    natal_chart_id = Column(Integer, ForeignKey("natal_charts.id"), nullable=False, index=True)
+    yoga_name = Column(String(255), nullable=False, index=True)
     yoga_type = Column(String(100))  # Raja, Dhana, Arishta, etc.
     description = Column(Text)
     strength = Column(Integer)  # 1-10 scale
@@ -16,3 +17,13 @@ class Yoga(Base):
     
     # Relationships
     natal_chart = relationship("NatalChart", back_populates="yogas")
+
+class YogaRuleSet(Base):
+    __tablename__ = "yoga_rule_sets"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    content_hash = Column(String(64), unique=True, index=True, nullable=False)  # SHA-256 of the rules
+    rules = Column(JSON, nullable=False)
+    rule_count = Column(Integer)
+    is_active = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
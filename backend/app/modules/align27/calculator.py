@@ -2,6 +2,13 @@ from typing import Dict, List, Tuple
 from datetime import datetime, date, time, timedelta
 import hashlib
 import json
+import numpy as np
+
+from app.modules.ephemeris.tithi import get_tithi
+
+# Lowest day scores shown as GREEN and AMBER; anything lower is RED
+GREEN_THRESHOLD = 65
+AMBER_THRESHOLD = 40
 
 class Align27Calculator:
     """
@@ -111,17 +118,9 @@ class Align27Calculator:
         # Clamp score to 0-100
         score = max(0, min(100, score))
         
-        # Determine traffic light color
-        if score >= 65:
-            color = "GREEN"
-        elif score >= 40:
-            color = "AMBER"
-        else:
-            color = "RED"
-        
         return {
             "score": round(score, 1),
-            "color": color,
+            "color": self._score_to_color(score),
             "reasons": reasons[:5],  # Top 5 reasons
             "key_transits": key_transits,
             "dasha_overlay": current_dasha
@@ -199,21 +198,19 @@ class Align27Calculator:
         return 0.0
     
     def _calculate_moon_phase_score(self, target_date: date) -> float:
-        """Calculate score based on lunar phase (simplified)"""
-        # Use a deterministic calculation based on date
-        day_of_month = target_date.day
-        
-        # Approximate tithi (1-15 Shukla, 16-30 Krishna)
-        tithi = (day_of_month % 30) + 1
+        """Calculate score based on the tithi in effect at 06:00 UTC"""
+        tithi = get_tithi(datetime.combine(target_date, time(6, 0)))
         
-        # Favorable tithis: 2, 3, 5, 7, 10, 11, 13 (Shukla Paksha)
+        # Favorable tithis: 2, 3, 5, 7, 10, 11, 13 (either paksha)
         favorable_tithis = [2, 3, 5, 7, 10, 11, 13]
-        # Unfavorable: 4, 8, 9, 14, 30 (Amavasya), 15 (Purnima has mixed results)
-        unfavorable_tithis = [4, 8, 9, 14, 30]
+        # Unfavorable: 4, 8, 9, 14 and Amavasya; Purnima has mixed results
+        unfavorable_tithis = [4, 8, 9, 14]
         
-        if tithi in favorable_tithis or (tithi + 15) % 30 in favorable_tithis:
+        if tithi["tithi"] == 30:
+            return -3.0
+        if tithi["paksha_tithi"] in favorable_tithis:
             return 3.0
-        elif tithi in unfavorable_tithis or (tithi + 15) % 30 in unfavorable_tithis:
+        elif tithi["paksha_tithi"] in unfavorable_tithis:
             return -3.0
         
         return 0.0
@@ -518,7 +515,112 @@ class Align27Calculator:
             })
         
         return planner
-    
+
+    def generate_group_planner(self,
+                              start_date: date,
+                              days: int,
+                              members: List[Dict],
+                              transits_by_day: List[Dict] = None,
+                              include_golden: bool = False) -> Dict:
+        """
+        Generate a joint planner for a group of profiles.
+        Each member is a dict with profile_id, natal_moon_rasi, natal_asc_rasi
+        and current_dasha. Members sharing a natal signature (Moon rasi, Asc
+        rasi, dasha lord) are scored once, and every day's transits are shared
+        by the whole group, so cost grows with distinct signatures rather than
+        member count. Returns a [members x days] score matrix and days ranked
+        by their minimum, then mean, score.
+        """
+        dates = [start_date + timedelta(days=i) for i in range(days)]
+        if transits_by_day is None:
+            transits_by_day = [{} for _ in dates]
+
+        # Map members onto distinct natal signatures
+        signatures = []
+        signature_index = {}
+        member_rows = []
+        for member in members:
+            dasha = member.get("current_dasha") or {}
+            key = (member["natal_moon_rasi"], member["natal_asc_rasi"], dasha.get("lord"))
+            if key not in signature_index:
+                signature_index[key] = len(signatures)
+                signatures.append((key, dasha))
+            member_rows.append(signature_index[key])
+
+        # Score each signature once per day: [signatures x days]
+        signature_scores = np.zeros((len(signatures), len(dates)))
+        for s, ((moon_rasi, asc_rasi, _), dasha) in enumerate(signatures):
+            for d, target_date in enumerate(dates):
+                signature_scores[s, d] = self.calculate_day_score(
+                    target_date, moon_rasi, asc_rasi,
+                    transits_by_day[d], dasha
+                )["score"]
+
+        scores = signature_scores[member_rows] if member_rows else np.zeros((0, len(dates)))
+        min_scores = scores.min(axis=0) if len(members) else np.zeros(len(dates))
+        mean_scores = scores.mean(axis=0) if len(members) else np.zeros(len(dates))
+
+        order = sorted(range(len(dates)), key=lambda d: (-min_scores[d], -mean_scores[d], d))
+        ranked_days = [
+            {
+                "date": dates[d].isoformat(),
+                "weekday": dates[d].strftime("%A"),
+                "min_score": round(float(min_scores[d]), 1),
+                "mean_score": round(float(mean_scores[d]), 1),
+                "color": self._score_to_color(min_scores[d])
+            }
+            for d in order
+        ]
+
+        result = {
+            "dates": [d.isoformat() for d in dates],
+            "profile_ids": [m.get("profile_id") for m in members],
+            "scores": [[round(float(v), 1) for v in row] for row in scores],
+            "distinct_signatures": len(signatures),
+            "ranked_days": ranked_days
+        }
+
+        if include_golden:
+            result["golden_windows"] = self._common_golden_windows(
+                dates, {(key[0], key[1]) for key, _ in signatures}
+            )
+
+        return result
+
+    def _common_golden_windows(self, dates: List[date], natal_pairs) -> List[Dict]:
+        """Intersect the GOLDEN moment of every (Moon rasi, Asc rasi) pair per day"""
+        windows = []
+        if not natal_pairs:
+            return windows
+
+        for target_date in dates:
+            start, end = None, None
+            for moon_rasi, asc_rasi in natal_pairs:
+                moments = self.generate_moments(target_date, moon_rasi, asc_rasi, {})
+                golden = next((m for m in moments if m["type"] == "GOLDEN"), None)
+                if golden is None:
+                    start = end = None
+                    break
+                start = golden["start"] if start is None else max(start, golden["start"])
+                end = golden["end"] if end is None else min(end, golden["end"])
+
+            if start is not None and start < end:
+                windows.append({
+                    "date": target_date.isoformat(),
+                    "start": start.strftime("%H:%M"),
+                    "end": end.strftime("%H:%M")
+                })
+
+        return windows
+
+    def _score_to_color(self, score: float) -> str:
+        """Map a 0-100 score onto the traffic light colors"""
+        if score >= GREEN_THRESHOLD:
+            return "GREEN"
+        elif score >= AMBER_THRESHOLD:
+            return "AMBER"
+        return "RED"
+
     def generate_ics_events(self,
                            start_date: date,
                            end_date: date,
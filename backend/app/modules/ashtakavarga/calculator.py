@@ -1,6 +1,24 @@
 from typing import Dict, List
 import numpy as np
 
+BAV_TARGETS = ["SUN", "MOON", "MARS", "MERCURY", "JUPITER", "VENUS", "SATURN"]
+BAV_CONTRIBUTORS = BAV_TARGETS + ["ASCENDANT"]
+
+# Sign indices (0 = Aries) of the signs ruled by each planet owning two
+EKADHIPATYA_PAIRS = [(0, 7), (1, 6), (2, 5), (8, 11), (9, 10)]  # Mars, Venus, Mercury, Jupiter, Saturn
+
+def build_rule_tensor(rules: Dict[str, Dict[str, List[int]]]) -> np.ndarray:
+    """
+    Compile BAV rules into a [target x contributor x house offset] 0/1 tensor
+    (offset 0 = the contributor's own sign)
+    """
+    tensor = np.zeros((len(BAV_TARGETS), len(BAV_CONTRIBUTORS), 12), dtype=np.int8)
+    for t, target in enumerate(BAV_TARGETS):
+        for c, contributor in enumerate(BAV_CONTRIBUTORS):
+            for house in rules[target].get(contributor, []):
+                tensor[t, c, house - 1] = 1
+    return tensor
+
 class AshtakavargaCalculator:
     """Calculate Bhinnashtakavarga (BAV) and Sarvashtakavarga (SAV)"""
     
@@ -13,7 +31,8 @@ class AshtakavargaCalculator:
             "MERCURY": [3, 5, 6, 9, 10, 11, 12],
             "JUPITER": [5, 6, 9, 11],
             "VENUS": [6, 7, 12],
-            "SATURN": [1, 2, 4, 7, 8, 9, 10, 11]
+            "SATURN": [1, 2, 4, 7, 8, 9, 10, 11],
+            "ASCENDANT": [3, 4, 6, 10, 11, 12]
         },
         "MOON": {
             "SUN": [3, 6, 7, 8, 10, 11],
@@ -22,7 +41,8 @@ class AshtakavargaCalculator:
             "MERCURY": [1, 3, 4, 5, 7, 8, 10, 11],
             "JUPITER": [1, 4, 7, 8, 10, 11, 12],
             "VENUS": [3, 4, 5, 7, 9, 10, 11],
-            "SATURN": [3, 5, 6, 11]
+            "SATURN": [3, 5, 6, 11],
+            "ASCENDANT": [3, 6, 10, 11]
         },
         "MARS": {
             "SUN": [3, 5, 6, 10, 11],
@@ -31,7 +51,8 @@ class AshtakavargaCalculator:
             "MERCURY": [3, 5, 6, 11],
             "JUPITER": [6, 10, 11, 12],
             "VENUS": [6, 8, 11, 12],
-            "SATURN": [1, 4, 7, 8, 9, 10, 11]
+            "SATURN": [1, 4, 7, 8, 9, 10, 11],
+            "ASCENDANT": [1, 3, 6, 10, 11]
         },
         "MERCURY": {
             "SUN": [5, 6, 9, 11, 12],
@@ -40,7 +61,8 @@ class AshtakavargaCalculator:
             "MERCURY": [1, 3, 5, 6, 9, 10, 11, 12],
             "JUPITER": [6, 8, 11, 12],
             "VENUS": [1, 2, 3, 4, 5, 8, 9, 11],
-            "SATURN": [1, 2, 4, 7, 8, 9, 10, 11]
+            "SATURN": [1, 2, 4, 7, 8, 9, 10, 11],
+            "ASCENDANT": [1, 2, 4, 6, 8, 10, 11]
         },
         "JUPITER": {
             "SUN": [1, 2, 3, 4, 7, 8, 9, 10, 11],
@@ -49,7 +71,8 @@ class AshtakavargaCalculator:
             "MERCURY": [1, 2, 4, 5, 6, 9, 10, 11],
             "JUPITER": [1, 2, 3, 4, 7, 8, 10, 11],
             "VENUS": [2, 5, 6, 9, 10, 11],
-            "SATURN": [3, 5, 6, 12]
+            "SATURN": [3, 5, 6, 12],
+            "ASCENDANT": [1, 2, 4, 5, 6, 7, 9, 10, 11]
         },
         "VENUS": {
             "SUN": [8, 11, 12],
@@ -58,7 +81,8 @@ class AshtakavargaCalculator:
             "MERCURY": [3, 5, 6, 9, 11],
             "JUPITER": [5, 8, 9, 10, 11],
             "VENUS": [1, 2, 3, 4, 5, 8, 9, 10, 11],
-            "SATURN": [3, 4, 5, 8, 9, 10, 11]
+            "SATURN": [3, 4, 5, 8, 9, 10, 11],
+            "ASCENDANT": [1, 2, 3, 4, 5, 8, 9, 11]
         },
         "SATURN": {
             "SUN": [1, 2, 4, 7, 8, 10, 11],
@@ -67,12 +91,23 @@ class AshtakavargaCalculator:
             "MERCURY": [6, 8, 9, 10, 11, 12],
             "JUPITER": [5, 6, 11, 12],
             "VENUS": [6, 11, 12],
-            "SATURN": [3, 5, 6, 11]
+            "SATURN": [3, 5, 6, 11],
+            "ASCENDANT": [1, 3, 4, 6, 10, 11]
         }
     }
     
+    def __init__(self):
+        self.rule_tensor = build_rule_tensor(self.BAV_RULES)
+        # rolled[t, c, k, r]: points target t gets in sign r from contributor c in sign k
+        self.rolled = np.stack([np.roll(self.rule_tensor, k, axis=-1) for k in range(12)], axis=2)
+        # Flattened to [(contributor, sign) x (target, sign)] so a batch is one
+        # matrix product; float32 keeps it on BLAS and is exact for these counts
+        self.rolled_matrix = self.rolled.transpose(1, 2, 0, 3).reshape(
+            len(BAV_CONTRIBUTORS) * 12, len(BAV_TARGETS) * 12
+        ).astype(np.float32)
+    
     def calculate_bav(self, planet: str, planetary_positions: Dict[str, Dict]) -> List[int]:
-        """Calculate Bhinnashtakavarga for a planet"""
+        """Calculate Bhinnashtakavarga for a planet (reference loop; see calculate_batch)"""
         if planet not in self.BAV_RULES:
             return [0] * 12
         
@@ -108,12 +143,11 @@ class AshtakavargaCalculator:
         return sav
     
     def calculate_reductions(self, sav: List[int]) -> Dict:
-        """Calculate various reduction techniques"""
+        """Calculate various reduction techniques (reference loop; see calculate_batch)"""
         # Trikona Shodhana - remove values in trines
         trikona_reduced = sav.copy()
         for i in range(12):
             trine1 = (i + 4) % 12
-            trine2 = (i + 8) % 12
             if trikona_reduced[i] > 0 and trikona_reduced[trine1] > 0:
                 reduction = min(trikona_reduced[i], trikona_reduced[trine1])
                 trikona_reduced[i] -= reduction
@@ -121,8 +155,7 @@ class AshtakavargaCalculator:
         
         # Ekadhipatya Shodhana - signs owned by same planet
         ekadhipatya_reduced = sav.copy()
-        dual_lordship = [(0, 7), (1, 6), (3, 10), (4, 9), (5, 11)]  # Mars, Venus, Moon/Sun, Jupiter, Saturn
-        for lord1, lord2 in dual_lordship:
+        for lord1, lord2 in EKADHIPATYA_PAIRS:
             if ekadhipatya_reduced[lord1] > 0 and ekadhipatya_reduced[lord2] > 0:
                 reduction = min(ekadhipatya_reduced[lord1], ekadhipatya_reduced[lord2])
                 ekadhipatya_reduced[lord1] -= reduction
@@ -134,19 +167,64 @@ class AshtakavargaCalculator:
             "ekadhipatya_shodhana": ekadhipatya_reduced
         }
     
+    def contributor_rasis(self, planetary_positions: Dict[str, Dict]) -> np.ndarray:
+        """Rasi of each BAV contributor (0 if absent), in BAV_CONTRIBUTORS order"""
+        return np.array([
+            planetary_positions.get(contributor, {}).get("rasi") or 0
+            for contributor in BAV_CONTRIBUTORS
+        ], dtype=np.int64)
+    
+    def calculate_batch(self, rasis: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Calculate Ashtakavarga for many charts at once.
+        
+        Args:
+            rasis: [charts x 8] contributor rasis (1-12, 0 if absent), in
+                BAV_CONTRIBUTORS order
+        
+        Returns:
+            "bav" [charts x 7 x 12], "sav", "trikona_shodhana" and
+            "ekadhipatya_shodhana" [charts x 12]
+        """
+        rasis = np.asarray(rasis, dtype=np.int64).reshape(-1, len(BAV_CONTRIBUTORS))
+        
+        # One-hot sign of each contributor; absent contributors are all zero
+        one_hot = (rasis[:, :, None] == np.arange(1, 13)[None, None, :]).reshape(len(rasis), -1)
+        bav = (one_hot.astype(np.float32) @ self.rolled_matrix).astype(np.int64).reshape(-1, len(BAV_TARGETS), 12)
+        sav = bav.sum(axis=1)
+        
+        # Trikona: signs i, i+4, i+8 reduced pairwise in the order of the loop
+        trines = sav.reshape(-1, 3, 4).copy()
+        for a, b in ((0, 1), (1, 2), (2, 0)):
+            reduction = np.minimum(trines[:, a], trines[:, b])
+            trines[:, a] -= reduction
+            trines[:, b] -= reduction
+        
+        ekadhipatya = sav.copy()
+        first, second = np.array(EKADHIPATYA_PAIRS).T
+        reduction = np.minimum(ekadhipatya[:, first], ekadhipatya[:, second])
+        ekadhipatya[:, first] -= reduction
+        ekadhipatya[:, second] -= reduction
+        
+        return {
+            "bav": bav,
+            "sav": sav,
+            "trikona_shodhana": trines.reshape(-1, 12),
+            "ekadhipatya_shodhana": ekadhipatya
+        }
+    
     def calculate_all(self, planetary_positions: Dict[str, Dict]) -> Dict:
         """Calculate complete Ashtakavarga"""
-        bavs = {}
-        
-        # Calculate BAV for each planet
-        for planet in ["SUN", "MOON", "MARS", "MERCURY", "JUPITER", "VENUS", "SATURN"]:
-            bavs[planet] = self.calculate_bav(planet, planetary_positions)
+        batch = self.calculate_batch(self.contributor_rasis(planetary_positions))
         
-        # Calculate SAV
-        sav = self.calculate_sav(bavs)
+        bavs = {planet: batch["bav"][0, t].tolist() for t, planet in enumerate(BAV_TARGETS)}
+        sav = batch["sav"][0].tolist()
         
-        # Calculate reductions
-        reductions = self.calculate_reductions(sav)
+        reductions = {
+            "original": sav,
+            "trikona_shodhana": batch["trikona_shodhana"][0].tolist(),
+            "ekadhipatya_shodhana": batch["ekadhipatya_shodhana"][0].tolist()
+        }
         
         return {
             "bav": bavs,
@@ -0,0 +1,107 @@
+"""
+Transit Ashtakavarga
+Bindu scores of transiting planets read from the natal Bhinnashtakavarga,
+with the kakshya (1/8 sign) each transit occupies, sampled over a range
+"""
+import numpy as np
+from typing import Dict
+
+from app.core.cache import LRUCache
+from app.modules.ephemeris.calculator import ephemeris
+from app.modules.ashtakavarga.calculator import ashtakavarga_calculator, BAV_TARGETS, BAV_CONTRIBUTORS
+
+# Lords of the eight 3°45' kakshyas of every sign, in order
+KAKSHYA_LORDS = ["SATURN", "JUPITER", "MARS", "SUN", "VENUS", "MERCURY", "MOON", "ASCENDANT"]
+KAKSHYA_SPAN = 30.0 / len(KAKSHYA_LORDS)
+
+# Longest range served in one call (daily samples)
+MAX_TIMELINE_DAYS = int(50 * 365.25)
+
+
+class TransitAshtakavarga:
+    """Score transits against a natal Ashtakavarga"""
+
+    def __init__(self):
+        self._timelines = LRUCache(maxsize=64, ttl=3600)
+        self._longitudes = LRUCache(maxsize=16)
+        self._kakshya_contributors = np.array([BAV_CONTRIBUTORS.index(lord) for lord in KAKSHYA_LORDS])
+
+    def longitudes(self, jd_start: float, jd_end: float, step: float = 1.0) -> np.ndarray:
+        """
+        Sidereal longitudes of the BAV planets [planets x samples]. They do
+        not depend on the chart, so profiles viewing the same range share them.
+        """
+        key = (round(jd_start, 6), round(jd_end, 6), step)
+        longitudes = self._longitudes.get(key)
+        if longitudes is None:
+            jds = np.arange(jd_start, jd_end, step)
+            longitudes = np.stack([ephemeris.get_longitudes(jds, planet)[0] for planet in BAV_TARGETS])
+            self._longitudes.set(key, longitudes)
+        return longitudes
+
+    def timeline(self,
+                 natal_positions: Dict[str, Dict],
+                 jd_start: float,
+                 jd_end: float,
+                 step: float = 1.0) -> Dict:
+        """
+        Transit bindus of the seven BAV planets sampled every `step` days.
+
+        Args:
+            natal_positions: {planet: {"rasi", ...}} including ASCENDANT
+
+        Returns per planet the transit rasi, kakshya (1-8), the planet's own
+        BAV bindus in that rasi, the SAV of that rasi and whether the kakshya
+        lord contributed a bindu there; series are plain lists aligned with
+        jd_start + i * step. Timelines are keyed by contributor rasis, so
+        charts with the same placements share one.
+        """
+        natal_rasis = ashtakavarga_calculator.contributor_rasis(natal_positions)
+        key = (tuple(natal_rasis.tolist()), round(jd_start, 6), round(jd_end, 6), step)
+        cached = self._timelines.get(key)
+        if cached is not None:
+            return cached
+
+        tables = ashtakavarga_calculator.calculate_batch(natal_rasis)
+        bav, sav = tables["bav"][0], tables["sav"][0]
+
+        transits = self.longitudes(jd_start, jd_end, step)
+        planets = {}
+        total = np.zeros(transits.shape[1], dtype=np.int64)
+
+        for t, planet in enumerate(BAV_TARGETS):
+            longitudes = transits[t]
+            signs = (longitudes // 30.0).astype(np.int64) % 12
+            kakshyas = np.minimum((longitudes % 30.0) // KAKSHYA_SPAN, len(KAKSHYA_LORDS) - 1).astype(np.int64)
+
+            # rolled[t, c, k, r]: does contributor c in natal sign k give target t a bindu in sign r
+            contributors = self._kakshya_contributors[kakshyas]
+            contributor_signs = natal_rasis[contributors] - 1
+            kakshya_bindu = ashtakavarga_calculator.rolled[t, contributors, contributor_signs, signs].astype(bool)
+            kakshya_bindu &= natal_rasis[contributors] > 0
+
+            bindus = bav[t, signs]
+            total += bindus
+            planets[planet] = {
+                "rasi": (signs + 1).tolist(),
+                "kakshya": (kakshyas + 1).tolist(),
+                "bindus": bindus.tolist(),
+                "sav": sav[signs].tolist(),
+                "kakshya_bindu": kakshya_bindu.astype(np.int8).tolist(),
+            }
+
+        result = {
+            "start_jd": float(jd_start),
+            "step": step,
+            "count": transits.shape[1],
+            "bav": {planet: bav[t].tolist() for t, planet in enumerate(BAV_TARGETS)},
+            "sav": sav.tolist(),
+            "kakshya_lords": KAKSHYA_LORDS,
+            "planets": planets,
+            "total_bindus": total.tolist(),
+        }
+        self._timelines.set(key, result)
+        return result
+
+
+transit_ashtakavarga = TransitAshtakavarga()
@@ -1,9 +1,15 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple
 import hashlib
 import json
+import numpy as np
 from datetime import datetime
 from app.modules.ephemeris.calculator import ephemeris
 
+MINUTES_PER_DAY = 1440.0
+
+# Most sensitive boundaries listed in the sensitivity summary
+SENSITIVITY_SUMMARY_SIZE = 5
+
 class DivisionalChartCalculator:
     """Calculate all divisional charts D1-D60"""
     
@@ -69,6 +75,22 @@ class ChartCalculator:
         data = f"{dt.isoformat()}_{lat}_{lon}_{ayanamsa}"
         return hashlib.sha256(data.encode()).hexdigest()
     
+    def profile_birth_datetime(self, profile) -> datetime:
+        """Birth moment of a Profile, from its date and HH:MM:SS time"""
+        return datetime.combine(
+            profile.birth_date.date(),
+            datetime.strptime(profile.birth_time, "%H:%M:%S").time()
+        )
+    
+    def profile_chart_hash(self, profile) -> str:
+        """Chart hash of a Profile's current birth data"""
+        return self.generate_chart_hash(
+            self.profile_birth_datetime(profile),
+            profile.latitude,
+            profile.longitude,
+            profile.ayanamsa
+        )
+    
     def calculate_natal_chart(self, dt: datetime, lat: float, lon: float, ayanamsa: str = "LAHIRI") -> Dict:
         """Calculate complete natal chart"""
         # Get Julian Day
@@ -78,39 +100,95 @@ class ChartCalculator:
         ayanamsa_value = ephemeris.get_ayanamsa(jd)
         
         # Calculate houses and ascendant
-        ascendant, house_cusps = ephemeris.get_houses(jd, lat, lon)
-        
-        # Apply ayanamsa to ascendant
-        asc_sidereal = (ascendant - ayanamsa_value) % 360.0
+        houses = self.calculate_houses(jd, lat, lon, ayanamsa_value)
+        asc_sidereal = houses["ascendant"]
+        asc_speed = ephemeris.get_ascendant_speed(jd, lat, lon)
         
         # Get all planetary positions
-        planets = ephemeris.get_all_planets(jd)
-        
-        # Enhance planet data with additional info
-        sun_lon = planets["SUN"]["longitude"]
-        for planet, pos in planets.items():
-            lon = pos["longitude"]
-            pos["nakshatra"], pos["pada"] = ephemeris.get_nakshatra(lon)
-            pos["rasi"] = ephemeris.get_rasi(lon)
-            pos["degree_in_rasi"] = lon % 30.0
-            pos["is_combust"] = ephemeris.is_combust(lon, sun_lon, planet)
-            pos["dignity"] = ephemeris.get_dignity(planet, pos["rasi"])
-        
-        # Calculate MC (10th house cusp)
-        mc = (house_cusps[9] - ayanamsa_value) % 360.0
+        planets = self.describe_planets(ephemeris.get_all_planets(jd))
         
         # Calculate divisional charts
         divisional_charts = self.div_calculator.calculate_all_divisions(planets)
         
+        # Time to the nearest boundary for the ascendant and every planet
+        points = {"ASCENDANT": (asc_sidereal, asc_speed)}
+        points.update({planet: (pos["longitude"], pos["speed"]) for planet, pos in planets.items()})
+        sensitivity = self.calculate_sensitivity(points)
+        
         return {
             "julian_day": jd,
             "ayanamsa_value": ayanamsa_value,
-            "ascendant": asc_sidereal,
-            "mc": mc,
-            "house_cusps": [(cusp - ayanamsa_value) % 360.0 for cusp in house_cusps],
+            **houses,
             "planets": planets,
             "divisional_charts": divisional_charts,
+            "sensitivity": sensitivity,
             "chart_hash": self.generate_chart_hash(dt, lat, lon, ayanamsa)
         }
 
+    def calculate_houses(self, jd: float, lat: float, lon: float, ayanamsa_value: float) -> Dict:
+        """Calculate sidereal ascendant, MC and house cusps"""
+        ascendant, house_cusps = ephemeris.get_houses(jd, lat, lon)
+        
+        return {
+            "ascendant": (ascendant - ayanamsa_value) % 360.0,
+            "mc": (house_cusps[9] - ayanamsa_value) % 360.0,  # 10th house cusp
+            "house_cusps": [(cusp - ayanamsa_value) % 360.0 for cusp in house_cusps]
+        }
+    
+    def describe_planets(self, planets: Dict[str, Dict]) -> Dict[str, Dict]:
+        """Add nakshatra, rasi, combustion and dignity to planetary positions"""
+        sun_lon = planets["SUN"]["longitude"]
+        for planet, pos in planets.items():
+            lon = pos["longitude"]
+            pos["nakshatra"], pos["pada"] = ephemeris.get_nakshatra(lon)
+            pos["rasi"] = ephemeris.get_rasi(lon)
+            pos["degree_in_rasi"] = lon % 30.0
+            pos["is_combust"] = ephemeris.is_combust(lon, sun_lon, planet)
+            pos["dignity"] = ephemeris.get_dignity(planet, pos["rasi"])
+        
+        return planets
+    
+    def calculate_sensitivity(self, points: Dict[str, Tuple[float, float]]) -> Dict:
+        """
+        Minutes of birth-time error that would move each point across a boundary.
+
+        points maps a name to its sidereal longitude and speed (degrees/day).
+        Rasi, nakshatra, pada and every varga repeat at a fixed span, so the
+        distance to the nearest boundary divided by the speed gives the time
+        for all points and spans in one array operation.
+        """
+        boundaries = ["rasi", "nakshatra", "pada"] + [
+            f"D{division}" for division in self.div_calculator.DIVISIONS if division != 1
+        ]
+        spans = np.array([30.0, 40.0 / 3.0, 10.0 / 3.0] + [
+            30.0 / division for division in self.div_calculator.DIVISIONS if division != 1
+        ])
+
+        names = list(points)
+        longitudes = np.array([points[name][0] for name in names])[:, None]
+        speeds = np.array([points[name][1] for name in names])[:, None]
+
+        behind = longitudes % spans
+        ahead = spans - behind
+        with np.errstate(divide="ignore"):
+            minutes = np.minimum(behind, ahead) / np.abs(speeds) * MINUTES_PER_DAY
+        # A later birth moves a direct point towards the boundary ahead of it
+        later = (ahead < behind) == (speeds >= 0)
+
+        result = {"points": {}, "most_sensitive": []}
+        for i, name in enumerate(names):
+            result["points"][name] = {
+                boundary: {
+                    "minutes": round(float(minutes[i, j]), 1) if np.isfinite(minutes[i, j]) else None,
+                    "direction": "later" if later[i, j] else "earlier"
+                }
+                for j, boundary in enumerate(boundaries)
+            }
+
+        for flat in np.argsort(minutes, axis=None)[:SENSITIVITY_SUMMARY_SIZE]:
+            i, j = np.unravel_index(flat, minutes.shape)
+            result["most_sensitive"].append({"point": names[i], "boundary": boundaries[j], **result["points"][names[i]][boundaries[j]]})
+
+        return result
+
 chart_calculator = ChartCalculator()
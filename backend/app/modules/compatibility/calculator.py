@@ -1,9 +1,80 @@
 from typing import Dict, List, Tuple
 import math
+import numpy as np
+
+from app.modules.ephemeris.calculator import SIGN_LORDS
+
+# Bump when scoring rules change so cached compatibility reports are recomputed
+COMPATIBILITY_ENGINE_VERSION = "2"
+
+KOOTAS = ["varna", "vashya", "tara", "yoni", "graha_maitri", "gana", "bhakoot", "nadi"]
+
+# Moon positions are indexed by nakshatra pada: 108 padas of 3°20', nine per rasi
+PADA_SPAN = 10.0 / 3.0
+NUM_PADAS = 108
+
+
+def moon_pada_index(moon_longitude: float) -> int:
+    """Get the 0-based nakshatra pada index (0-107) of a Moon longitude"""
+    return int((moon_longitude % 360.0) / PADA_SPAN)
+
+
+class KootaTable:
+    """
+    All eight koota scores for every pair of Moon padas.
+
+    Scores are held in half points (tara and graha maitri award 1.5 and 2.5)
+    in a [108 x 108 x 8] int8 tensor indexed [male pada, female pada, koota],
+    with a parallel tensor of indices into each koota's descriptions.
+    """
+
+    def __init__(self, calculator: "CompatibilityCalculator"):
+        self.half_points = np.zeros((NUM_PADAS, NUM_PADAS, len(KOOTAS)), dtype=np.int8)
+        self.description_index = np.zeros((NUM_PADAS, NUM_PADAS, len(KOOTAS)), dtype=np.int8)
+        self.descriptions: List[List[str]] = [[] for _ in KOOTAS]
+
+        for male in range(NUM_PADAS):
+            for female in range(NUM_PADAS):
+                for k, (score, description) in enumerate(calculator.score_kootas(male, female)):
+                    if description not in self.descriptions[k]:
+                        self.descriptions[k].append(description)
+                    self.half_points[male, female, k] = int(round(score * 2))
+                    self.description_index[male, female, k] = self.descriptions[k].index(description)
+
+    def scores(self, male: int, female: int) -> Dict[str, Tuple[float, str]]:
+        """Get (score, description) per koota for one pair of Moon padas"""
+        return {
+            koota: (
+                _from_half_points(self.half_points[male, female, k]),
+                self.descriptions[k][self.description_index[male, female, k]]
+            )
+            for k, koota in enumerate(KOOTAS)
+        }
+
+    def totals(self, male, female) -> np.ndarray:
+        """Get total scores for arrays of male and female Moon padas (broadcast)"""
+        return self.half_points[male, female].sum(axis=-1, dtype=np.int16) / 2.0
+
+
+def _from_half_points(half_points) -> float:
+    """Convert half points back to the score the koota rule returned"""
+    half_points = int(half_points)
+    return half_points // 2 if half_points % 2 == 0 else half_points / 2.0
+
 
 class CompatibilityCalculator:
     """Calculate Ashtakoot compatibility and Manglik analysis"""
     
+    def __init__(self):
+        self._koota_table = None
+    
+    @property
+    def koota_table(self) -> KootaTable:
+        """Koota score tensor, built on first use"""
+        if self._koota_table is None:
+            self._koota_table = KootaTable(self)
+        return self._koota_table
+    
     def calculate_varna(self, male_moon_rasi: int, female_moon_rasi: int) -> Tuple[int, str]:
         """Varna Koot - 1 point"""
         varna_map = {
@@ -163,35 +234,28 @@ class CompatibilityCalculator:
         
         return 0, "Same Nadi - Inauspicious (Nadi Dosha)"
     
+    def score_kootas(self, male_pada: int, female_pada: int) -> List[Tuple[float, str]]:
+        """Apply the eight koota rules to a pair of Moon padas, in KOOTAS order"""
+        male_nakshatra, female_nakshatra = male_pada // 4 + 1, female_pada // 4 + 1
+        male_moon_rasi, female_moon_rasi = male_pada // 9 + 1, female_pada // 9 + 1
+        
+        return [
+            self.calculate_varna(male_moon_rasi, female_moon_rasi),
+            self.calculate_vashya(male_moon_rasi, female_moon_rasi),
+            self.calculate_tara(male_nakshatra, female_nakshatra),
+            self.calculate_yoni(male_nakshatra, female_nakshatra),
+            self.calculate_graha_maitri(SIGN_LORDS[male_moon_rasi - 1], SIGN_LORDS[female_moon_rasi - 1]),
+            self.calculate_gana(male_nakshatra, female_nakshatra),
+            self.calculate_bhakoot(male_moon_rasi, female_moon_rasi),
+            self.calculate_nadi(male_nakshatra, female_nakshatra)
+        ]
+    
     def calculate_ashtakoot(self, male_chart: Dict, female_chart: Dict) -> Dict:
         """Calculate complete Ashtakoot compatibility"""
-        male_moon = male_chart["planets"]["MOON"]
-        female_moon = female_chart["planets"]["MOON"]
-        
-        male_moon_rasi = male_moon["rasi"]
-        female_moon_rasi = female_moon["rasi"]
-        
-        # Convert nakshatra name to number
-        nakshatra_names = [
-            "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
-            "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni",
-            "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
-            "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha",
-            "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
-        ]
+        male_pada = moon_pada_index(male_chart["planets"]["MOON"]["longitude"])
+        female_pada = moon_pada_index(female_chart["planets"]["MOON"]["longitude"])
         
-        male_nakshatra = nakshatra_names.index(male_moon["nakshatra"]) + 1
-        female_nakshatra = nakshatra_names.index(female_moon["nakshatra"]) + 1
-        
-        scores = {}
-        scores["varna"] = self.calculate_varna(male_moon_rasi, female_moon_rasi)
-        scores["vashya"] = self.calculate_vashya(male_moon_rasi, female_moon_rasi)
-        scores["tara"] = self.calculate_tara(male_nakshatra, female_nakshatra)
-        scores["yoni"] = self.calculate_yoni(male_nakshatra, female_nakshatra)
-        scores["graha_maitri"] = self.calculate_graha_maitri("MOON", "MOON")  # Simplified
-        scores["gana"] = self.calculate_gana(male_nakshatra, female_nakshatra)
-        scores["bhakoot"] = self.calculate_bhakoot(male_moon_rasi, female_moon_rasi)
-        scores["nadi"] = self.calculate_nadi(male_nakshatra, female_nakshatra)
+        scores = self.koota_table.scores(male_pada, female_pada)
         
         total_score = sum(s[0] for s in scores.values())
         max_score = 36
@@ -0,0 +1,190 @@
+"""
+Matchmaking Index
+Columnar in-memory index of candidate Moon padas, Manglik flags and chart
+longitudes, scored against a seeker in one vectorized pass
+"""
+import threading
+import numpy as np
+from typing import Dict, List, Optional
+
+from app.modules.compatibility.calculator import compatibility_calculator, moon_pada_index, KOOTAS
+from app.modules.synastry.calculator import synastry_calculator, SYNASTRY_POINTS
+
+NADI = KOOTAS.index("nadi")
+
+
+class MatchIndex:
+    """
+    Match candidates of one user, kept in parallel column arrays.
+
+    Columns are allocated with spare capacity that doubles when full, and
+    rows are found through a profile_id -> row dict.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self.lock = threading.Lock()
+        self.names: List[str] = []
+        self.signatures: List[str] = []
+        self._rows: Dict[int, int] = {}
+        self._size = 0
+        self._profile_ids = np.zeros(capacity, dtype=np.int64)
+        self._moon_padas = np.zeros(capacity, dtype=np.int16)
+        self._manglik = np.zeros(capacity, dtype=bool)
+        self._longitudes = np.zeros((capacity, len(SYNASTRY_POINTS)))
+
+        # Set by the caller to what the index was last synced with
+        self.version = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def profile_ids(self) -> np.ndarray:
+        return self._profile_ids[:self._size]
+
+    @property
+    def moon_padas(self) -> np.ndarray:
+        return self._moon_padas[:self._size]
+
+    @property
+    def manglik(self) -> np.ndarray:
+        return self._manglik[:self._size]
+
+    @property
+    def longitudes(self) -> np.ndarray:
+        return self._longitudes[:self._size]
+
+    def row(self, profile_id: int) -> Optional[int]:
+        """Get the row of a profile, or None if it is not indexed"""
+        return self._rows.get(profile_id)
+
+    def _grow(self):
+        capacity = max(2 * len(self._profile_ids), 1)
+        for name in ("_profile_ids", "_moon_padas", "_manglik", "_longitudes"):
+            column = getattr(self, name)
+            grown = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            setattr(self, name, grown)
+
+    def upsert(self, profile_id: int, name: str, signature: str, chart: Dict):
+        """
+        Add or replace a candidate.
+
+        chart holds "ascendant" and "planets" ({planet: {"longitude", "rasi", "dignity"}}),
+        as used by the compatibility calculator.
+        """
+        manglik = compatibility_calculator.check_manglik(chart)
+        vector = synastry_calculator.chart_vector(
+            chart["ascendant"],
+            {planet: pos["longitude"] for planet, pos in chart["planets"].items()}
+        )
+        pada = moon_pada_index(chart["planets"]["MOON"]["longitude"])
+
+        row = self.row(profile_id)
+        if row is None:
+            if self._size == len(self._profile_ids):
+                self._grow()
+            row = self._size
+            self._size += 1
+            self._rows[profile_id] = row
+            self._profile_ids[row] = profile_id
+            self.names.append(name)
+            self.signatures.append(signature)
+        else:
+            self.names[row] = name
+            self.signatures[row] = signature
+
+        self._moon_padas[row] = pada
+        self._manglik[row] = manglik["is_manglik"] and not manglik["cancelled"]
+        self._longitudes[row] = vector
+
+    def remove(self, profile_ids):
+        """Drop candidates that no longer exist"""
+        removed = [self._rows[profile_id] for profile_id in profile_ids if profile_id in self._rows]
+        if not removed:
+            return
+
+        keep = np.ones(self._size, dtype=bool)
+        keep[removed] = False
+        size = int(keep.sum())
+        for name in ("_profile_ids", "_moon_padas", "_manglik", "_longitudes"):
+            column = getattr(self, name)
+            column[:size] = column[:self._size][keep]
+        self.names = [name for name, kept in zip(self.names, keep) if kept]
+        self.signatures = [signature for signature, kept in zip(self.signatures, keep) if kept]
+        self._size = size
+        self._rows = {int(profile_id): row for row, profile_id in enumerate(self.profile_ids.tolist())}
+
+    def search(self,
+               seeker_id: int,
+               seeker_side: str = "male",
+               limit: int = 50,
+               min_score: float = 0.0,
+               manglik_match: bool = False,
+               exclude_nadi_dosha: bool = False) -> List[Dict]:
+        """
+        Rank every candidate against an indexed seeker.
+
+        Args:
+            seeker_side: "male" scores the seeker as the male chart in the
+                kootas, "female" as the female chart
+
+        Candidates are ordered by guna total, then by synastry score.
+        """
+        seeker = self.row(seeker_id)
+        if seeker is None:
+            raise KeyError(seeker_id)
+
+        table = compatibility_calculator.koota_table
+        pada = self.moon_padas[seeker]
+        if seeker_side == "male":
+            half_points = table.half_points[pada, self.moon_padas]
+        else:
+            half_points = table.half_points[self.moon_padas, pada]
+
+        totals = half_points.sum(axis=-1, dtype=np.int16) / 2.0
+        nadi_dosha = half_points[:, NADI] == 0
+
+        mask = (self.profile_ids != seeker_id) & (totals >= min_score)
+        if manglik_match:
+            mask &= self.manglik == self.manglik[seeker]
+        if exclude_nadi_dosha:
+            mask &= ~nadi_dosha
+
+        candidates = np.flatnonzero(mask)
+        synastry = synastry_calculator.score(self.longitudes[seeker], self.longitudes[candidates])
+        order = np.lexsort((-synastry, -totals[candidates]))[:limit]
+
+        return [
+            {
+                "profile_id": int(self.profile_ids[row]),
+                "name": self.names[row],
+                "total_score": float(totals[row]),
+                "kootas": dict(zip(KOOTAS, (half_points[row] / 2.0).tolist())),
+                "nadi_dosha": bool(nadi_dosha[row]),
+                "manglik": bool(self.manglik[row]),
+                "synastry_score": round(float(synastry[i]), 3),
+            }
+            for i, row in ((i, candidates[i]) for i in order)
+        ]
+
+
+class MatchIndexRegistry:
+    """One MatchIndex per user"""
+
+    def __init__(self):
+        self._indexes: Dict[int, MatchIndex] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> MatchIndex:
+        with self._lock:
+            if user_id not in self._indexes:
+                self._indexes[user_id] = MatchIndex()
+            return self._indexes[user_id]
+
+    def clear(self):
+        with self._lock:
+            self._indexes.clear()
+
+
+match_indexes = MatchIndexRegistry()
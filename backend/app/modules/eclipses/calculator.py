@@ -0,0 +1,179 @@
+"""
+Eclipse Catalog
+Precomputed solar and lunar eclipses with sidereal positions, queried
+against natal points as sorted-array range lookups
+"""
+import threading
+import numpy as np
+import swisseph as swe
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+
+from app.models.eclipse import Eclipse
+from app.modules.ephemeris.calculator import ephemeris
+
+CATALOG_FIRST_YEAR = 1900
+CATALOG_LAST_YEAR = 2100
+
+SOLAR_SUBTYPES = [
+    (swe.ECL_ANNULAR_TOTAL, "HYBRID"),
+    (swe.ECL_TOTAL, "TOTAL"),
+    (swe.ECL_ANNULAR, "ANNULAR"),
+    (swe.ECL_PARTIAL, "PARTIAL"),
+]
+LUNAR_SUBTYPES = [
+    (swe.ECL_TOTAL, "TOTAL"),
+    (swe.ECL_PARTIAL, "PARTIAL"),
+    (swe.ECL_PENUMBRAL, "PENUMBRAL"),
+]
+
+
+class EclipseCatalog:
+    """Eclipse catalog stored in the database and held in memory as sorted arrays"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._eclipses: Optional[List[Dict]] = None
+        self._julian_days = None
+        self._longitudes = None
+        self._by_longitude = None
+
+    def compute(self, first_year: int = CATALOG_FIRST_YEAR, last_year: int = CATALOG_LAST_YEAR) -> List[Dict]:
+        """Compute every solar and lunar eclipse between two years"""
+        jd_start = swe.julday(first_year, 1, 1, 0.0)
+        jd_end = swe.julday(last_year + 1, 1, 1, 0.0)
+        eclipses = []
+
+        for eclipse_type, search, subtypes, body in (
+            ("SOLAR", lambda jd: swe.sol_eclipse_when_glob(jd, swe.FLG_SWIEPH, 0, False), SOLAR_SUBTYPES, "SUN"),
+            ("LUNAR", lambda jd: swe.lun_eclipse_when(jd, swe.FLG_SWIEPH, 0, False), LUNAR_SUBTYPES, "MOON"),
+        ):
+            jd = jd_start
+            while True:
+                flags, times = search(jd)
+                maximum = times[0]
+                if maximum >= jd_end:
+                    break
+
+                longitude = ephemeris.get_planet_position(maximum, body)["longitude"]
+                nakshatra, pada = ephemeris.get_nakshatra(longitude)
+                eclipses.append({
+                    "eclipse_type": eclipse_type,
+                    "subtype": next(name for flag, name in subtypes if flags & flag),
+                    "julian_day": maximum,
+                    "eclipse_time": ephemeris.get_datetime(maximum),
+                    "longitude": longitude,
+                    "rasi": ephemeris.get_rasi(longitude),
+                    "nakshatra": nakshatra,
+                    "nakshatra_pada": pada,
+                })
+                jd = maximum + 20.0
+
+        eclipses.sort(key=lambda e: e["julian_day"])
+        return eclipses
+
+    def build(self, db: Session) -> int:
+        """Store the catalog if the table is empty; returns the number of eclipses stored"""
+        if db.query(Eclipse).first() is not None:
+            return 0
+
+        eclipses = self.compute()
+        db.bulk_insert_mappings(Eclipse, eclipses)
+        db.commit()
+        return len(eclipses)
+
+    def load(self, db: Session):
+        """Load the catalog into memory once, building it on first use"""
+        if self._eclipses is not None:
+            return
+
+        with self._lock:
+            if self._eclipses is not None:
+                return
+
+            self.build(db)
+            rows = db.query(Eclipse).order_by(Eclipse.julian_day).all()
+            self.index([{
+                "eclipse_type": row.eclipse_type,
+                "subtype": row.subtype,
+                "julian_day": row.julian_day,
+                "eclipse_time": row.eclipse_time,
+                "longitude": row.longitude,
+                "rasi": row.rasi,
+                "nakshatra": row.nakshatra,
+                "nakshatra_pada": row.nakshatra_pada,
+            } for row in rows])
+
+    def index(self, eclipses: List[Dict]):
+        """Hold time-ordered eclipses in memory as sorted arrays"""
+        self._julian_days = np.array([e["julian_day"] for e in eclipses])
+        longitudes = np.array([e["longitude"] for e in eclipses])
+
+        # Longitude-sorted copy extended by +/-360 so orb windows never wrap
+        order = np.argsort(longitudes)
+        self._longitudes = np.concatenate([longitudes[order] - 360.0, longitudes[order], longitudes[order] + 360.0])
+        self._by_longitude = np.tile(order, 3)
+
+        self._eclipses = [{
+            key: (value.isoformat() if key == "eclipse_time" else value)
+            for key, value in e.items()
+        } for e in eclipses]
+
+    def in_range(self, jd_start: float, jd_end: float, include_penumbral: bool = False) -> List[Dict]:
+        """Get eclipses between two Julian Days (catalog must be loaded)"""
+        first = int(np.searchsorted(self._julian_days, jd_start, side="left"))
+        last = int(np.searchsorted(self._julian_days, jd_end, side="right"))
+        return [
+            e for e in self._eclipses[first:last]
+            if include_penumbral or e["subtype"] != "PENUMBRAL"
+        ]
+
+    def natal_hits(self,
+                   natal_points: Dict[str, float],
+                   ascendant: float,
+                   orb: float,
+                   jd_start: float,
+                   jd_end: float,
+                   include_penumbral: bool = False,
+                   only_hits: bool = True) -> List[Dict]:
+        """
+        Join eclipses between two Julian Days against natal points.
+
+        Each natal point is one binary-search window over the longitude-sorted
+        catalog; eclipses also get their whole-sign house from the ascendant.
+        """
+        contacts: Dict[int, List[Dict]] = {}
+        for point, natal_longitude in natal_points.items():
+            lower = int(np.searchsorted(self._longitudes, natal_longitude - orb, side="left"))
+            upper = int(np.searchsorted(self._longitudes, natal_longitude + orb, side="right"))
+            for pos in range(lower, upper):
+                index = int(self._by_longitude[pos])
+                if not jd_start <= self._julian_days[index] <= jd_end:
+                    continue
+                contacts.setdefault(index, []).append({
+                    "point": point,
+                    "separation": round(abs(self._longitudes[pos] - natal_longitude), 4),
+                })
+
+        ascendant_rasi = ephemeris.get_rasi(ascendant)
+        first = int(np.searchsorted(self._julian_days, jd_start, side="left"))
+        last = int(np.searchsorted(self._julian_days, jd_end, side="right"))
+        results = []
+
+        for index in range(first, last):
+            eclipse = self._eclipses[index]
+            if eclipse["subtype"] == "PENUMBRAL" and not include_penumbral:
+                continue
+            if only_hits and index not in contacts:
+                continue
+
+            results.append({
+                **eclipse,
+                "house": (eclipse["rasi"] - ascendant_rasi) % 12 + 1,
+                "contacts": sorted(contacts.get(index, []), key=lambda c: c["separation"]),
+            })
+
+        return results
+
+
+eclipse_catalog = EclipseCatalog()
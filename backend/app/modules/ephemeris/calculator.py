@@ -1,8 +1,9 @@
 import swisseph as swe
 import os
-from datetime import datetime, timezone
-from typing import Dict, List, Tuple
+from datetime import datetime, timezone, timedelta
+from typing import Dict, List, Optional, Tuple
 import math
+import numpy as np
 from app.core.config import settings
 
 # Initialize Swiss Ephemeris
@@ -43,12 +44,26 @@ NAKSHATRAS = [
     "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
 ]
 
+# Taras: nakshatra count from a reference nakshatra, taken in cycles of nine
+TARA_NAMES = ["Janma", "Sampat", "Vipat", "Kshema", "Pratyak", "Sadhaka", "Naidhana", "Mitra", "Parama Mitra"]
+
+# Lord of each rasi, Aries first
+SIGN_LORDS = [
+    "MARS", "VENUS", "MERCURY", "MOON", "SUN", "MERCURY",
+    "VENUS", "MARS", "JUPITER", "SATURN", "SATURN", "JUPITER"
+]
+
 RAHU_KETU_SPEED = -0.0529  # Mean daily motion in degrees
 
 class EphemerisCalculator:
     def __init__(self, ayanamsa: str = "LAHIRI"):
         self.ayanamsa = ayanamsa
-        swe.set_sid_mode(AYANAMSA_MAP.get(ayanamsa, swe.SIDM_LAHIRI))
+        self._set_sid_mode()
+    
+    def _set_sid_mode(self):
+        """Apply the ayanamsa; Swiss Ephemeris keeps it per thread, so every
+        sidereal call re-applies it for requests served from worker threads"""
+        swe.set_sid_mode(AYANAMSA_MAP.get(self.ayanamsa, swe.SIDM_LAHIRI))
     
     def get_julian_day(self, dt: datetime) -> float:
         """Convert datetime to Julian Day"""
@@ -58,8 +73,14 @@ class EphemerisCalculator:
         return swe.julday(utc_dt.year, utc_dt.month, utc_dt.day,
                          utc_dt.hour + utc_dt.minute/60.0 + utc_dt.second/3600.0)
     
+    def get_datetime(self, jd: float) -> datetime:
+        """Convert Julian Day to a naive UTC datetime"""
+        year, month, day, hours = swe.revjul(jd)
+        return datetime(year, month, day) + timedelta(seconds=round(hours * 3600.0))
+    
     def get_ayanamsa(self, jd: float) -> float:
         """Get ayanamsa value for given Julian Day"""
+        self._set_sid_mode()
         return swe.get_ayanamsa(jd)
     
     def get_planet_position(self, jd: float, planet: str, sidereal: bool = True) -> Dict:
@@ -68,19 +89,20 @@ class EphemerisCalculator:
         if planet_id is None:
             raise ValueError(f"Unknown planet: {planet}")
         
-        flag = swe.FLG_SIDEREAL if sidereal else swe.FLG_SWIEPH
+        flag = (swe.FLG_SIDEREAL if sidereal else swe.FLG_SWIEPH) | swe.FLG_SPEED
+        self._set_sid_mode()
         
         if planet.upper() == "KETU":
             # Calculate Rahu first, then add 180°
             result = swe.calc_ut(jd, PLANETS["RAHU"], flag)
             longitude = (result[0][0] + 180.0) % 360.0
-            speed = -result[0][3]  # Ketu moves in opposite direction
+            # The nodes stay opposite each other, so Ketu moves with Rahu's speed
             return {
                 "longitude": longitude,
                 "latitude": -result[0][1],
                 "distance": result[0][2],
-                "speed": speed,
-                "is_retrograde": speed < 0
+                "speed": result[0][3],
+                "is_retrograde": False  # As for Rahu
             }
         
         result = swe.calc_ut(jd, planet_id, flag)
@@ -93,6 +115,43 @@ class EphemerisCalculator:
             "is_retrograde": result[0][3] < 0 if planet.upper() not in ["RAHU", "KETU"] else False
         }
     
+    def get_longitudes(self, jds, planet: str, sidereal: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """Get longitudes and daily speeds of a planet for an array of Julian Days"""
+        planet_id = PLANETS.get(planet.upper())
+        if planet_id is None:
+            raise ValueError(f"Unknown planet: {planet}")
+        
+        flag = (swe.FLG_SIDEREAL if sidereal else swe.FLG_SWIEPH) | swe.FLG_SPEED
+        self._set_sid_mode()
+        jds = np.atleast_1d(np.asarray(jds, dtype=float))
+        longitudes = np.empty(len(jds))
+        speeds = np.empty(len(jds))
+        
+        for i, jd in enumerate(jds):
+            result = swe.calc_ut(jd, planet_id, flag)
+            longitudes[i] = result[0][0]
+            speeds[i] = result[0][3]
+        
+        if planet.upper() == "KETU":
+            longitudes = (longitudes + 180.0) % 360.0
+        
+        return longitudes, speeds
+    
+    def get_sunrise_sunset(self, jd: float, latitude: float, longitude: float) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Get the next sunrise and sunset after a Julian Day (Hindu rising:
+        disc centre, no refraction). Either is None when the Sun does not
+        rise or set that day.
+        """
+        geopos = (longitude, latitude, 0.0)
+        events = []
+        
+        for event_flag in (swe.CALC_RISE, swe.CALC_SET):
+            result, times = swe.rise_trans(jd, swe.SUN, event_flag | swe.BIT_HINDU_RISING, geopos)
+            events.append(times[0] if result == 0 else None)
+        
+        return events[0], events[1]
+    
     def get_all_planets(self, jd: float) -> Dict[str, Dict]:
         """Get positions of all planets"""
         positions = {}
@@ -104,8 +163,14 @@ class EphemerisCalculator:
         """Calculate house cusps and ascendant using Placidus system"""
         cusps, ascmc = swe.houses(jd, lat, lon, b'P')  # Placidus
         ascendant = ascmc[0]
-        return ascendant, list(cusps[1:])  # cusps[0] is unused, houses start from cusps[1]
-    
+        # Older pyswisseph releases return 13 cusps with an unused cusps[0]
+        return ascendant, list(cusps[-12:])
+
+    def get_ascendant_speed(self, jd: float, lat: float, lon: float) -> float:
+        """Get the rate of change of the ascendant in degrees per day"""
+        cusps, ascmc, cusp_speeds, ascmc_speeds = swe.houses_ex2(jd, lat, lon, b'P')
+        return ascmc_speeds[0]
+
     def get_nakshatra(self, longitude: float) -> Tuple[str, int]:
         """Get nakshatra and pada for a given longitude"""
         nakshatra_span = 360.0 / 27.0  # 13°20'
@@ -0,0 +1,235 @@
+"""
+Ephemeris event search
+Finds the instants at which a sampled angle (a planet longitude, the
+Sun-Moon elongation, ...) crosses multiples of a fixed division span,
+and keeps the results in sorted per-year tables for O(log n) lookup.
+"""
+import numpy as np
+import swisseph as swe
+from typing import Callable, Dict, List, Tuple
+
+# Angle function: array of Julian Days -> array of angles in degrees [0, 360)
+AngleFunction = Callable[[np.ndarray], np.ndarray]
+
+# Padding around each yearly block so the first and last divisions are complete
+BLOCK_PADDING_DAYS = 3.0
+
+
+def _unwrap_near(value: float, reference: float) -> float:
+    """Place an angle on the same unwrapped turn as a reference angle"""
+    return reference + ((value - reference + 180.0) % 360.0 - 180.0)
+
+
+def _refine_crossing(angle_fn: AngleFunction,
+                     jd_a: float, jd_b: float,
+                     angle_a: float, angle_b: float,
+                     target: float,
+                     tolerance: float,
+                     max_iterations: int = 60) -> float:
+    """Find the instant an unwrapped angle equals target inside [jd_a, jd_b] (Illinois method)"""
+    fa = angle_a - target
+    fb = angle_b - target
+    jd_c = jd_a
+    side = 0
+
+    for _ in range(max_iterations):
+        jd_c = (jd_a * fb - jd_b * fa) / (fb - fa)
+        angle_c = _unwrap_near(float(angle_fn(np.array([jd_c]))[0]), angle_a)
+        fc = angle_c - target
+
+        if abs(fc) < tolerance or (jd_b - jd_a) < 1e-8:
+            break
+
+        if fc * fb > 0:
+            jd_b, fb = jd_c, fc
+            if side == -1:
+                fa /= 2.0
+            side = -1
+        else:
+            jd_a, fa = jd_c, fc
+            if side == 1:
+                fb /= 2.0
+            side = 1
+
+    return jd_c
+
+
+def find_division_crossings(angle_fn: AngleFunction,
+                            jd_start: float,
+                            jd_end: float,
+                            span: float,
+                            step: float,
+                            tolerance: float = 1e-6) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find every crossing of a multiple of span by an angle between jd_start and jd_end.
+
+    The angle is sampled every step days (step must be short enough that the
+    angle moves less than 180 degrees per step), unwrapped, and each change of
+    division is refined by root finding. Retrograde motion produces crossings
+    back into the previous division.
+
+    Returns:
+        (crossing Julian Days, index of the division entered at each crossing)
+    """
+    divisions = int(round(360.0 / span))
+    jds = np.arange(jd_start, jd_end + step, step)
+    angles = np.unwrap(angle_fn(jds), period=360.0)
+    floors = np.floor(angles / span).astype(np.int64)
+    changed = np.nonzero(floors[1:] != floors[:-1])[0]
+
+    crossing_jds = []
+    crossing_divisions = []
+
+    for i in changed:
+        if floors[i + 1] > floors[i]:
+            boundaries = range(floors[i] + 1, floors[i + 1] + 1)
+            entered_offset = 0
+        else:
+            boundaries = range(floors[i], floors[i + 1], -1)
+            entered_offset = -1
+
+        for boundary in boundaries:
+            jd = _refine_crossing(
+                angle_fn, jds[i], jds[i + 1], angles[i], angles[i + 1],
+                boundary * span, tolerance
+            )
+            crossing_jds.append(jd)
+            crossing_divisions.append((boundary + entered_offset) % divisions)
+
+    return np.array(crossing_jds, dtype=float), np.array(crossing_divisions, dtype=np.int64)
+
+
+def find_level_crossings(angle_fn: AngleFunction,
+                         jds: np.ndarray,
+                         angles: np.ndarray,
+                         levels: List[float],
+                         tolerance: float = 1e-6) -> List[Tuple[float, int, int]]:
+    """
+    Find every crossing of fixed angle levels (mod 360) by a sampled angle.
+
+    The samples are supplied by the caller so one sampling pass can serve
+    several level sets; the angle must move less than 180 degrees per sample.
+
+    Returns:
+        Time-ordered (Julian Day, level index, direction) tuples; direction is
+        +1 when the angle is increasing through the level and -1 when decreasing
+    """
+    unwrapped = np.unwrap(angles, period=360.0)
+    crossings = []
+
+    for level_index, level in enumerate(levels):
+        turns = np.floor((unwrapped - level) / 360.0)
+        changed = np.nonzero(turns[1:] != turns[:-1])[0]
+
+        for i in changed:
+            direction = 1 if turns[i + 1] > turns[i] else -1
+            target = level + 360.0 * max(turns[i], turns[i + 1])
+            jd = _refine_crossing(
+                angle_fn, jds[i], jds[i + 1], unwrapped[i], unwrapped[i + 1], target, tolerance
+            )
+            crossings.append((jd, level_index, direction))
+
+    crossings.sort()
+    return crossings
+
+
+class BoundaryTable:
+    """
+    Sorted table of division start instants for an angle.
+
+    Built lazily one calendar year at a time; each lookup is a binary search
+    over the year's boundaries.
+    """
+
+    def __init__(self,
+                 angle_fn: AngleFunction,
+                 span: float,
+                 step: float,
+                 first_year: int = 1900,
+                 last_year: int = 2100):
+        self.angle_fn = angle_fn
+        self.span = span
+        self.step = step
+        self.divisions = int(round(360.0 / span))
+        self.first_year = first_year
+        self.last_year = last_year
+        self._blocks: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def _block(self, year: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Get (start Julian Days, division indices) for a year, computing on first use"""
+        if year < self.first_year or year > self.last_year:
+            raise ValueError(f"Year {year} outside supported range {self.first_year}-{self.last_year}")
+
+        block = self._blocks.get(year)
+        if block is None:
+            jd_start = swe.julday(year, 1, 1, 0.0) - BLOCK_PADDING_DAYS
+            jd_end = swe.julday(year + 1, 1, 1, 0.0) + BLOCK_PADDING_DAYS
+            block = find_division_crossings(self.angle_fn, jd_start, jd_end, self.span, self.step)
+            self._blocks[year] = block
+
+        return block
+
+    def build(self, first_year: int, last_year: int):
+        """Precompute all blocks for an inclusive range of years"""
+        for year in range(first_year, last_year + 1):
+            self._block(year)
+
+    def _span(self, jd_start: float, jd_end: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Boundaries covering [jd_start, jd_end], widened by whole years until a
+        boundary precedes jd_start and another follows jd_end.
+        """
+        first_year = swe.revjul(jd_start)[0]
+        last_year = swe.revjul(jd_end)[0]
+
+        while True:
+            start_parts = []
+            index_parts = []
+
+            # Each year contributes the boundaries that fall inside it; the
+            # padding of the outer blocks extends the span at both edges
+            for year in range(first_year, last_year + 1):
+                starts, indices = self._block(year)
+                lower = -np.inf if year == first_year else swe.julday(year, 1, 1, 0.0)
+                upper = np.inf if year == last_year else swe.julday(year + 1, 1, 1, 0.0)
+                mask = (starts >= lower) & (starts < upper)
+                start_parts.append(starts[mask])
+                index_parts.append(indices[mask])
+
+            starts = np.concatenate(start_parts)
+            indices = np.concatenate(index_parts)
+
+            bracketed = True
+            if len(starts) == 0 or starts[0] > jd_start:
+                first_year -= 1
+                bracketed = False
+            if len(starts) == 0 or starts[-1] <= jd_end:
+                last_year += 1
+                bracketed = False
+            if bracketed:
+                return starts, indices
+
+    def lookup(self, jd: float) -> Tuple[int, float, float]:
+        """
+        Find the division containing an instant.
+
+        Returns:
+            (division index, start Julian Day, end Julian Day)
+        """
+        starts, indices = self._block(swe.revjul(jd)[0])
+        if len(starts) == 0 or not starts[0] <= jd < starts[-1]:
+            starts, indices = self._span(jd, jd)
+
+        pos = int(np.searchsorted(starts, jd, side="right")) - 1
+        return int(indices[pos]), float(starts[pos]), float(starts[pos + 1])
+
+    def intervals(self, jd_start: float, jd_end: float) -> List[Tuple[int, float, float]]:
+        """Get every (division index, start, end) interval overlapping [jd_start, jd_end)"""
+        starts, indices = self._span(jd_start, jd_end)
+        first = int(np.searchsorted(starts, jd_start, side="right")) - 1
+        last = int(np.searchsorted(starts, jd_end, side="left"))
+
+        return [
+            (int(indices[pos]), float(starts[pos]), float(starts[pos + 1]))
+            for pos in range(first, last)
+        ]
@@ -0,0 +1,62 @@
+"""
+Tithi Calculator
+Lunar day from the Sun-Moon elongation, backed by a precomputed table of
+tithi start instants (elongation crossing multiples of 12 degrees)
+"""
+import numpy as np
+from datetime import datetime
+from typing import Dict, List
+
+from app.modules.ephemeris.calculator import ephemeris
+from app.modules.ephemeris.events import BoundaryTable
+
+TITHI_SPAN = 12.0
+
+TITHI_NAMES = [
+    "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami",
+    "Shashthi", "Saptami", "Ashtami", "Navami", "Dashami",
+    "Ekadashi", "Dwadashi", "Trayodashi", "Chaturdashi", "Purnima",
+]
+
+
+def elongation(jds: np.ndarray) -> np.ndarray:
+    """Moon minus Sun longitude in degrees [0, 360); ayanamsa cancels out"""
+    moon, _ = ephemeris.get_longitudes(jds, "MOON", sidereal=False)
+    sun, _ = ephemeris.get_longitudes(jds, "SUN", sidereal=False)
+    return (moon - sun) % 360.0
+
+
+# Elongation advances ~12.2 deg/day, so half-day sampling brackets every tithi
+tithi_table = BoundaryTable(elongation, TITHI_SPAN, step=0.5)
+
+
+def _tithi_info(index: int, start_jd: float, end_jd: float) -> Dict:
+    """Describe a tithi from its 0-based table index"""
+    tithi = index + 1
+    paksha_tithi = (tithi - 1) % 15 + 1
+    name = "Amavasya" if tithi == 30 else TITHI_NAMES[paksha_tithi - 1]
+
+    return {
+        "tithi": tithi,
+        "paksha": "Shukla" if tithi <= 15 else "Krishna",
+        "paksha_tithi": paksha_tithi,
+        "name": name,
+        "start": ephemeris.get_datetime(start_jd),
+        "end": ephemeris.get_datetime(end_jd),
+    }
+
+
+def get_tithi(dt: datetime) -> Dict:
+    """Get the tithi in effect at a UTC datetime"""
+    index, start_jd, end_jd = tithi_table.lookup(ephemeris.get_julian_day(dt))
+    return _tithi_info(index, start_jd, end_jd)
+
+
+def get_tithis(start: datetime, end: datetime) -> List[Dict]:
+    """Get every tithi overlapping [start, end)"""
+    return [
+        _tithi_info(index, start_jd, end_jd)
+        for index, start_jd, end_jd in tithi_table.intervals(
+            ephemeris.get_julian_day(start), ephemeris.get_julian_day(end)
+        )
+    ]
@@ -0,0 +1,110 @@
+"""
+KP Calculator
+Krishnamurti sign, star, sub and sub-sub lords from precomputed boundary
+tables, looked up by binary search
+"""
+import numpy as np
+from datetime import datetime
+from typing import Dict, List
+
+from app.modules.ephemeris.calculator import EphemerisCalculator, SIGN_LORDS
+from app.modules.dasha.calculator import VIMSHOTTARI_PERIODS, VIMSHOTTARI_SEQUENCE
+
+NAKSHATRA_SPAN = 40.0 / 3.0
+VIMSHOTTARI_YEARS = 120.0
+
+
+def _build_segments(depth: int) -> Dict[str, np.ndarray]:
+    """
+    Build the zodiac split into Vimshottari-proportioned segments.
+
+    depth 1 gives the 243 star subs, depth 2 the 2187 sub-subs; segments
+    that straddle a sign boundary are split there, which yields the 249 KP
+    subs. Lords are stored as indices into VIMSHOTTARI_SEQUENCE.
+    """
+    starts, lords = [], []
+
+    def divide(start: float, span: float, first_lord: int, path: List[int]):
+        for i in range(9):
+            lord = (first_lord + i) % 9
+            part = span * VIMSHOTTARI_PERIODS[VIMSHOTTARI_SEQUENCE[lord]] / VIMSHOTTARI_YEARS
+            if len(path) == depth:
+                starts.append(start)
+                lords.append(path + [lord])
+            else:
+                divide(start, part, lord, path + [lord])
+            start += part
+
+    for nakshatra in range(27):
+        star_lord = nakshatra % 9
+        divide(nakshatra * NAKSHATRA_SPAN, NAKSHATRA_SPAN, star_lord, [star_lord])
+
+    starts = np.array(starts)
+    lords = np.array(lords)
+
+    # Split segments at sign boundaries that fall inside them
+    for sign_start in np.arange(30.0, 360.0, 30.0):
+        position = int(np.searchsorted(starts, sign_start))
+        if position < len(starts) and np.isclose(starts[position], sign_start):
+            continue
+        starts = np.insert(starts, position, sign_start)
+        lords = np.insert(lords, position, lords[position - 1], axis=0)
+
+    return {"starts": starts, "lords": lords}
+
+
+class KPCalculator:
+    """Calculate KP lords for planets and Placidus cusps"""
+
+    def __init__(self):
+        self.ephemeris = EphemerisCalculator("KP")
+        self.subs = _build_segments(1)
+        self.sub_subs = _build_segments(2)
+
+    def lookup(self, longitudes) -> List[Dict]:
+        """Get sign, star, sub and sub-sub lords for an array of sidereal longitudes"""
+        longitudes = np.atleast_1d(np.asarray(longitudes, dtype=float)) % 360.0
+        sub_index = np.searchsorted(self.subs["starts"], longitudes, side="right") - 1
+        sub_sub_index = np.searchsorted(self.sub_subs["starts"], longitudes, side="right") - 1
+        signs = (longitudes // 30.0).astype(int)
+
+        results = []
+        for longitude, sign, sub, sub_sub in zip(longitudes, signs, sub_index, sub_sub_index):
+            star_lord, sub_lord = self.subs["lords"][sub]
+            results.append({
+                "longitude": float(longitude),
+                "sign": int(sign) + 1,
+                "sign_lord": SIGN_LORDS[sign],
+                "star_lord": VIMSHOTTARI_SEQUENCE[star_lord],
+                "sub_lord": VIMSHOTTARI_SEQUENCE[sub_lord],
+                "sub_sub_lord": VIMSHOTTARI_SEQUENCE[self.sub_subs["lords"][sub_sub][2]],
+                "sub_number": int(sub) + 1,
+            })
+
+        return results
+
+    def calculate_table(self, dt: datetime, lat: float, lon: float) -> Dict:
+        """Get the KP table of planets and the 12 Placidus cusps with the KP ayanamsa"""
+        jd = self.ephemeris.get_julian_day(dt)
+        ayanamsa_value = self.ephemeris.get_ayanamsa(jd)
+        planets = self.ephemeris.get_all_planets(jd)
+        cusps = [(cusp - ayanamsa_value) % 360.0 for cusp in self.ephemeris.get_houses(jd, lat, lon)[1]]
+
+        names = list(planets)
+        rows = self.lookup([planets[name]["longitude"] for name in names] + cusps)
+
+        return {
+            "ayanamsa": "KP",
+            "ayanamsa_value": ayanamsa_value,
+            "planets": [
+                {"planet": name, "is_retrograde": planets[name]["is_retrograde"], **row}
+                for name, row in zip(names, rows)
+            ],
+            "cusps": [
+                {"house": house, **row}
+                for house, row in enumerate(rows[len(names):], start=1)
+            ],
+        }
+
+
+kp_calculator = KPCalculator()
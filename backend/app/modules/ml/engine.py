@@ -1,13 +1,17 @@
 import pickle
+import re
 import json
 import numpy as np
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Tuple
 import lightgbm as lgb
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error, r2_score, accuracy_score
 import shap
 
+from app.modules.yoga.compiler import FeatureMatrix
+from app.modules.yoga.detector import yoga_detector
+
 class MLPredictionEngine:
     """Machine Learning prediction engine using LightGBM"""
     
@@ -58,6 +62,23 @@ class MLPredictionEngine:
         
         return features
     
+    def extract_yoga_features(self, charts: List[Dict]) -> Tuple[List[str], np.ndarray]:
+        """
+        Yoga flags and boolean placement features for many charts at once.
+        
+        Args:
+            charts: dicts with "planets" and "ascendant", as for extract_features
+        
+        Returns:
+            Feature names and an [charts x features] float matrix
+        """
+        matrix = FeatureMatrix([(chart["planets"], chart.get("ascendant", 0.0)) for chart in charts])
+        names, flags = matrix.boolean_features()
+        yogas = yoga_detector.rule_set.detect_batch(matrix)
+        
+        yoga_names = ["yoga_" + re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_") for name in yoga_detector.rule_set.names]
+        return names + yoga_names, np.hstack([flags, yogas]).astype(float)
+    
     def prepare_training_data(self, examples: List[Dict]) -> tuple:
         """Prepare training data from examples"""
         X = []
@@ -0,0 +1,219 @@
+"""
+Muhurta Calculator
+Searches for auspicious windows by intersecting indexed panchang, hora and
+natal-strength intervals and removing inauspicious periods
+"""
+import numpy as np
+import pytz
+from datetime import date
+from typing import Dict, List, Optional
+
+from app.modules.ephemeris.calculator import ephemeris, NAKSHATRAS, TARA_NAMES
+from app.modules.ephemeris.events import BoundaryTable
+from app.modules.ephemeris.tithi import tithi_table
+from app.modules.panchang.calculator import (
+    panchang_calculator, nakshatra_table, karana_table, moon_longitude,
+    KARANA_NAMES, TITHI_FULL_NAMES, VARA_NAMES, VARA_LORDS, NAKSHATRA_SPAN
+)
+from app.modules.muhurta.intervals import IntervalIndex
+
+# Hora lords follow the Chaldean order (slowest to fastest) cyclically
+HORA_SEQUENCE = ["SUN", "VENUS", "MERCURY", "MOON", "SATURN", "JUPITER", "MARS"]
+
+WEEKDAY_NAMES = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"]
+
+# Eighth of the daytime (1-8) occupied by each period, by weekday (Monday first)
+DAYTIME_PERIODS = {
+    "RAHU_KAAL": [2, 7, 5, 6, 4, 3, 8],
+    "YAMAGANDA": [4, 3, 2, 1, 7, 6, 5],
+    "GULIKA": [6, 5, 4, 3, 2, 1, 7],
+}
+AVOIDABLE = list(DAYTIME_PERIODS) + ["VISHTI"]
+DEFAULT_AVOID = list(DAYTIME_PERIODS)
+
+FAVORABLE_TARAS = [2, 4, 6, 8, 9]
+# Transit Moon houses from the natal Moon that give Chandra Bala
+FAVORABLE_CHANDRA_HOUSES = [1, 3, 6, 7, 10, 11]
+
+FAVORABLE_TITHIS = [2, 3, 5, 7, 10, 11, 13]
+BENEFIC_HORA_LORDS = ["JUPITER", "VENUS", "MERCURY", "MOON"]
+
+moon_rasi_table = BoundaryTable(moon_longitude, 30.0, step=0.5)
+
+
+class MuhurtaCalculator:
+    """Search muhurta windows over indexed panchang intervals"""
+
+    def build_index(self,
+                    start_date: date,
+                    days: int,
+                    latitude: float,
+                    longitude: float,
+                    timezone: str = "UTC") -> Dict[str, IntervalIndex]:
+        """
+        Build interval indexes for consecutive Vedic days (sunrise to sunrise).
+
+        Labels: vara = weekday (Monday 0), hora = index into HORA_SEQUENCE,
+        tithi/nakshatra/karana/moon_rasi = 0-based division index.
+        """
+        panchang = panchang_calculator.calculate_range(start_date, days + 1, latitude, longitude, timezone)
+        if any(day["sunrise"] is None or day["sunset"] is None for day in panchang):
+            raise ValueError("Sun does not rise or set on every day at this location")
+
+        sunrises = np.array([ephemeris.get_julian_day(day["sunrise"]) for day in panchang])
+        sunsets = np.array([ephemeris.get_julian_day(day["sunset"]) for day in panchang])
+        weekdays = np.array([day["date"].weekday() for day in panchang[:-1]])
+
+        day_starts, day_ends = sunrises[:-1], sunrises[1:]
+        day_lengths = sunsets[:-1] - day_starts
+        night_lengths = day_ends - sunsets[:-1]
+
+        # 24 horas per day: 12 dividing the daytime, 12 dividing the night
+        parts = np.arange(12)
+        day_horas = day_starts[:, None] + parts * (day_lengths / 12)[:, None]
+        night_horas = sunsets[:-1, None] + parts * (night_lengths / 12)[:, None]
+        hora_starts = np.hstack([day_horas, night_horas]).ravel()
+        hora_ends = np.append(hora_starts[1:], day_ends[-1])
+        first_lords = np.array([HORA_SEQUENCE.index(VARA_LORDS[weekday]) for weekday in weekdays])
+        hora_lords = ((first_lords[:, None] + np.arange(24)) % 7).ravel()
+
+        index = {
+            "vara": IntervalIndex(day_starts, day_ends, weekdays),
+            "hora": IntervalIndex(hora_starts, hora_ends, hora_lords),
+        }
+
+        span_start, span_end = float(day_starts[0]), float(day_ends[-1])
+        tables = {
+            "tithi": tithi_table,
+            "nakshatra": nakshatra_table,
+            "karana": karana_table,
+            "moon_rasi": moon_rasi_table,
+        }
+        for name, table in tables.items():
+            index[name] = IntervalIndex.from_tuples(table.intervals(span_start, span_end))
+
+        for name, parts_by_weekday in DAYTIME_PERIODS.items():
+            eighth = day_lengths / 8
+            part = np.array([parts_by_weekday[weekday] for weekday in weekdays]) - 1
+            starts = day_starts + part * eighth
+            index[name] = IntervalIndex(starts, starts + eighth)
+
+        vishti = [i for i, name in enumerate(KARANA_NAMES) if name == "Vishti"]
+        index["VISHTI"] = index["karana"].select(vishti)
+
+        return index
+
+    def search(self,
+               start_date: date,
+               days: int,
+               latitude: float,
+               longitude: float,
+               timezone: str = "UTC",
+               tithis: Optional[List[int]] = None,
+               nakshatras: Optional[List[int]] = None,
+               weekdays: Optional[List[int]] = None,
+               hora_lords: Optional[List[str]] = None,
+               avoid: Optional[List[str]] = None,
+               natal_moon_longitude: Optional[float] = None,
+               min_duration_minutes: int = 30,
+               limit: int = 20) -> List[Dict]:
+        """
+        Find windows satisfying every constraint, ranked best first.
+
+        Args:
+            tithis: Allowed tithis (1-30)
+            nakshatras: Allowed nakshatras (1-27)
+            weekdays: Allowed weekdays (Monday 0)
+            hora_lords: Allowed hora lords
+            avoid: Periods to exclude (see AVOIDABLE); defaults to DEFAULT_AVOID
+            natal_moon_longitude: When given, require favourable Tara and Chandra Bala
+        """
+        index = self.build_index(start_date, days, latitude, longitude, timezone)
+        windows = index["vara"]
+
+        if weekdays is not None:
+            windows = windows.select(weekdays)
+        if tithis is not None:
+            windows = windows.intersect(index["tithi"].select([t - 1 for t in tithis]))
+        if nakshatras is not None:
+            windows = windows.intersect(index["nakshatra"].select([n - 1 for n in nakshatras]))
+        if hora_lords is not None:
+            windows = windows.intersect(
+                index["hora"].select([HORA_SEQUENCE.index(lord.upper()) for lord in hora_lords])
+            )
+
+        natal_nakshatra = natal_rasi = None
+        if natal_moon_longitude is not None:
+            natal_nakshatra = int(natal_moon_longitude / NAKSHATRA_SPAN)
+            natal_rasi = int(natal_moon_longitude / 30.0)
+            good_nakshatras = [
+                n for n in range(27) if self._tara(n, natal_nakshatra) in FAVORABLE_TARAS
+            ]
+            good_rasis = [
+                r for r in range(12) if (r - natal_rasi) % 12 + 1 in FAVORABLE_CHANDRA_HOUSES
+            ]
+            windows = windows.intersect(index["nakshatra"].select(good_nakshatras))
+            windows = windows.intersect(index["moon_rasi"].select(good_rasis))
+
+        for period in (DEFAULT_AVOID if avoid is None else avoid):
+            windows = windows.subtract(index[period])
+
+        windows = windows.merged()
+        durations = (windows.ends - windows.starts) * 1440.0
+        keep = durations >= min_duration_minutes
+        windows = IntervalIndex(windows.starts[keep], windows.ends[keep], windows.labels[keep])
+
+        tz = pytz.timezone(timezone)
+        results = [
+            self._describe(start, end, index, tz, natal_nakshatra, natal_rasi)
+            for start, end in zip(windows.starts, windows.ends)
+        ]
+        results.sort(key=lambda w: (-w["score"], -w["duration_minutes"], w["start"]))
+
+        return results[:limit]
+
+    def _tara(self, nakshatra: int, natal_nakshatra: int) -> int:
+        """Tara (1-9) of a nakshatra counted from the natal nakshatra"""
+        return (nakshatra - natal_nakshatra) % 27 % 9 + 1
+
+    def _describe(self, start: float, end: float, index: Dict[str, IntervalIndex], tz,
+                  natal_nakshatra: Optional[int], natal_rasi: Optional[int]) -> Dict:
+        """Describe and score a window from the conditions at its start"""
+        tithi = int(index["tithi"].label_at(start)[0]) + 1
+        nakshatra = int(index["nakshatra"].label_at(start)[0])
+        lords = [HORA_SEQUENCE[label] for label in index["hora"].labels_between(start, end)]
+
+        score = 0
+        if (tithi - 1) % 15 + 1 in FAVORABLE_TITHIS and tithi != 30:
+            score += 1
+        if lords[0] in BENEFIC_HORA_LORDS:
+            score += 1
+
+        window = {
+            "start": self._to_local(start, tz),
+            "end": self._to_local(end, tz),
+            "duration_minutes": int(round((end - start) * 1440.0)),
+            "vara": VARA_NAMES[int(index["vara"].label_at(start)[0])],
+            "tithi": TITHI_FULL_NAMES[tithi - 1],
+            "nakshatra": NAKSHATRAS[nakshatra],
+            "hora_lords": lords,
+        }
+
+        if natal_nakshatra is not None:
+            tara = self._tara(nakshatra, natal_nakshatra)
+            rasi = int(index["moon_rasi"].label_at(start)[0])
+            window["tara"] = TARA_NAMES[tara - 1]
+            window["chandra_house"] = (rasi - natal_rasi) % 12 + 1
+            if tara in (2, 8, 9):
+                score += 1
+
+        window["score"] = score
+        return window
+
+    def _to_local(self, jd: float, tz) -> str:
+        """Convert a Julian Day to a local ISO timestamp (minutes)"""
+        local = pytz.utc.localize(ephemeris.get_datetime(jd)).astimezone(tz)
+        return local.isoformat(timespec="minutes")
+
+
+muhurta_calculator = MuhurtaCalculator()
@@ -0,0 +1,95 @@
+"""
+Interval Index
+Sorted, disjoint time intervals (Julian Days) held in numpy arrays, with
+vectorized intersection and subtraction
+"""
+import numpy as np
+from typing import Iterable, List, Tuple
+
+
+class IntervalIndex:
+    """Sorted disjoint [start, end) intervals, each carrying an integer label"""
+
+    def __init__(self, starts, ends, labels=None):
+        self.starts = np.asarray(starts, dtype=float)
+        self.ends = np.asarray(ends, dtype=float)
+        if labels is None:
+            labels = np.zeros(len(self.starts), dtype=np.int64)
+        self.labels = np.asarray(labels, dtype=np.int64)
+
+    @classmethod
+    def from_tuples(cls, intervals: Iterable[Tuple[int, float, float]]) -> "IntervalIndex":
+        """Build from (label, start, end) tuples sorted by start"""
+        intervals = list(intervals)
+        return cls(
+            [interval[1] for interval in intervals],
+            [interval[2] for interval in intervals],
+            [interval[0] for interval in intervals],
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def select(self, labels: Iterable[int]) -> "IntervalIndex":
+        """Keep only intervals whose label is in labels"""
+        mask = np.isin(self.labels, list(labels))
+        return IntervalIndex(self.starts[mask], self.ends[mask], self.labels[mask])
+
+    def merged(self) -> "IntervalIndex":
+        """Merge touching intervals (labels of the first interval of each run are kept)"""
+        if len(self) == 0:
+            return self
+
+        breaks = np.nonzero(self.starts[1:] > self.ends[:-1])[0] + 1
+        run_starts = np.concatenate(([0], breaks))
+        run_ends = np.concatenate((breaks - 1, [len(self) - 1]))
+        return IntervalIndex(self.starts[run_starts], self.ends[run_ends], self.labels[run_starts])
+
+    def intersect(self, other: "IntervalIndex") -> "IntervalIndex":
+        """Intersect with another index; pieces keep this index's labels"""
+        # For each interval here, the other intervals overlapping it form a contiguous run
+        first = np.searchsorted(other.ends, self.starts, side="right")
+        last = np.searchsorted(other.starts, self.ends, side="left")
+        counts = np.maximum(last - first, 0)
+        total = int(counts.sum())
+
+        if total == 0:
+            return IntervalIndex([], [], [])
+
+        own = np.repeat(np.arange(len(self)), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        theirs = np.repeat(first, counts) + offsets
+
+        starts = np.maximum(self.starts[own], other.starts[theirs])
+        ends = np.minimum(self.ends[own], other.ends[theirs])
+        keep = ends > starts
+        return IntervalIndex(starts[keep], ends[keep], self.labels[own][keep])
+
+    def complement(self, start: float, end: float) -> "IntervalIndex":
+        """Gaps between intervals within [start, end)"""
+        merged = self.merged()
+        starts = np.concatenate(([start], merged.ends))
+        ends = np.concatenate((merged.starts, [end]))
+        starts = np.maximum(starts, start)
+        ends = np.minimum(ends, end)
+        keep = ends > starts
+        return IntervalIndex(starts[keep], ends[keep])
+
+    def subtract(self, other: "IntervalIndex") -> "IntervalIndex":
+        """Remove the time covered by another index"""
+        if len(self) == 0 or len(other) == 0:
+            return self
+        return self.intersect(other.complement(self.starts[0], self.ends[-1]))
+
+    def label_at(self, jds) -> np.ndarray:
+        """Label of the interval containing each instant (-1 where none)"""
+        jds = np.atleast_1d(np.asarray(jds, dtype=float))
+        positions = np.searchsorted(self.starts, jds, side="right") - 1
+        inside = (positions >= 0) & (self.ends[np.maximum(positions, 0)] > jds)
+        return np.where(inside, self.labels[np.maximum(positions, 0)], -1)
+
+    def labels_between(self, start: float, end: float) -> List[int]:
+        """Labels of intervals overlapping [start, end), in order"""
+        first = int(np.searchsorted(self.ends, start, side="right"))
+        last = int(np.searchsorted(self.starts, end, side="left"))
+        return [int(label) for label in self.labels[first:last]]
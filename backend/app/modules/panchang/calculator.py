@@ -0,0 +1,195 @@
+"""
+Panchang Calculator
+Five limbs of the day (vara, tithi, nakshatra, yoga, karana) at local sunrise,
+with the instant each limb ends
+"""
+import numpy as np
+import pytz
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Tuple
+
+from app.core.cache import LRUCache
+from app.modules.ephemeris.calculator import ephemeris, NAKSHATRAS
+from app.modules.ephemeris.events import BoundaryTable
+from app.modules.ephemeris.tithi import tithi_table, elongation, TITHI_NAMES
+
+NAKSHATRA_SPAN = 360.0 / 27
+KARANA_SPAN = 6.0
+
+YOGA_NAMES = [
+    "Vishkambha", "Priti", "Ayushman", "Saubhagya", "Shobhana", "Atiganda",
+    "Sukarma", "Dhriti", "Shula", "Ganda", "Vriddhi", "Dhruva",
+    "Vyaghata", "Harshana", "Vajra", "Siddhi", "Vyatipata", "Variyana",
+    "Parigha", "Shiva", "Siddha", "Sadhya", "Shubha", "Shukla",
+    "Brahma", "Indra", "Vaidhriti"
+]
+
+MOVABLE_KARANAS = ["Bava", "Balava", "Kaulava", "Taitila", "Gara", "Vanija", "Vishti"]
+
+# Karanas by half-tithi index 0-59: Kimstughna, eight cycles of the movable
+# karanas, then the fixed Shakuni, Chatushpada and Naga
+KARANA_NAMES = (
+    ["Kimstughna"]
+    + [MOVABLE_KARANAS[i % 7] for i in range(56)]
+    + ["Shakuni", "Chatushpada", "Naga"]
+)
+
+TITHI_FULL_NAMES = (
+    [f"Shukla {name}" for name in TITHI_NAMES]
+    + [f"Krishna {name}" for name in TITHI_NAMES[:14]]
+    + ["Amavasya"]
+)
+
+# Python weekday order (Monday = 0)
+VARA_NAMES = ["Somavara", "Mangalavara", "Budhavara", "Guruvara", "Shukravara", "Shanivara", "Ravivara"]
+VARA_LORDS = ["MOON", "MARS", "MERCURY", "JUPITER", "VENUS", "SATURN", "SUN"]
+
+# Locations are snapped to a grid cell so nearby requests share cache entries
+LOCATION_CELL_DEGREES = 0.1
+
+
+def moon_longitude(jds: np.ndarray) -> np.ndarray:
+    """Sidereal Moon longitude"""
+    return ephemeris.get_longitudes(jds, "MOON")[0]
+
+
+def sun_moon_sum(jds: np.ndarray) -> np.ndarray:
+    """Sum of sidereal Sun and Moon longitudes, mod 360"""
+    return (ephemeris.get_longitudes(jds, "SUN")[0] + ephemeris.get_longitudes(jds, "MOON")[0]) % 360.0
+
+
+nakshatra_table = BoundaryTable(moon_longitude, NAKSHATRA_SPAN, step=0.5)
+yoga_table = BoundaryTable(sun_moon_sum, NAKSHATRA_SPAN, step=0.5)
+karana_table = BoundaryTable(elongation, KARANA_SPAN, step=0.25)
+
+LIMB_TABLES = {
+    "tithi": (tithi_table, TITHI_FULL_NAMES),
+    "nakshatra": (nakshatra_table, NAKSHATRAS),
+    "yoga": (yoga_table, YOGA_NAMES),
+    "karana": (karana_table, KARANA_NAMES),
+}
+
+
+def location_cell(latitude: float, longitude: float) -> Tuple[float, float]:
+    """Snap a location to the centre of its cache grid cell"""
+    def snap(value: float) -> float:
+        return round((np.floor(value / LOCATION_CELL_DEGREES) + 0.5) * LOCATION_CELL_DEGREES, 4)
+
+    return snap(latitude), snap(longitude)
+
+
+class PanchangCalculator:
+    """Calculate daily panchang for a location"""
+
+    def __init__(self, cache_size: int = 20000):
+        self.cache = LRUCache(maxsize=cache_size)
+
+    def calculate_range(self,
+                        start_date: date,
+                        days: int,
+                        latitude: float,
+                        longitude: float,
+                        timezone: str = "UTC") -> List[Dict]:
+        """
+        Calculate panchang for consecutive local dates.
+
+        Days already cached for the location cell are reused; the rest are
+        computed in one batch.
+        """
+        tz = pytz.timezone(timezone)
+        cell = location_cell(latitude, longitude)
+        dates = [start_date + timedelta(days=i) for i in range(days)]
+
+        results = {}
+        missing = []
+        for target_date in dates:
+            cached = self.cache.get((target_date, cell, timezone))
+            if cached is None:
+                missing.append(target_date)
+            else:
+                results[target_date] = cached
+
+        if missing:
+            for day in self._compute_days(missing, cell, tz):
+                results[day["date"]] = day
+                self.cache.set((day["date"], cell, timezone), day)
+
+        return [results[target_date] for target_date in dates]
+
+    def _compute_days(self, dates: List[date], cell: Tuple[float, float], tz) -> List[Dict]:
+        """Compute panchang for a list of local dates at a location cell"""
+        latitude, longitude = cell
+        sunrises = []
+        sunsets = []
+
+        for target_date in dates:
+            midnight = tz.localize(datetime.combine(target_date, time(0, 0)))
+            sunrise, sunset = ephemeris.get_sunrise_sunset(
+                ephemeris.get_julian_day(midnight), latitude, longitude
+            )
+            sunrises.append(sunrise)
+            sunsets.append(sunset)
+
+        # Limbs are taken at sunrise; polar days without one fall back to 06:00
+        reference_jds = np.array([
+            sunrise if sunrise is not None else
+            ephemeris.get_julian_day(tz.localize(datetime.combine(target_date, time(6, 0))))
+            for target_date, sunrise in zip(dates, sunrises)
+        ])
+
+        limbs = {}
+        for limb, (table, names) in LIMB_TABLES.items():
+            intervals = table.intervals(float(reference_jds.min()), float(reference_jds.max()) + 1e-6)
+            starts = np.array([interval[1] for interval in intervals])
+            positions = np.searchsorted(starts, reference_jds, side="right") - 1
+            limbs[limb] = [intervals[pos] for pos in positions]
+
+        days = []
+        for i, target_date in enumerate(dates):
+            weekday = target_date.weekday()
+            day = {
+                "date": target_date,
+                "vara": VARA_NAMES[weekday],
+                "vara_lord": VARA_LORDS[weekday],
+                "sunrise": self._to_local(sunrises[i], tz),
+                "sunset": self._to_local(sunsets[i], tz),
+            }
+            for limb, (table, names) in LIMB_TABLES.items():
+                index, _, end_jd = limbs[limb][i]
+                day[limb] = {
+                    "index": index + 1,
+                    "name": names[index],
+                    "end": self._to_local(end_jd, tz),
+                }
+            days.append(day)
+
+        return days
+
+    def _to_local(self, jd, tz):
+        """Convert a Julian Day to a local datetime (None passes through)"""
+        if jd is None:
+            return None
+        return pytz.utc.localize(ephemeris.get_datetime(jd)).astimezone(tz)
+
+    def to_columns(self, days: List[Dict]) -> Dict:
+        """Pack daily panchang into parallel arrays of indices into names"""
+        def fmt(value):
+            return value.isoformat(timespec="minutes") if value is not None else None
+
+        columns = {
+            "date": [day["date"].isoformat() for day in days],
+            "vara": [day["date"].weekday() for day in days],
+            "sunrise": [fmt(day["sunrise"]) for day in days],
+            "sunset": [fmt(day["sunset"]) for day in days],
+        }
+        for limb in LIMB_TABLES:
+            columns[limb] = [day[limb]["index"] - 1 for day in days]
+            columns[f"{limb}_end"] = [fmt(day[limb]["end"]) for day in days]
+
+        names = {limb: names for limb, (table, names) in LIMB_TABLES.items()}
+        names["vara"] = VARA_NAMES
+
+        return {"columns": columns, "names": names}
+
+
+panchang_calculator = PanchangCalculator()
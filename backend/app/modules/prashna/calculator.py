@@ -0,0 +1,89 @@
+"""
+Prashna Calculator
+Charts for the current moment, cached in memory per UTC minute and location
+cell instead of being stored as natal charts
+"""
+from datetime import datetime, timezone
+from typing import Dict
+
+from app.core.cache import LRUCache
+from app.modules.ephemeris.calculator import EphemerisCalculator, AYANAMSA_MAP
+from app.modules.charts.calculator import chart_calculator
+from app.modules.panchang.calculator import location_cell
+
+
+class PrashnaCalculator:
+    """Calculate Prashna (horary) charts from shared per-minute planet snapshots"""
+
+    def __init__(self, cache_size: int = 4096, snapshot_cache_size: int = 256):
+        self.charts = LRUCache(maxsize=cache_size)
+        self.snapshots = LRUCache(maxsize=snapshot_cache_size)
+        self.ephemerides = {name: EphemerisCalculator(name) for name in AYANAMSA_MAP}
+
+    def calculate(self, moment: datetime, latitude: float, longitude: float, ayanamsa: str = "LAHIRI") -> Dict:
+        """
+        Get the Prashna chart for a moment and location.
+
+        The moment is truncated to the UTC minute and the location snapped to
+        its cache cell, so every request in the same minute and cell shares
+        one chart; only the houses depend on the location.
+        """
+        if ayanamsa not in self.ephemerides:
+            raise ValueError(f"Unknown ayanamsa: {ayanamsa}")
+
+        minute = self._utc_minute(moment)
+        cell = location_cell(latitude, longitude)
+        key = (minute, cell, ayanamsa)
+
+        chart = self.charts.get(key)
+        if chart is not None:
+            return chart
+
+        snapshot = self.planet_snapshot(minute, ayanamsa)
+        houses = chart_calculator.calculate_houses(snapshot["julian_day"], cell[0], cell[1], snapshot["ayanamsa_value"])
+        ascendant_rasi = int(houses["ascendant"] / 30.0) + 1
+
+        chart = {
+            "moment": minute.isoformat(),
+            "latitude": cell[0],
+            "longitude": cell[1],
+            "ayanamsa": ayanamsa,
+            **snapshot,
+            **houses,
+            "ascendant_rasi": ascendant_rasi,
+            "planet_houses": {
+                planet: (pos["rasi"] - ascendant_rasi) % 12 + 1
+                for planet, pos in snapshot["planets"].items()
+            },
+        }
+        self.charts.set(key, chart)
+        return chart
+
+    def planet_snapshot(self, minute: datetime, ayanamsa: str) -> Dict:
+        """Get planetary positions and divisional charts shared by every location in a minute"""
+        key = (minute, ayanamsa)
+        snapshot = self.snapshots.get(key)
+        if snapshot is not None:
+            return snapshot
+
+        calculator = self.ephemerides[ayanamsa]
+        jd = calculator.get_julian_day(minute)
+        planets = chart_calculator.describe_planets(calculator.get_all_planets(jd))
+
+        snapshot = {
+            "julian_day": jd,
+            "ayanamsa_value": calculator.get_ayanamsa(jd),
+            "planets": planets,
+            "divisional_charts": chart_calculator.div_calculator.calculate_all_divisions(planets),
+        }
+        self.snapshots.set(key, snapshot)
+        return snapshot
+
+    def _utc_minute(self, moment: datetime) -> datetime:
+        """Truncate a moment to the minute as a naive UTC datetime"""
+        if moment.tzinfo is not None:
+            moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+        return moment.replace(second=0, microsecond=0)
+
+
+prashna_calculator = PrashnaCalculator()
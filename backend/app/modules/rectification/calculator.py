@@ -0,0 +1,136 @@
+"""
+Rectification Calculator
+Sweeps a birth time window and finds the exact instants where the chart
+features used for rectification change
+"""
+import numpy as np
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from app.modules.ephemeris.calculator import ephemeris
+from app.modules.charts.calculator import chart_calculator
+from app.modules.dasha.calculator import VimshottariDasha
+
+# Features that define a chart variant, in output order
+VARIANT_FIELDS = [
+    "ascendant_rasi", "d9_ascendant", "d10_ascendant",
+    "moon_nakshatra", "moon_pada", "maha_dasha", "antar_dasha"
+]
+
+# Change instants are bisected to this precision (minutes)
+BISECTION_PRECISION = 1.0 / 60.0
+
+
+class RectificationCalculator:
+    """Find distinct chart variants across a birth time window"""
+
+    def chart_features(self, birth_dt: datetime, lat: float, lon: float, reference: datetime) -> Dict:
+        """Rectification features of the chart cast for one birth instant"""
+        jd = ephemeris.get_julian_day(birth_dt)
+        ascendant = (ephemeris.get_houses(jd, lat, lon)[0] - ephemeris.get_ayanamsa(jd)) % 360.0
+        moon = ephemeris.get_planet_position(jd, "MOON")["longitude"]
+        nakshatra, pada = ephemeris.get_nakshatra(moon)
+        maha, antar = self._running_dasha(birth_dt, moon, reference)
+
+        return {
+            "ascendant_rasi": ephemeris.get_rasi(ascendant),
+            "d9_ascendant": chart_calculator.div_calculator.calculate_divisional_position(ascendant, 9),
+            "d10_ascendant": chart_calculator.div_calculator.calculate_divisional_position(ascendant, 10),
+            "moon_nakshatra": nakshatra,
+            "moon_pada": pada,
+            "maha_dasha": maha,
+            "antar_dasha": antar,
+        }
+
+    def _running_dasha(self, birth_dt: datetime, moon_longitude: float, reference: datetime):
+        """Vimshottari Maha and Antar dasha lords running at the reference date"""
+        vimshottari = VimshottariDasha(birth_dt, moon_longitude)
+
+        for maha in vimshottari.calculate_maha_dashas(120):
+            if maha["start_date"] <= reference < maha["end_date"]:
+                for antar in vimshottari.calculate_antar_dashas(maha):
+                    if antar["start_date"] <= reference < antar["end_date"]:
+                        return maha["lord"], antar["lord"]
+                return maha["lord"], None
+
+        return None, None
+
+    def scan(self,
+             birth_dt: datetime,
+             lat: float,
+             lon: float,
+             window_minutes: int = 120,
+             reference: Optional[datetime] = None,
+             step_minutes: float = 1.0) -> Dict:
+        """
+        Find every change of the variant fields within +/- window_minutes of birth_dt.
+
+        Features are sampled every step_minutes; each field that differs between
+        neighbouring samples is bisected to the second, so the cost is a few
+        hundred cheap evaluations instead of one full chart per minute.
+        """
+        reference = reference or datetime.utcnow()
+
+        def features(offset: float) -> Dict:
+            return self.chart_features(birth_dt + timedelta(minutes=offset), lat, lon, reference)
+
+        offsets = np.arange(-window_minutes, window_minutes + step_minutes / 2, step_minutes).tolist()
+        samples = [features(offset) for offset in offsets]
+
+        changes = []
+        for i in range(len(offsets) - 1):
+            for field in VARIANT_FIELDS:
+                if samples[i][field] != samples[i + 1][field]:
+                    changes.append(self._bisect(features, field, offsets[i], offsets[i + 1], samples[i][field]))
+
+        changes.sort(key=lambda change: change["offset_minutes"])
+
+        boundaries = [offsets[0]]
+        for change in changes:
+            if change["offset_minutes"] > boundaries[-1]:
+                boundaries.append(change["offset_minutes"])
+        boundaries.append(offsets[-1])
+
+        variants = []
+        for start, end in zip(boundaries, boundaries[1:]):
+            variant = features((start + end) / 2)
+            variants.append({
+                "start": (birth_dt + timedelta(minutes=start)).isoformat(timespec="seconds"),
+                "end": (birth_dt + timedelta(minutes=end)).isoformat(timespec="seconds"),
+                "start_offset_minutes": round(start, 2),
+                "end_offset_minutes": round(end, 2),
+                "duration_minutes": round(end - start, 2),
+                "contains_recorded_time": start <= 0 < end,
+                **variant,
+            })
+
+        for change in changes:
+            change["time"] = (birth_dt + timedelta(minutes=change["offset_minutes"])).isoformat(timespec="seconds")
+            change["offset_minutes"] = round(change["offset_minutes"], 2)
+
+        return {
+            "birth_time": birth_dt.isoformat(),
+            "window_minutes": window_minutes,
+            "reference_date": reference.date().isoformat(),
+            "changes": changes,
+            "variants": variants,
+        }
+
+    def _bisect(self, features, field: str, low: float, high: float, low_value) -> Dict:
+        """Locate the instant a single field changes between two offsets"""
+        while high - low > BISECTION_PRECISION:
+            middle = (low + high) / 2
+            if features(middle)[field] == low_value:
+                low = middle
+            else:
+                high = middle
+
+        return {
+            "field": field,
+            "offset_minutes": high,
+            "from": low_value,
+            "to": features(high)[field],
+        }
+
+
+rectification_calculator = RectificationCalculator()
@@ -1,5 +1,24 @@
 from typing import Dict, List
 import math
+import numpy as np
+
+SHADBALA_PLANETS = ["SUN", "MOON", "MARS", "MERCURY", "JUPITER", "VENUS", "SATURN"]
+# Planets whose aspects count for Drik Bala
+DRIK_PLANETS = SHADBALA_PLANETS + ["RAHU", "KETU"]
+
+def round2(values) -> np.ndarray:
+    """
+    Round an array to 2 decimals exactly as Python's round() does.
+    np.round scales by 100 first, which can tip values within float error
+    of a half-cent the other way; those few are rounded one by one.
+    """
+    values = np.asarray(values, dtype=float)
+    rounded = np.round(values, 2)
+    scaled = values * 100.0
+    ties = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if ties.any():
+        rounded[ties] = [round(value, 2) for value in values[ties].tolist()]
+    return rounded
 
 class StrengthCalculator:
     """Calculate Shadbala, Bhavabala, and other planetary strength systems"""
@@ -18,6 +37,56 @@ class StrengthCalculator:
     
     # Debilitation is 180 degrees opposite
     
+    # Simplified Saptavargaja Bala by D1 dignity
+    VARGA_DIGNITY_SCORES = {
+        "Exalted": 45.0,
+        "Own": 30.0,
+        "Friend": 22.5,
+        "Neutral": 15.0,
+        "Enemy": 7.5,
+        "Debilitated": 3.75
+    }
+    
+    # Houses of directional strength
+    DIG_BALA_HOUSES = {
+        "SUN": 10,    # 10th house (South)
+        "MOON": 4,    # 4th house (North)
+        "MARS": 10,   # 10th house (South)
+        "MERCURY": 1, # 1st house (East)
+        "JUPITER": 1, # 1st house (East)
+        "VENUS": 4,   # 4th house (North)
+        "SATURN": 7   # 7th house (West)
+    }
+    
+    NAISARGIKA_BALA = {
+        "SUN": 60.0,
+        "MOON": 51.43,
+        "MARS": 17.14,
+        "MERCURY": 25.7,
+        "JUPITER": 34.28,
+        "VENUS": 42.86,
+        "SATURN": 8.57
+    }
+    
+    DRIK_BENEFICS = ["JUPITER", "VENUS", "MERCURY", "MOON"]
+    DRIK_MALEFICS = ["SUN", "MARS", "SATURN", "RAHU", "KETU"]
+    
+    def __init__(self):
+        planets = SHADBALA_PLANETS
+        self.exaltation_points = np.array([self.EXALTATION_POINTS[p] for p in planets], dtype=float)
+        self.dig_bala_houses = np.array([self.DIG_BALA_HOUSES[p] for p in planets])
+        self.naisargika_bala = round2([self.NAISARGIKA_BALA[p] for p in planets])
+        self.required_rupas = np.array([self.REQUIRED_STRENGTHS[p] for p in planets]) / 60.0
+        # Drekkana (0-2) in which each planet gets the full 15
+        self.strong_drekkana = np.array([
+            0 if p in ["SUN", "MARS", "JUPITER"] else 1 if p in ["MOON", "VENUS"] else 2 for p in planets
+        ])
+        self.uses_chesta = np.array([p not in ["SUN", "MOON"] for p in planets])
+        # Aspect weight of each Drik planet (+15 benefic, -15 malefic)
+        self.drik_weights = np.array([
+            15.0 if p in self.DRIK_BENEFICS else -15.0 if p in self.DRIK_MALEFICS else 0.0 for p in DRIK_PLANETS
+        ])
+    
     def calculate_sthana_bala(self, planet: str, longitude: float, rasi: int, dignity: str) -> Dict:
         """Calculate Positional Strength (Sthana Bala)"""
         
@@ -65,30 +134,12 @@ class StrengthCalculator:
     
     def _calculate_varga_strength(self, dignity: str) -> float:
         """Calculate simplified varga strength based on dignity"""
-        dignity_scores = {
-            "Exalted": 45.0,
-            "Own": 30.0,
-            "Friend": 22.5,
-            "Neutral": 15.0,
-            "Enemy": 7.5,
-            "Debilitated": 3.75
-        }
-        return dignity_scores.get(dignity, 15.0)
+        return self.VARGA_DIGNITY_SCORES.get(dignity, 15.0)
     
     def calculate_dig_bala(self, planet: str, rasi: int) -> float:
         """Calculate Directional Strength (Dig Bala) - max 60"""
         # Planets are strong in specific directions/houses
-        dig_strength_houses = {
-            "SUN": 10,    # 10th house (South)
-            "MOON": 4,    # 4th house (North)
-            "MARS": 10,   # 10th house (South)
-            "MERCURY": 1, # 1st house (East)
-            "JUPITER": 1, # 1st house (East)
-            "VENUS": 4,   # 4th house (North)
-            "SATURN": 7   # 7th house (West)
-        }
-        
-        strong_house = dig_strength_houses.get(planet, 1)
+        strong_house = self.DIG_BALA_HOUSES.get(planet, 1)
         diff = abs(rasi - strong_house)
         if diff > 6:
             diff = 12 - diff
@@ -146,22 +197,13 @@ class StrengthCalculator:
     
     def calculate_naisargika_bala(self, planet: str) -> float:
         """Calculate Natural Strength (Naisargika Bala) - fixed values"""
-        natural_strengths = {
-            "SUN": 60.0,
-            "MOON": 51.43,
-            "MARS": 17.14,
-            "MERCURY": 25.7,
-            "JUPITER": 34.28,
-            "VENUS": 42.86,
-            "SATURN": 8.57
-        }
-        return round(natural_strengths.get(planet, 0), 2)
+        return round(self.NAISARGIKA_BALA.get(planet, 0), 2)
     
     def calculate_drik_bala(self, planet: str, planets: Dict) -> float:
         """Calculate Aspectual Strength (Drik Bala)"""
         # Simplified: based on benefic/malefic aspects
-        benefics = ["JUPITER", "VENUS", "MERCURY", "MOON"]
-        malefics = ["SUN", "MARS", "SATURN", "RAHU", "KETU"]
+        benefics = self.DRIK_BENEFICS
+        malefics = self.DRIK_MALEFICS
         
         planet_rasi = planets[planet]["rasi"]
         aspect_strength = 0.0
@@ -182,8 +224,113 @@ class StrengthCalculator:
         
         return round(max(-60, min(60, aspect_strength)), 2)
     
+    def planet_arrays(self, charts: List[Dict]) -> Dict[str, np.ndarray]:
+        """
+        Pack the planets of many charts into arrays.
+        
+        Args:
+            charts: {planet: {"longitude", "rasi", "dignity", "is_retrograde"}}
+                per chart, as passed to calculate_shadbala
+        
+        Returns:
+            "present" [charts x 7] and "drik_present" [charts x 9] masks,
+            "longitude", "rasi", "varga_bala" and "is_retrograde" [charts x 7]
+            and "drik_rasi" [charts x 9], with calculate_shadbala's defaults
+            for missing fields
+        """
+        count = len(charts)
+        arrays = {
+            "present": np.zeros((count, len(SHADBALA_PLANETS)), dtype=bool),
+            "longitude": np.zeros((count, len(SHADBALA_PLANETS))),
+            "rasi": np.ones((count, len(SHADBALA_PLANETS)), dtype=np.int64),
+            "varga_bala": np.full((count, len(SHADBALA_PLANETS)), 15.0),
+            "is_retrograde": np.zeros((count, len(SHADBALA_PLANETS)), dtype=bool),
+            "drik_present": np.zeros((count, len(DRIK_PLANETS)), dtype=bool),
+            "drik_rasi": np.zeros((count, len(DRIK_PLANETS)), dtype=np.int64),
+        }
+        
+        for i, planets in enumerate(charts):
+            for j, planet in enumerate(DRIK_PLANETS):
+                pos = planets.get(planet)
+                if pos is None:
+                    continue
+                arrays["drik_present"][i, j] = True
+                arrays["drik_rasi"][i, j] = pos.get("rasi", 0)
+                if j < len(SHADBALA_PLANETS):
+                    arrays["present"][i, j] = True
+                    arrays["longitude"][i, j] = pos.get("longitude", 0)
+                    arrays["rasi"][i, j] = pos.get("rasi", 1)
+                    arrays["varga_bala"][i, j] = self._calculate_varga_strength(pos.get("dignity", "Neutral"))
+                    arrays["is_retrograde"][i, j] = pos.get("is_retrograde", False)
+        
+        return arrays
+    
+    def calculate_shadbala_batch(self, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Calculate Shadbala for many charts at once.
+        
+        Args:
+            arrays: output of planet_arrays
+        
+        Returns:
+            [charts x 7] arrays, in SHADBALA_PLANETS order, of every component
+            and total that calculate_shadbala reports, rounded the same way.
+            Cells of absent planets are not meaningful; see "present".
+        """
+        longitude, rasi = arrays["longitude"], arrays["rasi"]
+        
+        # Sthana Bala
+        diff = np.abs(longitude - self.exaltation_points)
+        diff = np.where(diff > 180, 360 - diff, diff)
+        uccha = (180 - diff) / 3.0
+        varga = arrays["varga_bala"]
+        ojha = np.where(rasi % 2 == 1, 15.0, 7.5)
+        kendra = np.where(np.isin(rasi, [1, 4, 7, 10]), 60.0, np.where(np.isin(rasi, [2, 5, 8, 11]), 30.0, 15.0))
+        drekkana = np.minimum((longitude % 30.0) // 10, 2).astype(np.int64)
+        drek = np.where(drekkana == self.strong_drekkana, 15.0, 7.5)
+        sthana = round2(uccha + varga + ojha + kendra + drek)
+        
+        # Dig Bala
+        diff = np.abs(rasi - self.dig_bala_houses)
+        diff = np.where(diff > 6, 12 - diff, diff)
+        dig = np.maximum(0, (6 - diff) * 10.0)
+        
+        # Kala Bala is not time dependent in calculate_kala_bala
+        kala = np.array([self.calculate_kala_bala(p, 0.0)["total"] for p in SHADBALA_PLANETS])
+        kala = np.broadcast_to(kala, rasi.shape)
+        
+        chesta = np.where(self.uses_chesta & arrays["is_retrograde"], 60.0, 30.0)
+        naisargika = np.broadcast_to(self.naisargika_bala, rasi.shape)
+        
+        # Drik Bala: 5th, 7th and 9th sign aspects (plain rasi difference)
+        separation = np.abs(rasi[:, :, None] - arrays["drik_rasi"][:, None, :])
+        aspects = np.isin(separation, [4, 6, 8]) & arrays["drik_present"][:, None, :]
+        drik = np.clip((aspects * self.drik_weights).sum(axis=2), -60, 60)
+        
+        total = sthana + dig + kala + chesta + naisargika + drik
+        rupas = total / 60.0
+        
+        return {
+            "present": arrays["present"],
+            "uccha_bala": round2(uccha),
+            "saptavargaja_bala": varga,
+            "ojhayugma_bala": ojha,
+            "kendradi_bala": kendra,
+            "drekkana_bala": drek,
+            "sthana_bala": sthana,
+            "dig_bala": dig,
+            "kala_bala": kala,
+            "chesta_bala": chesta,
+            "naisargika_bala": naisargika,
+            "drik_bala": drik,
+            "total_shashtiamsas": round2(total),
+            "total_rupas": round2(rupas),
+            "strength_ratio": round2(rupas / self.required_rupas),
+            "is_strong": rupas >= self.required_rupas
+        }
+    
     def calculate_shadbala(self, planets: Dict, jd: float) -> Dict:
-        """Calculate complete Shadbala for all planets"""
+        """Calculate complete Shadbala for all planets (see calculate_shadbala_batch for many charts)"""
         shadbala = {}
         
         for planet in ["SUN", "MOON", "MARS", "MERCURY", "JUPITER", "VENUS", "SATURN"]:
@@ -224,6 +371,14 @@ class StrengthCalculator:
         
         return shadbala
     
+    def calculate_bhavabala_batch(self, count: int) -> np.ndarray:
+        """
+        Bhavabala totals [charts x 12]. calculate_bhavabala depends only on
+        the house number, so every chart shares one row.
+        """
+        bhavabala = self.calculate_bhavabala([])
+        return np.tile([bhavabala[house]["total"] for house in range(1, 13)], (count, 1))
+    
     def calculate_bhavabala(self, house_cusps: List[float]) -> Dict:
         """Calculate House Strength (Bhava Bala)"""
         if not house_cusps or len(house_cusps) < 12:
@@ -0,0 +1,152 @@
+"""
+Strength Store
+Shadbala, Bhavabala, Vargabala, Ishtakashta and Avasthas persisted as
+Strength rows per natal chart and engine version, computed once when a
+chart is created (or first used) and served from an in-process cache.
+Charts stored with an older engine version are recomputed in the background.
+"""
+from typing import Dict, List
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.database import SessionLocal
+from app.models.chart import NatalChart, PlanetaryPosition, DivisionalChart
+from app.models.strength import Strength
+from app.modules.strength.calculator import strength_calculator
+
+# Bump whenever StrengthCalculator results change; stored results of other
+# versions are recomputed
+STRENGTH_ENGINE_VERSION = "1"
+
+# Charts per batch, kept under SQLite's bound parameter limit
+BATCH_SIZE = 500
+
+# strength_type -> (row key, component giving the row's value)
+STRENGTH_TYPES = {
+    "shadbala": ("planet", "total"),
+    "bhavabala": ("house", "total"),
+    "vargabala": ("planet", "total_score"),
+    "ishtakashta": ("planet", "net_effect"),
+    "avasthas": ("planet", "strength_modifier"),
+}
+
+
+class StrengthStore:
+    """Persist and serve strength results per chart"""
+
+    def __init__(self, version: str = STRENGTH_ENGINE_VERSION):
+        self.version = version
+        self._results = LRUCache(maxsize=512)
+
+    def compute(self, db: Session, chart: NatalChart) -> Dict[str, Dict]:
+        """All strength results of a chart, keyed by strength type"""
+        planets = {pos.planet: {
+            "longitude": pos.longitude,
+            "rasi": pos.rasi,
+            "is_retrograde": bool(pos.is_retrograde),
+            "dignity": pos.dignity,
+            "is_combust": bool(pos.is_combust)
+        } for pos in db.query(PlanetaryPosition).filter(PlanetaryPosition.natal_chart_id == chart.id)}
+
+        divisional = {
+            dc.division: dc.planetary_positions
+            for dc in db.query(DivisionalChart).filter(DivisionalChart.natal_chart_id == chart.id)
+        }
+
+        return {
+            "shadbala": strength_calculator.calculate_shadbala(planets, chart.julian_day),
+            "bhavabala": strength_calculator.calculate_bhavabala(chart.house_cusps),
+            "vargabala": strength_calculator.calculate_vargabala(divisional),
+            "ishtakashta": strength_calculator.calculate_ishtakashta(planets),
+            "avasthas": strength_calculator.calculate_avasthas(planets),
+        }
+
+    def store_charts(self, db: Session, charts: List[NatalChart]) -> int:
+        """Replace the stored strengths of charts with the current engine's"""
+        if not charts:
+            return 0
+
+        # Sessions do not autoflush; positions of a new chart may be pending
+        db.flush()
+        db.query(Strength).filter(
+            Strength.natal_chart_id.in_([chart.id for chart in charts])
+        ).delete(synchronize_session=False)
+
+        for chart in charts:
+            results = self.compute(db, chart)
+            for strength_type, (key, value_field) in STRENGTH_TYPES.items():
+                for name, components in results[strength_type].items():
+                    db.add(Strength(
+                        natal_chart_id=chart.id,
+                        strength_type=strength_type,
+                        planet=name if key == "planet" else None,
+                        house=name if key == "house" else None,
+                        value=components.get(value_field),
+                        components=components,
+                        engine_version=self.version
+                    ))
+            chart.strength_engine_version = self.version
+            self._results.set((chart.chart_hash, self.version), results)
+
+        db.commit()
+        return len(charts)
+
+    def load(self, db: Session, chart: NatalChart) -> Dict[str, Dict]:
+        """Stored strength results of a chart, in calculation order"""
+        results: Dict[str, Dict] = {strength_type: {} for strength_type in STRENGTH_TYPES}
+        for row in db.query(Strength).filter(
+            Strength.natal_chart_id == chart.id,
+            Strength.engine_version == self.version
+        ).order_by(Strength.id):
+            key = row.planet if STRENGTH_TYPES[row.strength_type][0] == "planet" else row.house
+            results[row.strength_type][key] = row.components
+        return results
+
+    def get(self, db: Session, chart: NatalChart) -> Dict[str, Dict]:
+        """
+        Strength results of a chart: from the cache, else from the database,
+        else computed and stored now
+        """
+        key = (chart.chart_hash, self.version)
+        results = self._results.get(key)
+        if results is not None:
+            return results
+
+        if chart.strength_engine_version != self.version:
+            self.store_charts(db, [chart])
+            return self._results.get(key)
+
+        results = self.load(db, chart)
+        self._results.set(key, results)
+        return results
+
+    def refresh(self, db: Session) -> int:
+        """Recompute every chart stored with another engine version"""
+        chart_ids = [row[0] for row in db.query(NatalChart.id).filter(
+            NatalChart.strength_engine_version.isnot(None),
+            NatalChart.strength_engine_version != self.version
+        ).order_by(NatalChart.id)]
+
+        for start in range(0, len(chart_ids), BATCH_SIZE):
+            self.store_charts(db, db.query(NatalChart).filter(
+                NatalChart.id.in_(chart_ids[start:start + BATCH_SIZE])
+            ).all())
+
+        return len(chart_ids)
+
+    def refresh_in_background(self):
+        """refresh with its own session, for a startup thread"""
+        db = SessionLocal()
+        try:
+            count = self.refresh(db)
+            if count:
+                print(f"Strength store: recomputed {count} charts for engine {self.version}")
+        except Exception as e:
+            print(f"Strength store refresh error: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+
+strength_store = StrengthStore()
@@ -0,0 +1,132 @@
+"""
+Synastry Calculator
+Cross-chart aspects, house overlays and nakshatra relationships computed as
+array operations over one chart against one or many others
+"""
+import numpy as np
+from typing import Dict, List, Tuple
+
+from app.modules.ephemeris.calculator import TARA_NAMES
+
+SYNASTRY_POINTS = ["ASCENDANT", "SUN", "MOON", "MARS", "MERCURY", "JUPITER", "VENUS", "SATURN", "RAHU", "KETU"]
+MOON = SYNASTRY_POINTS.index("MOON")
+
+# (name, angle, orb, weight) - weight is the aspect's contribution to the harmony score
+ASPECTS = [
+    ("CONJUNCTION", 0.0, 8.0, 1.0),
+    ("SEXTILE", 60.0, 4.0, 0.5),
+    ("SQUARE", 90.0, 6.0, -0.75),
+    ("TRINE", 120.0, 7.0, 0.75),
+    ("OPPOSITION", 180.0, 8.0, -0.5),
+]
+ASPECT_ANGLES = np.array([aspect[1] for aspect in ASPECTS])
+ASPECT_ORBS = np.array([aspect[2] for aspect in ASPECTS])
+ASPECT_WEIGHTS = np.array([aspect[3] for aspect in ASPECTS])
+
+NAKSHATRA_SPAN = 40.0 / 3.0
+
+
+class SynastryCalculator:
+    """Compare a chart against one or many charts"""
+
+    def chart_vector(self, ascendant: float, planets: Dict[str, float]) -> np.ndarray:
+        """Arrange a chart's sidereal longitudes in SYNASTRY_POINTS order"""
+        return np.array([ascendant] + [planets[point] for point in SYNASTRY_POINTS[1:]])
+
+    def aspect_matrix(self, chart: np.ndarray, others: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the closest aspect between every point of chart and every point of others.
+
+        Args:
+            chart: (P,) longitudes
+            others: (P,) or (N, P) longitudes
+
+        Returns:
+            (kind, strength), both (N, P, P) indexed [other, chart point, other point];
+            kind is an index into ASPECTS or -1, strength is 1 at exact and 0 at the orb
+        """
+        others = np.atleast_2d(others)
+        separation = np.abs((others[:, None, :] - chart[None, :, None] + 180.0) % 360.0 - 180.0)
+        deviation = np.abs(separation[..., None] - ASPECT_ANGLES) / ASPECT_ORBS
+
+        kind = deviation.argmin(axis=-1)
+        strength = 1.0 - np.take_along_axis(deviation, kind[..., None], axis=-1)[..., 0]
+        within = strength > 0
+
+        return np.where(within, kind, -1), np.where(within, strength, 0.0)
+
+    def overlays(self, chart: np.ndarray, others: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get whole-sign house overlays in both directions.
+
+        Returns:
+            (others_in_chart, chart_in_others), both (N, P): the house each point
+            falls in counted from the other chart's ascendant sign
+        """
+        others = np.atleast_2d(others)
+        chart_signs = (chart // 30.0).astype(int)
+        other_signs = (others // 30.0).astype(int)
+
+        others_in_chart = (other_signs - chart_signs[0]) % 12 + 1
+        chart_in_others = (chart_signs[None, :] - other_signs[:, :1]) % 12 + 1
+        return others_in_chart, chart_in_others
+
+    def tara_matrix(self, chart: np.ndarray, others: np.ndarray) -> np.ndarray:
+        """Get the tara (1-9) of every other point counted from every chart point, (N, P, P)"""
+        others = np.atleast_2d(others)
+        chart_nakshatras = (chart // NAKSHATRA_SPAN).astype(int)
+        other_nakshatras = (others // NAKSHATRA_SPAN).astype(int)
+        return (other_nakshatras[:, None, :] - chart_nakshatras[None, :, None]) % 27 % 9 + 1
+
+    def score(self, chart: np.ndarray, others: np.ndarray) -> np.ndarray:
+        """Get the harmony score of chart against each of others, (N,)"""
+        kind, strength = self.aspect_matrix(chart, others)
+        return (strength * ASPECT_WEIGHTS[kind]).sum(axis=(1, 2))
+
+    def rank(self, chart: np.ndarray, others: np.ndarray, limit: int = 10) -> List[Tuple[int, float]]:
+        """Get (index, score) of the best matching others, best first"""
+        scores = self.score(chart, others)
+        order = np.argsort(-scores, kind="stable")[:limit]
+        return [(int(i), round(float(scores[i]), 3)) for i in order]
+
+    def compare(self, chart: np.ndarray, other: np.ndarray, limit: int = 20) -> Dict:
+        """Full synastry between two charts with the strongest contacts first"""
+        kind, strength = self.aspect_matrix(chart, other)
+        kind, strength = kind[0], strength[0]
+        others_in_chart, chart_in_other = self.overlays(chart, other)
+        taras = self.tara_matrix(chart, other)[0]
+
+        contacts = []
+        for flat in np.argsort(-strength, axis=None, kind="stable")[:limit]:
+            i, j = np.unravel_index(flat, strength.shape)
+            if kind[i, j] < 0:
+                break
+            contacts.append({
+                "point1": SYNASTRY_POINTS[i],
+                "point2": SYNASTRY_POINTS[j],
+                "aspect": ASPECTS[kind[i, j]][0],
+                "orb": round(float((1.0 - strength[i, j]) * ASPECT_ORBS[kind[i, j]]), 2),
+                "strength": round(float(strength[i, j]), 3),
+            })
+
+        return {
+            "score": round(float((strength * ASPECT_WEIGHTS[kind]).sum()), 3),
+            "contacts": contacts,
+            "overlays": {
+                "profile2_in_profile1": dict(zip(SYNASTRY_POINTS[1:], others_in_chart[0, 1:].tolist())),
+                "profile1_in_profile2": dict(zip(SYNASTRY_POINTS[1:], chart_in_other[0, 1:].tolist())),
+            },
+            "nakshatra": {
+                "moon_tara_1_to_2": TARA_NAMES[taras[MOON, MOON] - 1],
+                "moon_tara_2_to_1": TARA_NAMES[self.tara_matrix(other, chart)[0, MOON, MOON] - 1],
+                "janma_pairs": [
+                    {"point1": SYNASTRY_POINTS[i], "point2": SYNASTRY_POINTS[j]}
+                    for i, j in zip(*np.nonzero(
+                        (chart // NAKSHATRA_SPAN)[:, None] == (other // NAKSHATRA_SPAN)[None, :]
+                    ))
+                ],
+            },
+        }
+
+
+synastry_calculator = SynastryCalculator()
@@ -0,0 +1,149 @@
+"""
+Transit Calculator
+Lifetime transit timelines derived from exact sign ingress tables
+"""
+import numpy as np
+from typing import Dict, List, Optional
+
+from app.modules.ephemeris.calculator import ephemeris
+from app.modules.ephemeris.events import find_level_crossings
+from app.modules.transits.ingress import ingress_table, INGRESS_STEPS
+
+# Saturn's house from the natal Moon (0 = same sign) -> (period, phase)
+SATURN_MOON_PHASES = {
+    11: ("sade_sati", "rising"),
+    0: ("sade_sati", "peak"),
+    1: ("sade_sati", "setting"),
+    3: ("dhaiya", "dhaiya"),
+    7: ("dhaiya", "kantaka"),
+}
+
+# Retrograde exits shorter than this are treated as part of the same period
+MAX_RETROGRADE_GAP_DAYS = 400.0
+
+
+class TransitCalculator:
+    """Calculate transit timelines over a lifetime"""
+
+    def saturn_moon_timeline(self, natal_moon_rasi: int, jd_start: float, jd_end: float) -> Dict:
+        """
+        Get every Sade Sati and Dhaiya/Kantaka period between two Julian Days.
+
+        Each Saturn sign interval comes straight from the ingress table, so
+        retrograde re-entries appear as separate passes within one period.
+        """
+        periods = {"sade_sati": [], "dhaiya": []}
+
+        for rasi_index, start, end in ingress_table("SATURN").intervals(jd_start, jd_end):
+            phase = SATURN_MOON_PHASES.get((rasi_index + 1 - natal_moon_rasi) % 12)
+            if phase is None:
+                continue
+
+            kind, name = phase
+            groups = periods[kind]
+            if not groups or start - groups[-1]["end_jd"] > MAX_RETROGRADE_GAP_DAYS:
+                groups.append({"start_jd": start, "end_jd": end, "phases": []})
+
+            group = groups[-1]
+            group["end_jd"] = end
+            group["phases"].append({
+                "phase": name,
+                "saturn_rasi": rasi_index + 1,
+                "start": ephemeris.get_datetime(start).isoformat(),
+                "end": ephemeris.get_datetime(end).isoformat(),
+            })
+
+        return {
+            kind: [self._format_period(group) for group in groups]
+            for kind, groups in periods.items()
+        }
+
+    def find_contacts(self,
+                      specs: List[Dict],
+                      natal_points: Dict[str, float],
+                      jd_start: float,
+                      jd_end: float) -> List[Dict]:
+        """
+        Find every period a transiting planet is within orb of a natal point.
+
+        Args:
+            specs: [{"transit_planet", "natal_point", "orb"}, ...]
+            natal_points: Natal sidereal longitudes by point name
+
+        Each planet is sampled once for all specs that use it; orb entry,
+        exact hits and orb exit are then refined by root finding. Retrograde
+        loops show up as several exact hits in one contact, or as separate
+        contacts when the planet leaves the orb in between.
+        """
+        results: List[Optional[Dict]] = [None] * len(specs)
+        by_planet: Dict[str, List[int]] = {}
+        for i, spec in enumerate(specs):
+            by_planet.setdefault(spec["transit_planet"].upper(), []).append(i)
+
+        for planet, spec_indices in by_planet.items():
+            step = INGRESS_STEPS[planet]
+            jds = np.arange(jd_start, jd_end + step, step)
+            longitudes = ephemeris.get_longitudes(jds, planet)[0]
+
+            for i in spec_indices:
+                spec = specs[i]
+                target = natal_points[spec["natal_point"].upper()]
+                orb = float(spec["orb"])
+
+                def separation(t, target=target, planet=planet):
+                    return (ephemeris.get_longitudes(t, planet)[0] - target) % 360.0
+
+                separations = (longitudes - target) % 360.0
+                crossings = find_level_crossings(separation, jds, separations, [0.0, orb, 360.0 - orb])
+                crossings = [c for c in crossings if jd_start <= c[0] <= jd_end]
+                start_inside = min(separations[0], 360.0 - separations[0]) <= orb
+
+                results[i] = {
+                    "transit_planet": planet,
+                    "natal_point": spec["natal_point"].upper(),
+                    "natal_longitude": target,
+                    "orb": orb,
+                    "contacts": self._assemble_contacts(crossings, start_inside),
+                }
+
+        return results
+
+    def _assemble_contacts(self, crossings: List, start_inside: bool) -> List[Dict]:
+        """Turn time-ordered orb-edge and exact crossings into contact periods"""
+        contacts = []
+        current = {"start": None, "exact": []} if start_inside else None
+
+        for jd, level, direction in crossings:
+            if level == 0:
+                if current is not None:
+                    current["exact"].append({
+                        "date": ephemeris.get_datetime(jd).isoformat(),
+                        "retrograde": direction < 0,
+                    })
+            elif current is None:
+                # Either orb edge toggles: the orb arc is bounded by exactly these two points
+                current = {"start": ephemeris.get_datetime(jd).isoformat(), "exact": []}
+            else:
+                current["end"] = ephemeris.get_datetime(jd).isoformat()
+                contacts.append(current)
+                current = None
+
+        if current is not None:
+            current["end"] = None
+            contacts.append(current)
+
+        for contact in contacts:
+            contact["passes"] = len(contact["exact"])
+
+        return contacts
+
+    def _format_period(self, group: Dict) -> Dict:
+        """Format a grouped period with ISO timestamps"""
+        return {
+            "start": ephemeris.get_datetime(group["start_jd"]).isoformat(),
+            "end": ephemeris.get_datetime(group["end_jd"]).isoformat(),
+            "phases": group["phases"],
+        }
+
+
+transit_calculator = TransitCalculator()
@@ -0,0 +1,162 @@
+"""
+Transit Heatmap
+Monthly favourability of a profile over many years, aggregated from daily
+series of Saturn and Jupiter transit Ashtakavarga, the running dasha lords
+and Sade Sati
+"""
+import numpy as np
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from app.core.cache import LRUCache
+from app.modules.ephemeris.calculator import ephemeris
+from app.modules.ashtakavarga.calculator import ashtakavarga_calculator, BAV_TARGETS
+from app.modules.transits.calculator import SATURN_MOON_PHASES
+from app.modules.transits.ingress import ingress_table
+
+HEATMAP_ROWS = [
+    "saturn_sav",    # SAV of the sign transiting Saturn occupies
+    "saturn_bav",    # Saturn's own bindus in that sign
+    "jupiter_sav",
+    "jupiter_bav",
+    "dasha_sav",     # Mean SAV of the natal signs of the maha and antar dasha lords
+    "sade_sati",     # Fraction of the month in Sade Sati
+    "score",         # Combined favourability, 0-100
+]
+
+SADE_SATI_OFFSETS = [offset for offset, (kind, _) in SATURN_MOON_PHASES.items() if kind == "sade_sati"]
+
+# SAV of 28 is the average bindu count of a sign
+AVERAGE_SAV = 28.0
+SAV_WEIGHT = 2.5
+SADE_SATI_PENALTY = 15.0
+
+MAX_HEATMAP_MONTHS = 30 * 12
+
+
+class TransitHeatmap:
+    """Precompute monthly transit strength matrices per chart"""
+
+    def __init__(self):
+        self._heatmaps = LRUCache(maxsize=256, ttl=6 * 3600)
+
+    def _key(self, chart_hash: str, start: date, months: int):
+        return (chart_hash, start.year, start.month, months)
+
+    def get(self, chart_hash: str, start: date, months: int) -> Optional[Dict]:
+        """A cached heatmap for a chart and window, if any"""
+        return self._heatmaps.get(self._key(chart_hash, start, months))
+
+    def _daily_signs(self, planet: str, jds: np.ndarray) -> np.ndarray:
+        """Sign index (0 = Aries) of a planet at each Julian Day, from its ingress table"""
+        intervals = ingress_table(planet).intervals(jds[0], jds[-1] + 1.0)
+        starts = np.array([start for _, start, _ in intervals])
+        indices = np.array([index for index, _, _ in intervals])
+        return indices[np.searchsorted(starts, jds, side="right") - 1]
+
+    def _dasha_series(self, dashas: List[Dict], level: str, moments: np.ndarray) -> List[Optional[str]]:
+        """Lord of the dasha of a level running at each moment (None if none)"""
+        periods = sorted(
+            (d for d in dashas if d["level"] == level),
+            key=lambda d: d["start_date"]
+        )
+        if not periods:
+            return [None] * len(moments)
+
+        starts = np.array([d["start_date"] for d in periods], dtype="datetime64[us]")
+        ends = np.array([d["end_date"] for d in periods], dtype="datetime64[us]")
+        lords = np.array([d["lord"] for d in periods] + [None], dtype=object)
+
+        index = np.searchsorted(starts, moments, side="right") - 1
+        running = (index >= 0) & (moments < ends[np.maximum(index, 0)])
+        return lords[np.where(running, index, -1)].tolist()
+
+    def build(self,
+              chart_hash: str,
+              natal_positions: Dict[str, Dict],
+              dashas: List[Dict],
+              start: date,
+              months: int) -> Dict:
+        """
+        Build (and cache) the heatmap of the months from start's month on.
+
+        Args:
+            natal_positions: {planet: {"rasi", ...}} including ASCENDANT
+            dashas: Vimshottari periods as returned by get_or_compute_dashas
+
+        Every day is sampled at 12:00 UTC, with Saturn and Jupiter signs read
+        from their ingress tables; each cell is the monthly mean of the daily
+        values. The matrix is [rows x months] in HEATMAP_ROWS order,
+        with None where a value is undefined (no dasha running).
+        """
+        first_month = np.datetime64(f"{start.year:04d}-{start.month:02d}", "M")
+        month_starts = first_month + np.arange(months + 1)
+        days = np.arange(month_starts[0].astype("datetime64[D]"), month_starts[-1].astype("datetime64[D]"))
+        month_index = (days.astype("datetime64[M]") - first_month).astype(np.int64)
+        day_counts = np.bincount(month_index, minlength=months)
+
+        tables = ashtakavarga_calculator.calculate_batch(
+            ashtakavarga_calculator.contributor_rasis(natal_positions)
+        )
+        bav, sav = tables["bav"][0].astype(float), tables["sav"][0].astype(float)
+
+        jds = ephemeris.get_julian_day(datetime(start.year, start.month, 1, 12)) + np.arange(len(days), dtype=float)
+        saturn_signs = self._daily_signs("SATURN", jds)
+        jupiter_signs = self._daily_signs("JUPITER", jds)
+        saturn, jupiter = BAV_TARGETS.index("SATURN"), BAV_TARGETS.index("JUPITER")
+        moon_sign = natal_positions["MOON"]["rasi"] - 1
+
+        daily = {
+            "saturn_sav": sav[saturn_signs],
+            "saturn_bav": bav[saturn, saturn_signs],
+            "jupiter_sav": sav[jupiter_signs],
+            "jupiter_bav": bav[jupiter, jupiter_signs],
+            "sade_sati": np.isin((saturn_signs - moon_sign) % 12, SADE_SATI_OFFSETS).astype(float),
+        }
+
+        # Dasha lords at noon of each day, scored by the SAV of their natal sign
+        moments = days.astype("datetime64[us]") + np.timedelta64(12, "h")
+        maha = self._dasha_series(dashas, "maha", moments)
+        antar = self._dasha_series(dashas, "antar", moments)
+        lord_sav = {
+            planet: sav[pos["rasi"] - 1]
+            for planet, pos in natal_positions.items() if pos.get("rasi")
+        }
+        daily["dasha_sav"] = np.array([
+            (lord_sav[m] + lord_sav[a]) / 2.0 if m in lord_sav and a in lord_sav else np.nan
+            for m, a in zip(maha, antar)
+        ])
+
+        monthly = {}
+        for name, values in daily.items():
+            defined = ~np.isnan(values)
+            counts = np.bincount(month_index, weights=defined, minlength=months)
+            totals = np.bincount(month_index, weights=np.where(defined, values, 0.0), minlength=months)
+            monthly[name] = np.where(counts > 0, totals / np.maximum(counts, 1), np.nan)
+
+        # Saturn and Jupiter are always defined, so no month is all NaN
+        mean_sav = np.nanmean(np.stack([monthly["saturn_sav"], monthly["jupiter_sav"], monthly["dasha_sav"]]), axis=0)
+        monthly["score"] = np.clip(
+            50.0 + SAV_WEIGHT * (mean_sav - AVERAGE_SAV) - SADE_SATI_PENALTY * monthly["sade_sati"],
+            0.0, 100.0
+        )
+
+        matrix = np.stack([monthly[name] for name in HEATMAP_ROWS])
+        first_days = np.concatenate([[0], np.cumsum(day_counts)[:-1]])
+
+        result = {
+            "rows": HEATMAP_ROWS,
+            "columns": [str(month) for month in month_starts[:-1]],
+            "matrix": [
+                [None if np.isnan(value) else round(float(value), 2) for value in row]
+                for row in matrix
+            ],
+            "maha_dasha": [maha[i] for i in first_days],
+            "antar_dasha": [antar[i] for i in first_days],
+            "natal_sav": tables["sav"][0].tolist(),
+        }
+        self._heatmaps.set(self._key(chart_hash, start, months), result)
+        return result
+
+
+transit_heatmap = TransitHeatmap()
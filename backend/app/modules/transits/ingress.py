@@ -0,0 +1,48 @@
+"""
+Sign Ingress Tables
+Exact sidereal sign ingress instants per planet, retrograde re-entries
+included, kept in lazily built per-year boundary tables
+"""
+from typing import Dict
+
+from app.modules.ephemeris.calculator import ephemeris
+from app.modules.ephemeris.events import BoundaryTable
+
+# Sampling step (days) per planet: short enough that no sign is crossed and
+# re-crossed between two samples except at a near-boundary station
+INGRESS_STEPS = {
+    "SUN": 1.0,
+    "MOON": 0.25,
+    "MERCURY": 0.5,
+    "VENUS": 0.5,
+    "MARS": 1.0,
+    "JUPITER": 2.0,
+    "SATURN": 2.0,
+    "RAHU": 2.0,
+    "KETU": 2.0,
+}
+
+INGRESS_FIRST_YEAR = 1800
+INGRESS_LAST_YEAR = 2200
+
+_ingress_tables: Dict[str, BoundaryTable] = {}
+
+
+def ingress_table(planet: str) -> BoundaryTable:
+    """Get the sign ingress table of a planet (division index = rasi - 1)"""
+    planet = planet.upper()
+    if planet not in INGRESS_STEPS:
+        raise ValueError(f"Unknown planet: {planet}")
+
+    table = _ingress_tables.get(planet)
+    if table is None:
+        table = BoundaryTable(
+            lambda jds: ephemeris.get_longitudes(jds, planet)[0],
+            30.0,
+            step=INGRESS_STEPS[planet],
+            first_year=INGRESS_FIRST_YEAR,
+            last_year=INGRESS_LAST_YEAR
+        )
+        _ingress_tables[planet] = table
+
+    return table
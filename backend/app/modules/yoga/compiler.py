@@ -0,0 +1,437 @@
+"""
+Yoga Rule Compiler
+Turns yoga rule condition dicts into predicate closures over precomputed
+chart features, once at load time. Every condition compiles to a scalar
+predicate for one chart and a vectorized one over a FeatureMatrix of N charts.
+"""
+import numpy as np
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from app.modules.ephemeris.calculator import SIGN_LORDS
+
+KENDRAS = {1, 4, 7, 10}
+DUSTHANAS = {6, 8, 12}
+UPACHAYAS = {3, 6, 10, 11}
+
+BENEFICS = ["JUPITER", "VENUS", "MERCURY", "MOON"]
+# Benefics counted from the Moon exclude the Moon itself
+MOON_BENEFICS = ["JUPITER", "VENUS", "MERCURY"]
+MALEFICS = ["SUN", "MARS", "SATURN", "RAHU", "KETU"]
+GRAHAS = ["SUN", "MOON", "MARS", "MERCURY", "JUPITER", "VENUS", "SATURN", "RAHU", "KETU"]
+
+
+class YogaRuleError(ValueError):
+    """A yoga rule that cannot be compiled"""
+
+
+class ChartFeatures:
+    """Per-chart values read by compiled yoga predicates"""
+
+    def __init__(self, planets: Dict[str, Dict], ascendant: float):
+        self.asc_rasi = int(ascendant / 30.0) + 1
+        self.rasi = {planet: pos["rasi"] for planet, pos in planets.items()}
+        self.dignity = {planet: pos.get("dignity") for planet, pos in planets.items()}
+        self.house = {planet: (rasi - self.asc_rasi) % 12 + 1 for planet, rasi in self.rasi.items()}
+
+        moon_rasi = self.rasi.get("MOON")
+        self.house_from_moon = {
+            planet: (rasi - moon_rasi) % 12 + 1 for planet, rasi in self.rasi.items()
+        } if moon_rasi else {}
+
+        # lord[h] is the lord of the h-th house (whole sign) from the ascendant
+        self.lord = [None] + [SIGN_LORDS[(self.asc_rasi + h - 2) % 12] for h in range(1, 13)]
+
+        dignities = list(self.dignity.values())
+        self.debilitated_count = dignities.count("Debilitated")
+        self.exalted_count = dignities.count("Exalted")
+
+
+class FeatureMatrix:
+    """
+    Per-chart values for N charts as column arrays, read by vectorized yoga
+    predicates. Missing planets have rasi and houses 0.
+    """
+
+    def __init__(self, charts: Sequence[Tuple[Dict[str, Dict], float]]):
+        extra = sorted({planet for planets, _ in charts for planet in planets} - set(GRAHAS))
+        self.planets = GRAHAS + extra
+        self.index = {planet: i for i, planet in enumerate(self.planets)}
+
+        n, p = len(charts), len(self.planets)
+        self.rasi = np.zeros((n, p), dtype=np.int16)
+        self.dignity = np.full((n, p), "", dtype=object)
+        self.asc_rasi = np.zeros(n, dtype=np.int16)
+        for row, (planets, ascendant) in enumerate(charts):
+            self.asc_rasi[row] = int(ascendant / 30.0) + 1
+            for planet, pos in planets.items():
+                self.rasi[row, self.index[planet]] = pos["rasi"]
+                self.dignity[row, self.index[planet]] = pos.get("dignity") or ""
+
+        self.present = self.rasi > 0
+        self.house = np.where(self.present, (self.rasi - self.asc_rasi[:, None]) % 12 + 1, 0)
+        moon = self.rasi[:, [self.index["MOON"]]]
+        self.house_from_moon = np.where(self.present & (moon > 0), (self.rasi - moon) % 12 + 1, 0)
+
+        # lord[:, h] is the column of the h-th house lord (whole sign) from the ascendant
+        sign_lords = np.array([self.index[lord] for lord in SIGN_LORDS])
+        houses = np.arange(13)
+        self.lord = sign_lords[(self.asc_rasi[:, None] + houses[None, :] - 2) % 12]
+
+        self.debilitated_count = (self.dignity == "Debilitated").sum(axis=1)
+        self.exalted_count = (self.dignity == "Exalted").sum(axis=1)
+
+    def __len__(self) -> int:
+        return len(self.asc_rasi)
+
+    def column(self, table: np.ndarray, planet: str) -> np.ndarray:
+        return table[:, self.index[planet]]
+
+    def lord_column(self, table: np.ndarray, house: int) -> np.ndarray:
+        """Values of table for the lord of a house in each chart"""
+        return np.take_along_axis(table, self.lord[:, [house]], axis=1)[:, 0]
+
+    def boolean_features(self) -> Tuple[List[str], np.ndarray]:
+        """
+        Named boolean features per chart: placements and dignities of the
+        grahas, graha conjunctions and house lord placements.
+        """
+        names, columns = [], []
+
+        def add(name, values):
+            names.append(name)
+            columns.append(values)
+
+        for planet in GRAHAS:
+            house = self.column(self.house, planet)
+            add(f"{planet}_in_kendra", np.isin(house, list(KENDRAS)))
+            add(f"{planet}_in_dusthana", np.isin(house, list(DUSTHANAS)))
+            for dignity in ("Exalted", "Own", "Debilitated"):
+                add(f"{planet}_{dignity.lower()}", self.column(self.dignity, planet) == dignity)
+        for i, planet1 in enumerate(GRAHAS):
+            for planet2 in GRAHAS[i + 1:]:
+                rasi1, rasi2 = self.column(self.rasi, planet1), self.column(self.rasi, planet2)
+                add(f"{planet1}_{planet2}_conjunct", (rasi1 > 0) & (rasi1 == rasi2))
+        for house in range(1, 13):
+            lord_house = self.lord_column(self.house, house)
+            add(f"lord_{house}_in_kendra", np.isin(lord_house, list(KENDRAS)))
+            add(f"lord_{house}_in_dusthana", np.isin(lord_house, list(DUSTHANAS)))
+
+        return names, np.column_stack(columns) if columns else np.zeros((len(self), 0), dtype=bool)
+
+
+# A compiled condition: (predicate, vectorized predicate, forming planets,
+# planets referenced, houses referenced)
+Predicate = Callable[[ChartFeatures], bool]
+Vectorized = Callable[[FeatureMatrix], np.ndarray]
+Forming = Callable[[ChartFeatures], List[str]]
+CONDITION_COMPILERS: Dict[str, Callable[[Dict], Tuple[Predicate, Vectorized, Forming, Set[str], Set[int]]]] = {}
+
+
+def condition(name: str):
+    """Register a compiler for a condition type"""
+    def register(compiler):
+        CONDITION_COMPILERS[name] = compiler
+        return compiler
+    return register
+
+
+def _static(planets: List[str]) -> Forming:
+    return lambda features: list(planets)
+
+
+def _lords(houses: List[int]) -> Forming:
+    return lambda features: [features.lord[house] for house in houses]
+
+
+def _in_houses(features: ChartFeatures, planet: str, houses: Set[int], from_moon: bool = False) -> bool:
+    table = features.house_from_moon if from_moon else features.house
+    return table.get(planet) in houses
+
+
+def _in_houses_v(matrix: FeatureMatrix, planet: str, houses: Set[int], from_moon: bool = False) -> np.ndarray:
+    table = matrix.house_from_moon if from_moon else matrix.house
+    return np.isin(matrix.column(table, planet), list(houses))
+
+
+@condition("kendra_from")
+def _kendra_from(c):
+    planet1, planet2 = c["planet1"], c["planet2"]
+
+    def predicate(f):
+        if planet1 not in f.rasi or planet2 not in f.rasi:
+            return False
+        return (f.rasi[planet1] - f.rasi[planet2]) % 12 + 1 in KENDRAS
+
+    def vectorized(m):
+        rasi1, rasi2 = m.column(m.rasi, planet1), m.column(m.rasi, planet2)
+        return (rasi1 > 0) & (rasi2 > 0) & ((rasi1 - rasi2) % 3 == 0)
+
+    return predicate, vectorized, _static([planet1, planet2]), {planet1, planet2}, set()
+
+
+@condition("in_kendra")
+def _in_kendra(c):
+    planet = c["planet"]
+    return (
+        lambda f: _in_houses(f, planet, KENDRAS),
+        lambda m: _in_houses_v(m, planet, KENDRAS),
+        _static([planet]), {planet}, set(KENDRAS)
+    )
+
+
+@condition("dignity")
+def _dignity(c):
+    planet, values = c["planet"], set(c["values"])
+    return (
+        lambda f: f.dignity.get(planet) in values,
+        lambda m: np.isin(m.column(m.dignity, planet), list(values)),
+        _static([planet]), {planet}, set()
+    )
+
+
+@condition("debilitated_planet_exists")
+def _debilitated_planet_exists(c):
+    def forming(f):
+        return [planet for planet, dignity in f.dignity.items() if dignity == "Debilitated"]
+
+    return lambda f: f.debilitated_count > 0, lambda m: m.debilitated_count > 0, forming, set(), set()
+
+
+@condition("exalted_planets_count")
+def _exalted_planets_count(c):
+    minimum = c.get("min", 1)
+
+    def forming(f):
+        return [planet for planet, dignity in f.dignity.items() if dignity == "Exalted"]
+
+    return lambda f: f.exalted_count >= minimum, lambda m: m.exalted_count >= minimum, forming, set(), set()
+
+
+@condition("conjunction")
+def _conjunction(c):
+    planets = list(c["planets"])
+    if len(planets) < 2:
+        raise YogaRuleError("conjunction needs at least two planets")
+
+    def predicate(f):
+        if any(planet not in f.rasi for planet in planets):
+            return False
+        return len({f.rasi[planet] for planet in planets}) == 1
+
+    def vectorized(m):
+        first = m.column(m.rasi, planets[0])
+        return (first > 0) & np.all([m.column(m.rasi, planet) == first for planet in planets[1:]], axis=0)
+
+    return predicate, vectorized, _static(planets), set(planets), set()
+
+
+@condition("lord_in_dusthana")
+def _lord_in_dusthana(c):
+    house = int(c["house"])
+    return (
+        lambda f: _in_houses(f, f.lord[house], DUSTHANAS),
+        lambda m: np.isin(m.lord_column(m.house, house), list(DUSTHANAS)),
+        _lords([house]), set(), {house} | DUSTHANAS
+    )
+
+
+@condition("house_lord_in_kendra")
+def _house_lord_in_kendra(c):
+    house = int(c["house"])
+    return (
+        lambda f: _in_houses(f, f.lord[house], KENDRAS),
+        lambda m: np.isin(m.lord_column(m.house, house), list(KENDRAS)),
+        _lords([house]), set(), {house} | KENDRAS
+    )
+
+
+@condition("lords_connected")
+def _lords_connected(c):
+    house1, house2 = (int(h) for h in c["houses"])
+
+    def predicate(f):
+        lord1, lord2 = f.lord[house1], f.lord[house2]
+        if lord1 == lord2:
+            return True
+        if lord1 not in f.rasi or lord2 not in f.rasi:
+            return False
+        # Conjunction or mutual 7th-house aspect
+        return (f.rasi[lord1] - f.rasi[lord2]) % 12 in (0, 6)
+
+    def vectorized(m):
+        rasi1, rasi2 = m.lord_column(m.rasi, house1), m.lord_column(m.rasi, house2)
+        same_lord = m.lord[:, house1] == m.lord[:, house2]
+        return same_lord | ((rasi1 > 0) & (rasi2 > 0) & ((rasi1 - rasi2) % 6 == 0))
+
+    return predicate, vectorized, _lords([house1, house2]), set(), {house1, house2}
+
+
+@condition("lords_in_mutual_kendras")
+def _lords_in_mutual_kendras(c):
+    house1, house2 = (int(h) for h in c["houses"])
+
+    def predicate(f):
+        lord1, lord2 = f.lord[house1], f.lord[house2]
+        if lord1 not in f.rasi or lord2 not in f.rasi:
+            return False
+        return (f.rasi[lord1] - f.rasi[lord2]) % 12 + 1 in KENDRAS
+
+    def vectorized(m):
+        rasi1, rasi2 = m.lord_column(m.rasi, house1), m.lord_column(m.rasi, house2)
+        return (rasi1 > 0) & (rasi2 > 0) & ((rasi1 - rasi2) % 3 == 0)
+
+    return predicate, vectorized, _lords([house1, house2]), set(), {house1, house2}
+
+
+@condition("benefics_from_moon")
+def _benefics_from_moon(c):
+    houses = set(c["houses"])
+    return (
+        lambda f: all(_in_houses(f, planet, houses, from_moon=True) for planet in MOON_BENEFICS),
+        lambda m: np.all([_in_houses_v(m, planet, houses, from_moon=True) for planet in MOON_BENEFICS], axis=0),
+        _static(MOON_BENEFICS + ["MOON"]), set(MOON_BENEFICS) | {"MOON"}, set()
+    )
+
+
+@condition("benefics_in_upachaya")
+def _benefics_in_upachaya(c):
+    return (
+        lambda f: all(_in_houses(f, planet, UPACHAYAS, from_moon=True) for planet in MOON_BENEFICS),
+        lambda m: np.all([_in_houses_v(m, planet, UPACHAYAS, from_moon=True) for planet in MOON_BENEFICS], axis=0),
+        _static(MOON_BENEFICS + ["MOON"]), set(MOON_BENEFICS) | {"MOON"}, set()
+    )
+
+
+@condition("benefic_in_10th")
+def _benefic_in_10th(c):
+    def tenth(f):
+        return [
+            planet for planet in BENEFICS
+            if _in_houses(f, planet, {10}) or (planet != "MOON" and _in_houses(f, planet, {10}, from_moon=True))
+        ]
+
+    def vectorized(m):
+        from_lagna = [_in_houses_v(m, planet, {10}) for planet in BENEFICS]
+        from_moon = [_in_houses_v(m, planet, {10}, from_moon=True) for planet in MOON_BENEFICS]
+        return np.any(from_lagna + from_moon, axis=0)
+
+    return lambda f: bool(tenth(f)), vectorized, tenth, set(BENEFICS), {10}
+
+
+@condition("benefics_in_kendras")
+def _benefics_in_kendras(c):
+    def forming(f):
+        return [planet for planet in BENEFICS if _in_houses(f, planet, KENDRAS)]
+
+    def predicate(f):
+        malefic_in_kendra = any(_in_houses(f, planet, KENDRAS) for planet in MALEFICS)
+        return bool(forming(f)) and not malefic_in_kendra
+
+    def vectorized(m):
+        benefic = np.any([_in_houses_v(m, planet, KENDRAS) for planet in BENEFICS], axis=0)
+        malefic = np.any([_in_houses_v(m, planet, KENDRAS) for planet in MALEFICS], axis=0)
+        return benefic & ~malefic
+
+    return predicate, vectorized, forming, set(BENEFICS) | set(MALEFICS), set(KENDRAS)
+
+
+class CompiledRule:
+    """A yoga rule with its conditions compiled to predicates"""
+
+    def __init__(self, rule: Dict):
+        self.rule = rule
+        self.name = rule["name"]
+        self.predicates: List[Predicate] = []
+        self.vectorized: List[Vectorized] = []
+        self.forming: List[Forming] = []
+        self.planets: Set[str] = set()
+        self.houses: Set[int] = set()
+
+        for cond in rule.get("conditions", []):
+            compiler = CONDITION_COMPILERS.get(cond.get("type"))
+            if compiler is None:
+                raise YogaRuleError(f"{self.name}: unknown condition type '{cond.get('type')}'")
+            try:
+                predicate, vectorized, forming, planets, houses = compiler(cond)
+            except (KeyError, TypeError, ValueError) as e:
+                raise YogaRuleError(f"{self.name}: invalid '{cond['type']}' condition ({e})")
+            self.predicates.append(predicate)
+            self.vectorized.append(vectorized)
+            self.forming.append(forming)
+            self.planets |= planets
+            self.houses |= houses
+
+    def matches(self, features: ChartFeatures) -> bool:
+        return all(predicate(features) for predicate in self.predicates)
+
+    def matches_batch(self, matrix: FeatureMatrix) -> np.ndarray:
+        result = np.ones(len(matrix), dtype=bool)
+        for vectorized in self.vectorized:
+            result &= vectorized(matrix)
+        return result
+
+    def forming_planets(self, features: ChartFeatures) -> List[str]:
+        return sorted({planet for forming in self.forming for planet in forming(features) if planet})
+
+
+class RuleSet:
+    """Compiled yoga rules indexed by the planets and houses they reference"""
+
+    def __init__(self, rules: List[Dict]):
+        self.rules = [CompiledRule(rule) for rule in rules]
+        self.by_planet: Dict[str, List[CompiledRule]] = {}
+        self.by_house: Dict[int, List[CompiledRule]] = {}
+        self._positions = {id(compiled): i for i, compiled in enumerate(self.rules)}
+
+        for compiled in self.rules:
+            for planet in compiled.planets:
+                self.by_planet.setdefault(planet, []).append(compiled)
+            for house in compiled.houses:
+                self.by_house.setdefault(house, []).append(compiled)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    @property
+    def names(self) -> List[str]:
+        return [compiled.name for compiled in self.rules]
+
+    def select(self,
+               planets: Optional[Sequence[str]] = None,
+               houses: Optional[Sequence[int]] = None) -> List[CompiledRule]:
+        """
+        Rules referencing any of the given planets or houses, looked up in
+        the indexes and kept in rule order. With neither given, every rule.
+        """
+        if planets is None and houses is None:
+            return self.rules
+
+        selected = {}
+        for planet in planets or []:
+            for compiled in self.by_planet.get(planet, []):
+                selected[id(compiled)] = compiled
+        for house in houses or []:
+            for compiled in self.by_house.get(house, []):
+                selected[id(compiled)] = compiled
+        return sorted(selected.values(), key=lambda compiled: self._positions[id(compiled)])
+
+    def detect(self,
+               features: ChartFeatures,
+               planets: Optional[Sequence[str]] = None,
+               houses: Optional[Sequence[int]] = None) -> List[CompiledRule]:
+        """Get the rules satisfied by a chart, among those selected by planets and houses"""
+        return [compiled for compiled in self.select(planets, houses) if compiled.matches(features)]
+
+    def detect_batch(self,
+                     matrix: FeatureMatrix,
+                     planets: Optional[Sequence[str]] = None,
+                     houses: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Evaluate the rules selected by planets and houses (all by default)
+        for every chart, as a [charts x rules] boolean array in select order
+        """
+        rules = self.select(planets, houses)
+        result = np.zeros((len(matrix), len(rules)), dtype=bool)
+        for j, compiled in enumerate(rules):
+            result[:, j] = compiled.matches_batch(matrix)
+        return result
@@ -1,14 +1,26 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence, Tuple
+import hashlib
+import json
+import numpy as np
 import yaml
 import os
 
+from app.modules.yoga.compiler import ChartFeatures, FeatureMatrix, RuleSet
+
 YOGA_RULES_PATH = "/app/backend/app/modules/yoga/rules.yaml"
 
+def content_hash(rules: List[Dict]) -> str:
+    """Version of a rule set, stable across key order"""
+    return hashlib.sha256(json.dumps(rules, sort_keys=True).encode()).hexdigest()
+
 class YogaDetector:
     """Detect yogas using rule engine"""
     
     def __init__(self):
-        self.rules = self.load_rules()
+        self.rules: List[Dict] = []
+        self.rule_set = RuleSet([])
+        self.version = content_hash([])
+        self.reload()
     
     def load_rules(self) -> List[Dict]:
         """Load yoga rules from YAML file"""
@@ -207,100 +219,53 @@ class YogaDetector:
             }
         ]
     
-    def check_kendra_from(self, planet1_rasi: int, planet2_rasi: int) -> bool:
-        """Check if planet1 is in kendra (1,4,7,10) from planet2"""
-        diff = (planet1_rasi - planet2_rasi) % 12
-        return diff in [0, 3, 6, 9]
+    def activate(self, rules: List[Dict]):
+        """
+        Compile and switch to a rule set, keeping the current one if any
+        rule fails to compile (YogaRuleError).
+        """
+        rule_set = RuleSet(rules)
+        self.rules, self.rule_set, self.version = rules, rule_set, content_hash(rules)
     
-    def check_in_kendra(self, planet_rasi: int, asc_rasi: int) -> bool:
-        """Check if planet is in kendra from ascendant"""
-        diff = (planet_rasi - asc_rasi) % 12
-        return diff in [0, 3, 6, 9]
+    def reload(self) -> int:
+        """Load, compile and activate the rules file"""
+        rules = self.load_rules()
+        self.activate(rules)
+        return len(rules)
     
-    def detect_yogas(self, planets: Dict[str, Dict], ascendant: float) -> List[Dict]:
-        """Detect all yogas in chart"""
-        detected_yogas = []
-        asc_rasi = int(ascendant / 30.0) + 1
-        
-        for rule in self.rules:
-            if self.check_rule(rule, planets, asc_rasi):
-                detected_yogas.append({
-                    "name": rule["name"],
-                    "type": rule["type"],
-                    "description": rule["description"],
-                    "strength": rule["strength"],
-                    "forming_planets": self.get_forming_planets(rule, planets),
-                    "rule_reference": rule["name"]
-                })
+    def detect_yogas(self,
+                     planets: Dict[str, Dict],
+                     ascendant: float,
+                     involving: Optional[Sequence[str]] = None,
+                     houses: Optional[Sequence[int]] = None) -> List[Dict]:
+        """
+        Detect yogas in chart: all of them, or only the rules that reference
+        one of the planets in involving or one of the houses
+        """
+        features = ChartFeatures(planets, ascendant)
         
-        return detected_yogas
+        return [
+            {
+                "name": compiled.rule["name"],
+                "type": compiled.rule["type"],
+                "description": compiled.rule["description"],
+                "strength": compiled.rule["strength"],
+                "forming_planets": compiled.forming_planets(features),
+                "rule_reference": compiled.rule["name"]
+            }
+            for compiled in self.rule_set.detect(features, involving, houses)
+        ]
     
-    def check_rule(self, rule: Dict, planets: Dict[str, Dict], asc_rasi: int) -> bool:
-        """Check if a rule's conditions are satisfied"""
-        for condition in rule["conditions"]:
-            cond_type = condition["type"]
-            
-            if cond_type == "kendra_from":
-                p1 = planets.get(condition["planet1"], {}).get("rasi")
-                p2 = planets.get(condition["planet2"], {}).get("rasi")
-                if not p1 or not p2:
-                    return False
-                if not self.check_kendra_from(p1, p2):
-                    return False
-            
-            elif cond_type == "in_kendra":
-                planet = planets.get(condition["planet"], {})
-                if not planet:
-                    return False
-                if not self.check_in_kendra(planet["rasi"], asc_rasi):
-                    return False
-            
-            elif cond_type == "dignity":
-                planet = planets.get(condition["planet"], {})
-                if not planet:
-                    return False
-                if planet.get("dignity") not in condition["values"]:
-                    return False
-            
-            elif cond_type == "debilitated_planet_exists":
-                has_debilitated = any(p.get("dignity") == "Debilitated" for p in planets.values())
-                if not has_debilitated:
-                    return False
-            
-            elif cond_type == "conjunction":
-                planets_list = condition["planets"]
-                if len(planets_list) < 2:
-                    return False
-                rasi_list = [planets.get(p, {}).get("rasi") for p in planets_list]
-                if None in rasi_list:
-                    return False
-                if len(set(rasi_list)) != 1:  # All must be in same rasi
-                    return False
-            
-            elif cond_type == "benefic_in_10th":
-                benefics = ["JUPITER", "VENUS", "MERCURY", "MOON"]
-                tenth_house = (asc_rasi + 9) % 12 + 1
-                has_benefic = any(planets.get(b, {}).get("rasi") == tenth_house for b in benefics)
-                if not has_benefic:
-                    return False
-            
-            elif cond_type == "exalted_planets_count":
-                exalted_count = sum(1 for p in planets.values() if p.get("dignity") == "Exalted")
-                if exalted_count < condition.get("min", 1):
-                    return False
+    def detect_batch(self, charts: Sequence[Tuple[Dict[str, Dict], float]]) -> np.ndarray:
+        """
+        Detect yogas for many charts at once.
         
-        return True
-    
-    def get_forming_planets(self, rule: Dict, planets: Dict[str, Dict]) -> List[str]:
-        """Get list of planets involved in forming the yoga"""
-        forming = []
-        for condition in rule["conditions"]:
-            if "planet" in condition:
-                forming.append(condition["planet"])
-            elif "planet1" in condition and "planet2" in condition:
-                forming.extend([condition["planet1"], condition["planet2"]])
-            elif "planets" in condition:
-                forming.extend(condition["planets"])
-        return list(set(forming))
+        Args:
+            charts: (planets, ascendant) per chart, as passed to detect_yogas
+        
+        Returns:
+            [charts x rules] boolean array, columns in rule_set.names order
+        """
+        return self.rule_set.detect_batch(FeatureMatrix(charts))
 
 yoga_detector = YogaDetector()
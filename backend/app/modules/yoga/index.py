@@ -0,0 +1,233 @@
+"""
+Yoga Index
+Materialized Yoga rows per natal chart, used as an inverted index from yoga
+name to charts. Charts are indexed in batches and stamped with the rule set
+version they were indexed with; rule reloads only recompute the rules that
+changed.
+"""
+import json
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.chart import NatalChart, PlanetaryPosition
+from app.models.profile import Profile
+from app.models.yoga import Yoga
+from app.modules.charts.calculator import chart_calculator
+from app.modules.yoga.compiler import ChartFeatures, CompiledRule, FeatureMatrix, RuleSet
+from app.modules.yoga.detector import yoga_detector, content_hash
+from app.modules.yoga.rulesets import yoga_rule_sets
+
+# Charts per batch, kept under SQLite's bound parameter limit
+BATCH_SIZE = 500
+
+
+class YogaIndex:
+    """Maintain and query materialized yogas"""
+
+    def load_planets(self, db: Session, chart_ids: List[int]) -> Dict[int, Dict[str, Dict]]:
+        """Planets of each chart, as passed to detect_yogas"""
+        planets: Dict[int, Dict[str, Dict]] = {chart_id: {} for chart_id in chart_ids}
+        positions = db.query(PlanetaryPosition).filter(PlanetaryPosition.natal_chart_id.in_(chart_ids)).all()
+        for pos in positions:
+            planets[pos.natal_chart_id][pos.planet] = {
+                "rasi": pos.rasi,
+                "longitude": pos.longitude,
+                "dignity": pos.dignity,
+                "is_retrograde": bool(pos.is_retrograde)
+            }
+        return planets
+
+    def materialize(self, db: Session, charts: List[NatalChart], rules: Optional[List[CompiledRule]] = None):
+        """
+        Store Yoga rows for the given rules (all by default) on the given
+        charts. Existing rows for those rules are not removed here.
+        """
+        if rules is None:
+            rules = yoga_detector.rule_set.rules
+
+        for start in range(0, len(charts), BATCH_SIZE):
+            batch = charts[start:start + BATCH_SIZE]
+            planets = self.load_planets(db, [chart.id for chart in batch])
+            matrix = FeatureMatrix([(planets[chart.id], chart.ascendant) for chart in batch])
+
+            features: Dict[int, ChartFeatures] = {}
+
+            for compiled in rules:
+                for row in compiled.matches_batch(matrix).nonzero()[0]:
+                    chart = batch[row]
+                    if row not in features:
+                        features[row] = ChartFeatures(planets[chart.id], chart.ascendant)
+                    db.add(Yoga(
+                        natal_chart_id=chart.id,
+                        yoga_name=compiled.rule["name"],
+                        yoga_type=compiled.rule["type"],
+                        description=compiled.rule["description"],
+                        strength=compiled.rule["strength"],
+                        forming_planets=compiled.forming_planets(features[row]),
+                        rule_reference=compiled.rule["name"]
+                    ))
+
+    def index_charts(self, db: Session, charts: List[NatalChart]) -> int:
+        """Replace the materialized yogas of charts with all active rules"""
+        if not charts:
+            return 0
+
+        yoga_rule_sets.sync(db)
+
+        # Sessions do not autoflush; positions of a new chart may be pending
+        db.flush()
+        chart_ids = [chart.id for chart in charts]
+        for start in range(0, len(chart_ids), BATCH_SIZE):
+            db.query(Yoga).filter(
+                Yoga.natal_chart_id.in_(chart_ids[start:start + BATCH_SIZE])
+            ).delete(synchronize_session=False)
+
+        self.materialize(db, charts)
+        self._stamp(charts, yoga_detector.version)
+        db.commit()
+        return len(charts)
+
+    def _stamp(self, charts: List[NatalChart], version: str):
+        now = datetime.utcnow()
+        for chart in charts:
+            chart.yogas_indexed_at = now
+            chart.yoga_rule_set = version
+
+    def ensure_indexed(self, db: Session, charts: List[NatalChart]) -> int:
+        """Index the charts not indexed with the active rule set"""
+        version = yoga_rule_sets.sync(db)
+        return self.index_charts(db, [
+            chart for chart in charts
+            if chart.yogas_indexed_at is None or chart.yoga_rule_set != version
+        ])
+
+    def diff_rules(self, old_rules: List[Dict], new_rules: List[Dict]) -> Dict[str, List[str]]:
+        """Rule names added, removed and changed between two rule sets"""
+        old = {rule["name"]: json.dumps(rule, sort_keys=True) for rule in old_rules}
+        new = {rule["name"]: json.dumps(rule, sort_keys=True) for rule in new_rules}
+
+        return {
+            "added": sorted(set(new) - set(old)),
+            "removed": sorted(set(old) - set(new)),
+            "changed": sorted(name for name in set(old) & set(new) if old[name] != new[name])
+        }
+
+    def refresh_rules(self, db: Session, old_rules: List[Dict], new_rules: List[Dict]) -> int:
+        """
+        Move charts indexed with old_rules to new_rules, recomputing only
+        the rules whose definition changed. Charts indexed with any other
+        version are re-indexed in full when next used.
+
+        Returns the number of charts refreshed.
+        """
+        diff = self.diff_rules(old_rules, new_rules)
+        stale = diff["removed"] + diff["changed"]
+        recompute = set(diff["added"] + diff["changed"])
+        rules = [compiled for compiled in RuleSet(new_rules).rules if compiled.name in recompute]
+        old_version, new_version = content_hash(old_rules), content_hash(new_rules)
+
+        chart_ids = [row[0] for row in db.query(NatalChart.id).filter(
+            NatalChart.yoga_rule_set == old_version
+        ).order_by(NatalChart.id)]
+
+        refreshed = 0
+        for start in range(0, len(chart_ids), BATCH_SIZE):
+            # Charts re-indexed in full since the ids were read already carry
+            # the new rule set; materializing them again would duplicate rows
+            charts = db.query(NatalChart).filter(
+                NatalChart.id.in_(chart_ids[start:start + BATCH_SIZE]),
+                NatalChart.yoga_rule_set == old_version
+            ).all()
+            if not charts:
+                continue
+            if stale:
+                db.query(Yoga).filter(
+                    Yoga.natal_chart_id.in_([chart.id for chart in charts]),
+                    Yoga.yoga_name.in_(stale)
+                ).delete(synchronize_session=False)
+            if rules:
+                self.materialize(db, charts, rules)
+            self._stamp(charts, new_version)
+            db.commit()
+            refreshed += len(charts)
+
+        return refreshed
+
+    def refresh_in_background(self, old_rules: List[Dict], new_rules: List[Dict]):
+        """refresh_rules with its own session, for BackgroundTasks"""
+        db = SessionLocal()
+        try:
+            count = self.refresh_rules(db, old_rules, new_rules)
+            print(f"Yoga index: refreshed {count} charts to rule set {content_hash(new_rules)[:12]}")
+        except Exception as e:
+            print(f"Yoga index refresh error: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+    def profile_charts(self, db: Session, profiles: List[Profile]) -> List[Tuple[Profile, NatalChart]]:
+        """
+        Each profile paired with the natal chart of its current birth data.
+        Charts are found by chart hash, as profiles with the same birth data
+        share one; profiles whose chart was never computed are left out.
+        """
+        hashes = {profile.id: chart_calculator.profile_chart_hash(profile) for profile in profiles}
+        unique_hashes = sorted(set(hashes.values()))
+
+        charts: Dict[str, NatalChart] = {}
+        for start in range(0, len(unique_hashes), BATCH_SIZE):
+            for chart in db.query(NatalChart).filter(
+                NatalChart.chart_hash.in_(unique_hashes[start:start + BATCH_SIZE])
+            ):
+                charts[chart.chart_hash] = chart
+
+        return [(profile, charts[hashes[profile.id]]) for profile in profiles if hashes[profile.id] in charts]
+
+    def search(self, db: Session, profiles: List[Profile], yoga_names: List[str], match_all: bool = True) -> List[Dict]:
+        """
+        Find profiles by yoga.
+
+        Args:
+            profiles: profiles to search, each matched by its current chart
+            match_all: True requires every yoga (AND), False any of them (OR)
+        """
+        pairs = self.profile_charts(db, profiles)
+        charts = list({chart.id: chart for _, chart in pairs}.values())
+        self.ensure_indexed(db, charts)
+        chart_ids = [chart.id for chart in charts]
+        names = sorted(set(yoga_names))
+
+        query = db.query(Yoga.natal_chart_id).filter(
+            Yoga.natal_chart_id.in_(chart_ids),
+            Yoga.yoga_name.in_(names)
+        ).group_by(Yoga.natal_chart_id)
+        if match_all:
+            query = query.having(func.count(func.distinct(Yoga.yoga_name)) == len(names))
+        matched_ids = [row[0] for row in query.all()]
+
+        matched: Dict[int, List[str]] = {chart_id: [] for chart_id in matched_ids}
+        for chart_id, yoga_name in db.query(Yoga.natal_chart_id, Yoga.yoga_name).filter(
+            Yoga.natal_chart_id.in_(matched_ids),
+            Yoga.yoga_name.in_(names)
+        ).order_by(Yoga.id):
+            matched[chart_id].append(yoga_name)
+
+        return sorted(
+            [
+                {
+                    "profile_id": profile.id,
+                    "name": profile.name,
+                    "natal_chart_id": chart.id,
+                    "yogas": matched[chart.id]
+                }
+                for profile, chart in pairs if chart.id in matched
+            ],
+            key=lambda r: r["profile_id"]
+        )
+
+
+yoga_index = YogaIndex()
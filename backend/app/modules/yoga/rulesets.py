@@ -0,0 +1,68 @@
+"""
+Yoga Rule Set Versions
+Rule sets are stored in the database by content hash, with one active
+version. Each worker keeps the active hash in a short-lived cache and
+recompiles when another worker has published a new version.
+"""
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.models.yoga import YogaRuleSet
+from app.modules.yoga.detector import yoga_detector, content_hash
+
+# How long a worker trusts its view of the active rule set
+RULE_SYNC_SECONDS = 30
+
+
+class YogaRuleSets:
+    """Publish and synchronize versioned yoga rule sets"""
+
+    def __init__(self):
+        self._active = LRUCache(maxsize=1, ttl=RULE_SYNC_SECONDS)
+
+    def active(self, db: Session) -> Optional[YogaRuleSet]:
+        return db.query(YogaRuleSet).filter(YogaRuleSet.is_active == 1).first()
+
+    def publish(self, db: Session, rules: List[Dict]) -> YogaRuleSet:
+        """Store a rule set (if new) and make it the active version"""
+        version = content_hash(rules)
+        record = db.query(YogaRuleSet).filter(YogaRuleSet.content_hash == version).first()
+        if record is None:
+            record = YogaRuleSet(content_hash=version, rules=rules, rule_count=len(rules))
+            db.add(record)
+
+        db.query(YogaRuleSet).filter(
+            YogaRuleSet.is_active == 1,
+            YogaRuleSet.content_hash != version
+        ).update({"is_active": 0}, synchronize_session=False)
+        record.is_active = 1
+        db.commit()
+
+        self._active.set("active", version)
+        return record
+
+    def sync(self, db: Session) -> str:
+        """
+        Make the detector run the active rule set, publishing the detector's
+        own rules if none is stored yet. Returns the active version.
+        """
+        version = self._active.get("active")
+        if version is None:
+            record = self.active(db) or self.publish(db, yoga_detector.rules)
+            version = record.content_hash
+            self._active.set("active", version)
+
+        if version != yoga_detector.version:
+            record = db.query(YogaRuleSet).filter(YogaRuleSet.content_hash == version).first()
+            yoga_detector.activate(record.rules)
+
+        return version
+
+    def expire(self):
+        """Re-read the active version on the next sync"""
+        self._active.clear()
+
+
+yoga_rule_sets = YogaRuleSets()
@@ -0,0 +1,159 @@
+"""
+Transit Yogas
+Yogas formed between transiting planets and the natal chart, found by
+evaluating compiled rules over the intervals between sign ingresses
+"""
+import numpy as np
+from typing import Dict, List, Sequence, Tuple
+
+from app.core.cache import LRUCache
+from app.modules.ephemeris.calculator import ephemeris
+from app.modules.transits.ingress import ingress_table
+from app.modules.yoga.compiler import ChartFeatures, FeatureMatrix, RuleSet
+from app.modules.yoga.detector import yoga_detector
+
+TRANSIT_PREFIX = "TRANSIT_"
+
+# The Moon changes sign every ~2.5 days; searched only when asked for
+DEFAULT_TRANSIT_PLANETS = ["SUN", "MARS", "MERCURY", "JUPITER", "VENUS", "SATURN", "RAHU", "KETU"]
+
+# Conditions that only read the placement of named planets
+PLANET_CONDITIONS = {"kendra_from", "in_kendra", "dignity", "conjunction"}
+PLANET_FIELDS = ("planet", "planet1", "planet2")
+
+
+def _substitute(condition: Dict, planet: str) -> Dict:
+    """Copy of a condition with a natal planet replaced by its transit"""
+    transit = TRANSIT_PREFIX + planet
+    result = dict(condition)
+    for field in PLANET_FIELDS:
+        if result.get(field) == planet:
+            result[field] = transit
+    if "planets" in result:
+        result["planets"] = [transit if p == planet else p for p in result["planets"]]
+    return result
+
+
+def transit_rules(rule_set: RuleSet, transit_planets: Sequence[str]) -> List[Dict]:
+    """
+    Derive transit variants of yoga rules.
+
+    Every rule whose conditions only read named planet placements gets one
+    variant per transit planet it names, with that planet read from the
+    transit positions and all others from the natal chart. Gaja Kesari thus
+    yields transit Jupiter in kendra from the natal Moon, and the transit
+    Moon in kendra from natal Jupiter. Candidates come from the rule set's
+    planet index, so rules naming none of the transit planets are not read.
+    """
+    derived = []
+    for planet in transit_planets:
+        for compiled in rule_set.by_planet.get(planet, []):
+            conditions = compiled.rule.get("conditions", [])
+            if any(c.get("type") not in PLANET_CONDITIONS for c in conditions):
+                continue
+
+            derived.append({
+                **compiled.rule,
+                "name": f"{compiled.name} (transit {planet.title()})",
+                "base_yoga": compiled.name,
+                "transit_planet": planet,
+                "conditions": [_substitute(c, planet) for c in conditions]
+            })
+
+    return derived
+
+
+class TransitYogaEngine:
+    """Find transit-triggered yoga windows"""
+
+    def __init__(self):
+        self._rule_sets = LRUCache(maxsize=32)
+
+    def rule_set(self, transit_planets: Sequence[str]) -> RuleSet:
+        """Compiled transit variants of the active rules"""
+        key = (yoga_detector.version, tuple(sorted(transit_planets)))
+        rule_set = self._rule_sets.get(key)
+        if rule_set is None:
+            rule_set = RuleSet(transit_rules(yoga_detector.rule_set, transit_planets))
+            self._rule_sets.set(key, rule_set)
+        return rule_set
+
+    def intervals(self, transit_planets: Sequence[str], jd_start: float, jd_end: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Split a range at every sign ingress of the transit planets.
+
+        Returns:
+            (interval bounds [k + 1], rasi of each planet per interval [k x planets])
+        """
+        tables = [ingress_table(planet).intervals(jd_start, jd_end) for planet in transit_planets]
+
+        bounds = {jd_start, jd_end}
+        for table in tables:
+            bounds.update(start for _, start, _ in table if jd_start < start < jd_end)
+        bounds = np.array(sorted(bounds))
+
+        midpoints = (bounds[:-1] + bounds[1:]) / 2.0
+        rasis = np.zeros((len(midpoints), len(transit_planets)), dtype=np.int16)
+        for j, table in enumerate(tables):
+            starts = np.array([start for _, start, _ in table])
+            indices = np.array([index for index, _, _ in table])
+            rasis[:, j] = indices[np.searchsorted(starts, midpoints, side="right") - 1] + 1
+
+        return bounds, rasis
+
+    def find_windows(self,
+                     natal_planets: Dict[str, Dict],
+                     ascendant: float,
+                     jd_start: float,
+                     jd_end: float,
+                     transit_planets: Sequence[str] = DEFAULT_TRANSIT_PLANETS) -> List[Dict]:
+        """
+        Get every window in which a transit variant of a yoga holds.
+
+        Args:
+            natal_planets: {planet: {"rasi", "dignity", ...}} as for detect_yogas
+
+        Sign placements are constant between ingresses, so each interval is
+        evaluated once and consecutive matching intervals are merged.
+        """
+        transit_planets = [planet.upper() for planet in transit_planets]
+        rule_set = self.rule_set(transit_planets)
+        bounds, rasis = self.intervals(transit_planets, jd_start, jd_end)
+
+        rows = []
+        for interval_rasis in rasis.tolist():
+            planets = dict(natal_planets)
+            for planet, rasi in zip(transit_planets, interval_rasis):
+                planets[TRANSIT_PREFIX + planet] = {"rasi": rasi, "dignity": ephemeris.get_dignity(planet, rasi)}
+            rows.append(planets)
+
+        flags = rule_set.detect_batch(FeatureMatrix([(planets, ascendant) for planets in rows]))
+
+        windows = []
+        for j, compiled in enumerate(rule_set.rules):
+            column = np.concatenate([[False], flags[:, j], [False]]).astype(np.int8)
+            edges = np.diff(column)
+            for first, last in zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)):
+                rule = compiled.rule
+                start, end = float(bounds[first]), float(bounds[last])
+                windows.append({
+                    "name": rule["name"],
+                    "base_yoga": rule["base_yoga"],
+                    "transit_planet": rule["transit_planet"],
+                    "type": rule["type"],
+                    "description": rule["description"],
+                    "strength": rule["strength"],
+                    "forming_planets": compiled.forming_planets(ChartFeatures(rows[first], ascendant)),
+                    "start_jd": start,
+                    "end_jd": end,
+                    "start": ephemeris.get_datetime(start).isoformat(),
+                    "end": ephemeris.get_datetime(end).isoformat(),
+                    "open_start": bool(first == 0),
+                    "open_end": bool(last == len(bounds) - 1),
+                })
+
+        windows.sort(key=lambda w: (w["start_jd"], w["name"]))
+        return windows
+
+
+transit_yoga_engine = TransitYogaEngine()
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""Compare batched Ashtakavarga against the per-chart loops"""
+import sys
+import os
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import numpy as np
+from app.modules.ashtakavarga.calculator import ashtakavarga_calculator, BAV_TARGETS, BAV_CONTRIBUTORS
+
+def run_loops(rasis):
+    for row in rasis:
+        positions = {contributor: {"rasi": int(rasi)} for contributor, rasi in zip(BAV_CONTRIBUTORS, row)}
+        bavs = {planet: ashtakavarga_calculator.calculate_bav(planet, positions) for planet in BAV_TARGETS}
+        ashtakavarga_calculator.calculate_reductions(ashtakavarga_calculator.calculate_sav(bavs))
+
+def benchmark(charts: int = 10000):
+    rasis = np.random.default_rng(0).integers(1, 13, (charts, len(BAV_CONTRIBUTORS)))
+    ashtakavarga_calculator.calculate_batch(rasis[:10])
+    
+    started = time.perf_counter()
+    run_loops(rasis)
+    loop_seconds = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    ashtakavarga_calculator.calculate_batch(rasis)
+    batch_seconds = time.perf_counter() - started
+    
+    print(f"{charts} charts: loops {loop_seconds * 1000:.1f} ms, "
+          f"batch {batch_seconds * 1000:.1f} ms, speedup {loop_seconds / batch_seconds:.0f}x")
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Build the eclipse catalog (1900-2100)"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.database import SessionLocal
+from app.modules.eclipses.calculator import eclipse_catalog, CATALOG_FIRST_YEAR, CATALOG_LAST_YEAR
+
+def build_catalog():
+    db = SessionLocal()
+    
+    try:
+        count = eclipse_catalog.build(db)
+        if count:
+            print(f"Stored {count} eclipses ({CATALOG_FIRST_YEAR}-{CATALOG_LAST_YEAR})")
+        else:
+            print("Eclipse catalog already present")
+    except Exception as e:
+        print(f"Error building eclipse catalog: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    build_catalog()
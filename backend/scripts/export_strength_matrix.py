@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Export Shadbala features for every stored natal chart as CSV"""
+import sys
+import os
+import csv
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.database import SessionLocal
+from app.models.chart import NatalChart, PlanetaryPosition
+from app.modules.strength.calculator import strength_calculator, SHADBALA_PLANETS
+
+FIELDS = ["sthana_bala", "dig_bala", "kala_bala", "chesta_bala", "naisargika_bala", "drik_bala", "total_rupas", "strength_ratio"]
+
+def export_strength_matrix(output_path: str):
+    db = SessionLocal()
+    
+    try:
+        charts = db.query(NatalChart).order_by(NatalChart.id).all()
+        positions = {}
+        for pos in db.query(PlanetaryPosition).all():
+            positions.setdefault(pos.natal_chart_id, {})[pos.planet] = {
+                "longitude": pos.longitude,
+                "rasi": pos.rasi,
+                "is_retrograde": bool(pos.is_retrograde),
+                "dignity": pos.dignity
+            }
+        
+        rows = [chart for chart in charts if chart.id in positions]
+        shadbala = strength_calculator.calculate_shadbala_batch(
+            strength_calculator.planet_arrays([positions[chart.id] for chart in rows])
+        )
+        
+        names = [f"{planet.lower()}_{field}" for field in FIELDS for planet in SHADBALA_PLANETS]
+        with open(output_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["natal_chart_id", "profile_id"] + names)
+            for i, chart in enumerate(rows):
+                values = [
+                    shadbala[field][i, j] if shadbala["present"][i, j] else ""
+                    for field in FIELDS for j in range(len(SHADBALA_PLANETS))
+                ]
+                writer.writerow([chart.id, chart.profile_id] + values)
+        
+        print(f"Wrote {len(rows)} charts x {len(names)} features to {output_path}")
+    except Exception as e:
+        print(f"Error exporting strength matrix: {e}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    export_strength_matrix(sys.argv[1] if len(sys.argv) > 1 else "strength_matrix.csv")
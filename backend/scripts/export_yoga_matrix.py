@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Export yoga flags for every stored natal chart as CSV"""
+import sys
+import os
+import csv
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.database import SessionLocal
+from app.models.chart import NatalChart, PlanetaryPosition
+from app.modules.ml.engine import ml_engine
+
+def export_yoga_matrix(output_path: str):
+    db = SessionLocal()
+    
+    try:
+        charts = db.query(NatalChart).order_by(NatalChart.id).all()
+        positions = {}
+        for pos in db.query(PlanetaryPosition).all():
+            positions.setdefault(pos.natal_chart_id, {})[pos.planet] = {
+                "rasi": pos.rasi,
+                "longitude": pos.longitude,
+                "dignity": pos.dignity
+            }
+        
+        rows = [chart for chart in charts if chart.id in positions]
+        names, matrix = ml_engine.extract_yoga_features([
+            {"planets": positions[chart.id], "ascendant": chart.ascendant} for chart in rows
+        ])
+        
+        with open(output_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["natal_chart_id", "profile_id"] + names)
+            for chart, values in zip(rows, matrix.astype(int).tolist()):
+                writer.writerow([chart.id, chart.profile_id] + values)
+        
+        print(f"Wrote {len(rows)} charts x {len(names)} features to {output_path}")
+    except Exception as e:
+        print(f"Error exporting yoga matrix: {e}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    export_yoga_matrix(sys.argv[1] if len(sys.argv) > 1 else "yoga_matrix.csv")
@@ -0,0 +1,34 @@
+"""Shared fixtures"""
+import pytest
+from datetime import datetime
+
+
+@pytest.fixture
+def db():
+    """An in-memory database with the full schema"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+    from app.models import Base
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine, autoflush=False)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def add_profile(db):
+    """Add a profile born in Delhi to the in-memory database"""
+    from app.models.profile import Profile
+
+    def add(name, birth_date=datetime(1990, 1, 15), birth_time="10:30:00", user_id=1):
+        profile = Profile(user_id=user_id, name=name, birth_date=birth_date, birth_time=birth_time,
+                          birth_place="Delhi", latitude=28.6139, longitude=77.2090,
+                          timezone="Asia/Kolkata", ayanamsa="LAHIRI")
+        db.add(profile)
+        db.commit()
+        return profile
+
+    return add
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Test Align27 group planner"""
+import pytest
+from datetime import date, timedelta
+from app.modules.align27.calculator import align27_calculator
+
+
+MEMBERS = [
+    {"profile_id": 1, "natal_moon_rasi": 5, "natal_asc_rasi": 3, "current_dasha": {"lord": "JUPITER"}},
+    {"profile_id": 2, "natal_moon_rasi": 10, "natal_asc_rasi": 7, "current_dasha": {"lord": "SATURN"}},
+    {"profile_id": 3, "natal_moon_rasi": 5, "natal_asc_rasi": 3, "current_dasha": {"lord": "JUPITER"}},
+]
+
+
+class TestGroupPlanner:
+    """Test group planner generation logic"""
+
+    def test_matrix_shape(self):
+        """Test that scores form a [members x days] matrix"""
+        group = align27_calculator.generate_group_planner(date(2026, 1, 1), 14, MEMBERS)
+
+        assert len(group["scores"]) == 3
+        assert all(len(row) == 14 for row in group["scores"])
+        assert group["profile_ids"] == [1, 2, 3]
+        assert len(group["dates"]) == 14
+
+    def test_shared_signatures_scored_once(self):
+        """Test that members with the same natal signature share one row"""
+        group = align27_calculator.generate_group_planner(date(2026, 1, 1), 7, MEMBERS)
+
+        assert group["distinct_signatures"] == 2
+        assert group["scores"][0] == group["scores"][2]
+
+    def test_scores_match_single_profile(self):
+        """Test that group scores equal the single-profile day score"""
+        start = date(2026, 1, 1)
+        group = align27_calculator.generate_group_planner(start, 5, MEMBERS)
+
+        for i in range(5):
+            expected = align27_calculator.calculate_day_score(
+                start + timedelta(days=i), 10, 7, {}, {"lord": "SATURN"}
+            )
+            assert group["scores"][1][i] == expected["score"]
+
+    def test_days_ranked_by_min_then_mean(self):
+        """Test that ranked days are ordered by min score, then mean score"""
+        group = align27_calculator.generate_group_planner(date(2026, 1, 1), 30, MEMBERS)
+        ranked = group["ranked_days"]
+
+        assert len(ranked) == 30
+        keys = [(d["min_score"], d["mean_score"]) for d in ranked]
+        assert keys == sorted(keys, reverse=True)
+
+        for entry in ranked:
+            column = group["dates"].index(entry["date"])
+            assert entry["min_score"] == min(row[column] for row in group["scores"])
+
+    def test_common_golden_windows(self):
+        """Test that common GOLDEN windows fall inside every member's GOLDEN moment"""
+        start = date(2026, 1, 5)
+        group = align27_calculator.generate_group_planner(start, 7, MEMBERS, include_golden=True)
+
+        assert "golden_windows" in group
+        for window in group["golden_windows"]:
+            target = date.fromisoformat(window["date"])
+            for moon_rasi, asc_rasi in [(5, 3), (10, 7)]:
+                moments = align27_calculator.generate_moments(target, moon_rasi, asc_rasi, {})
+                golden = next(m for m in moments if m["type"] == "GOLDEN")
+                assert golden["start"].strftime("%H:%M") <= window["start"]
+                assert window["end"] <= golden["end"].strftime("%H:%M")
+
+    def test_single_member_group(self):
+        """Test that a single-member group matches the planner scores"""
+        start = date(2026, 1, 1)
+        group = align27_calculator.generate_group_planner(start, 10, MEMBERS[:1])
+        planner = align27_calculator.generate_planner(start, 10, 5, 3, {}, {"lord": "JUPITER"})
+
+        assert group["scores"][0] == [entry["score"] for entry in planner]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
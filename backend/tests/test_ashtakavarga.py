@@ -1,5 +1,6 @@
 import pytest
-from app.modules.ashtakavarga.calculator import AshtakavargaCalculator
+import numpy as np
+from app.modules.ashtakavarga.calculator import AshtakavargaCalculator, BAV_TARGETS, BAV_CONTRIBUTORS
 
 def test_ashtakavarga_matrix_shapes():
     """Test that Ashtakavarga matrices have correct shapes"""
@@ -73,6 +74,74 @@ def test_ashtakavarga_invariants():
     
     print("✓ Ashtakavarga invariants test passed")
 
+def loop_ashtakavarga(calculator, row):
+    """BAV, SAV and reductions from the reference loops"""
+    positions = {contributor: {"rasi": int(rasi)} for contributor, rasi in zip(BAV_CONTRIBUTORS, row) if rasi}
+    bavs = {planet: calculator.calculate_bav(planet, positions) for planet in BAV_TARGETS}
+    return bavs, calculator.calculate_reductions(calculator.calculate_sav(bavs))
+
+def test_rule_tensor():
+    """Test the compiled rule tensor and the classical BAV totals"""
+    calculator = AshtakavargaCalculator()
+    
+    assert calculator.rule_tensor.shape == (7, 8, 12)
+    totals = calculator.rule_tensor.sum(axis=(1, 2)).tolist()
+    assert totals == [48, 49, 39, 54, 56, 52, 39]
+    assert sum(totals) == 337
+    
+    planets = {planet: {"rasi": (i * 5) % 12 + 1} for i, planet in enumerate(BAV_CONTRIBUTORS)}
+    assert calculator.calculate_all(planets)["summary"]["total_points"] == 337
+
+def test_batch_matches_loops():
+    """Test batched BAV, SAV and reductions against the per-chart loops"""
+    calculator = AshtakavargaCalculator()
+    rasis = np.random.default_rng(1).integers(1, 13, (2000, len(BAV_CONTRIBUTORS)))
+    rasis[::4, -1] = 0  # no ascendant
+    batch = calculator.calculate_batch(rasis)
+    
+    assert batch["bav"].shape == (2000, 7, 12)
+    for i, row in enumerate(rasis):
+        bavs, reductions = loop_ashtakavarga(calculator, row)
+        assert batch["bav"][i].tolist() == [bavs[planet] for planet in BAV_TARGETS]
+        assert batch["sav"][i].tolist() == reductions["original"]
+        assert batch["trikona_shodhana"][i].tolist() == reductions["trikona_shodhana"]
+        assert batch["ekadhipatya_shodhana"][i].tolist() == reductions["ekadhipatya_shodhana"]
+
+def test_transit_timeline():
+    """Test transit bindus and kakshyas against a day-by-day loop"""
+    from datetime import datetime
+    from app.modules.ephemeris.calculator import ephemeris
+    from app.modules.ashtakavarga.transits import transit_ashtakavarga, KAKSHYA_LORDS
+    
+    calculator = AshtakavargaCalculator()
+    natal = {planet: {"rasi": (i * 7) % 12 + 1} for i, planet in enumerate(BAV_CONTRIBUTORS)}
+    result = calculator.calculate_all(natal)
+    jd_start = ephemeris.get_julian_day(datetime(2025, 1, 1))
+    timeline = transit_ashtakavarga.timeline(natal, jd_start, jd_start + 120)
+    
+    assert timeline["count"] == 120
+    assert transit_ashtakavarga.timeline(natal, jd_start, jd_start + 120) is timeline
+    for day in range(0, 120, 7):
+        total = 0
+        for planet in BAV_TARGETS:
+            longitude = ephemeris.get_planet_position(jd_start + day, planet)["longitude"]
+            rasi = int(longitude / 30) + 1
+            kakshya = int((longitude % 30) / 3.75) + 1
+            lord = KAKSHYA_LORDS[kakshya - 1]
+            offset = (rasi - natal[lord]["rasi"]) % 12 + 1
+            series = timeline["planets"][planet]
+            
+            assert series["rasi"][day] == rasi
+            assert series["kakshya"][day] == kakshya
+            assert series["bindus"][day] == result["bav"][planet][rasi - 1]
+            assert series["sav"][day] == result["sav"][rasi - 1]
+            assert series["kakshya_bindu"][day] == int(offset in calculator.BAV_RULES[planet][lord])
+            total += series["bindus"][day]
+        assert timeline["total_bindus"][day] == total
+
 if __name__ == "__main__":
     test_ashtakavarga_matrix_shapes()
     test_ashtakavarga_invariants()
+    test_rule_tensor()
+    test_batch_matches_loops()
+    test_transit_timeline()
@@ -200,6 +200,30 @@ class TestYogas(TestSetup):
             for yoga in filtered_data["yogas"]:
                 assert yoga["type"] == category
 
+    def test_yoga_search(self, headers, profile_id):
+        """Test finding profiles by yoga through the index"""
+        yogas = requests.get(f"{BASE_URL}/api/yogas/{profile_id}", headers=headers).json()["yogas"]
+        if not yogas:
+            pytest.skip("Profile has no yogas")
+
+        names = [y["name"] for y in yogas[:2]]
+        response = requests.get(
+            f"{BASE_URL}/api/yogas/search",
+            params={"yoga": names, "match": "all"},
+            headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        match = next(p for p in data["profiles"] if p["profile_id"] == profile_id)
+        assert set(match["yogas"]) == set(names)
+
+        response = requests.get(
+            f"{BASE_URL}/api/yogas/search",
+            params={"yoga": names + ["No Such Yoga"], "match": "all"},
+            headers=headers
+        )
+        assert all(p["profile_id"] != profile_id for p in response.json()["profiles"])
+
 
 class TestStrength(TestSetup):
     """Planetary strength (Shadbala) module tests"""
@@ -248,6 +272,23 @@ class TestStrength(TestSetup):
         valid_planets = ["SUN", "MOON", "MARS", "MERCURY", "JUPITER", "VENUS", "SATURN"]
         assert data["strongest_planet"] in valid_planets
         assert data["weakest_planet"] in valid_planets
+    
+    def test_strength_persisted(self, headers, profile_id):
+        """Test stored strengths are served consistently across endpoints"""
+        shadbala = requests.get(
+            f"{BASE_URL}/api/strength/{profile_id}/shadbala",
+            headers=headers
+        ).json()["shadbala"]
+        summary = requests.get(
+            f"{BASE_URL}/api/strength/{profile_id}/summary",
+            headers=headers
+        ).json()
+        
+        assert summary["shadbala_summary"] == {p: data["total"] for p, data in shadbala.items()}
+        assert requests.get(
+            f"{BASE_URL}/api/strength/{profile_id}/shadbala",
+            headers=headers
+        ).json()["shadbala"] == shadbala
 
 
 class TestVarshaphala(TestSetup):
@@ -383,6 +424,29 @@ class TestCompatibility(TestSetup):
         assert "total_score" in data
         assert 0 <= data["total_score"] <= 36
 
+    def test_compatibility_reversed_pair(self, headers, profile_id):
+        """Test that a reversed pair is served from the same report, re-oriented"""
+        profiles_response = requests.get(f"{BASE_URL}/api/profiles", headers=headers)
+        profiles = profiles_response.json()
+
+        if len(profiles) < 2:
+            pytest.skip("Need at least 2 profiles for compatibility test")
+
+        profile2_id = profiles[1]["id"]
+
+        forward = requests.get(
+            f"{BASE_URL}/api/compatibility/{profile_id}/{profile2_id}",
+            headers=headers
+        ).json()
+        reverse = requests.get(
+            f"{BASE_URL}/api/compatibility/{profile2_id}/{profile_id}",
+            headers=headers
+        ).json()
+
+        assert reverse["profile1"]["id"] == profile2_id
+        assert reverse["manglik_analysis"]["profile1"] == forward["manglik_analysis"]["profile2"]
+        assert set(reverse["ashtakoot"]) == set(forward["ashtakoot"])
+
 
 class TestRemedies(TestSetup):
     """Remedies module tests"""
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Test chart boundary sensitivity"""
+import pytest
+from datetime import datetime, timedelta
+from app.modules.charts.calculator import chart_calculator
+from app.modules.ephemeris.calculator import ephemeris
+
+BIRTH = datetime(1990, 5, 15, 10, 30)
+LAT, LON = 28.6139, 77.2090
+
+
+@pytest.fixture(scope="module")
+def chart():
+    return chart_calculator.calculate_natal_chart(BIRTH, LAT, LON)
+
+
+def ascendant_at(dt):
+    jd = ephemeris.get_julian_day(dt)
+    return (ephemeris.get_houses(jd, LAT, LON)[0] - ephemeris.get_ayanamsa(jd)) % 360.0
+
+
+class TestChartSensitivity:
+    """Test minutes to the nearest boundary"""
+
+    def test_speeds_are_returned(self, chart):
+        """Test that planet speeds come back from the ephemeris"""
+        assert chart["planets"]["MOON"]["speed"] > 10
+        assert chart["planets"]["RAHU"]["speed"] < 0
+
+    def test_ketu_moves_with_rahu(self):
+        """Test Ketu's speed equals Rahu's and the vectorized longitudes"""
+        jd = 2451545.0
+        rahu = ephemeris.get_planet_position(jd, "RAHU")
+        ketu = ephemeris.get_planet_position(jd, "KETU")
+        longitudes, speeds = ephemeris.get_longitudes([jd], "KETU")
+
+        assert ketu["speed"] == rahu["speed"] < 0
+        assert ketu["speed"] == pytest.approx(speeds[0])
+        assert ketu["longitude"] == pytest.approx(longitudes[0])
+        assert ketu["is_retrograde"] == rahu["is_retrograde"]
+
+    def test_ascendant_sign_flip(self, chart):
+        """Test the predicted ascendant sign flip against a recast chart"""
+        entry = chart["sensitivity"]["points"]["ASCENDANT"]["rasi"]
+        sign = 1 if entry["direction"] == "later" else -1
+        rasi = ephemeris.get_rasi(chart["ascendant"])
+
+        assert ephemeris.get_rasi(ascendant_at(BIRTH + sign * timedelta(minutes=entry["minutes"] - 0.5))) == rasi
+        assert ephemeris.get_rasi(ascendant_at(BIRTH + sign * timedelta(minutes=entry["minutes"] + 0.5))) != rasi
+
+    def test_navamsa_flip(self, chart):
+        """Test the predicted D9 ascendant flip against a recast chart"""
+        entry = chart["sensitivity"]["points"]["ASCENDANT"]["D9"]
+        sign = 1 if entry["direction"] == "later" else -1
+        navamsa = chart_calculator.div_calculator.calculate_divisional_position(chart["ascendant"], 9)
+
+        moved = ascendant_at(BIRTH + sign * timedelta(minutes=entry["minutes"] + 0.2))
+        assert chart_calculator.div_calculator.calculate_divisional_position(moved, 9) != navamsa
+
+    def test_most_sensitive_sorted(self, chart):
+        """Test that the summary lists the smallest margins first"""
+        minutes = [entry["minutes"] for entry in chart["sensitivity"]["most_sensitive"]]
+        assert minutes == sorted(minutes)
+        assert len(chart["sensitivity"]["points"]) == 10
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Test eclipse catalog"""
+import pytest
+from datetime import datetime
+from app.modules.ephemeris.calculator import ephemeris
+from app.modules.eclipses.calculator import EclipseCatalog
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    catalog = EclipseCatalog()
+    catalog.index(catalog.compute(2020, 2025))
+    return catalog
+
+
+def jd(year, month, day):
+    return ephemeris.get_julian_day(datetime(year, month, day))
+
+
+class TestEclipseCatalog:
+    """Test eclipse computation and natal range queries"""
+
+    def test_2024_eclipses(self, catalog):
+        """Test the 2024 eclipses without penumbral lunar eclipses"""
+        eclipses = catalog.in_range(jd(2024, 1, 1), jd(2025, 1, 1))
+
+        assert [(e["eclipse_time"][:10], e["eclipse_type"], e["subtype"]) for e in eclipses] == [
+            ("2024-04-08", "SOLAR", "TOTAL"),
+            ("2024-09-18", "LUNAR", "PARTIAL"),
+            ("2024-10-02", "SOLAR", "ANNULAR"),
+        ]
+        assert eclipses[0]["nakshatra"] == "Revati"
+
+        with_penumbral = catalog.in_range(jd(2024, 1, 1), jd(2025, 1, 1), include_penumbral=True)
+        assert with_penumbral[0]["subtype"] == "PENUMBRAL"
+
+    def test_natal_hits_within_orb(self, catalog):
+        """Test that only eclipses within orb of a natal point are returned"""
+        natal_points = {"SUN": 354.0, "MOON": 100.0}
+        hits = catalog.natal_hits(natal_points, 0.0, 3.0, jd(2020, 1, 1), jd(2026, 1, 1))
+
+        assert hits
+        for eclipse in hits:
+            for contact in eclipse["contacts"]:
+                diff = (eclipse["longitude"] - natal_points[contact["point"]]) % 360.0
+                assert min(diff, 360.0 - diff) == pytest.approx(contact["separation"], abs=1e-3)
+                assert contact["separation"] <= 3.0
+        assert any(e["eclipse_time"].startswith("2024-04-08") for e in hits)
+
+    def test_orb_window_wraps_zero_aries(self):
+        """Test that orb windows across 0 degrees find eclipses on both sides"""
+        synthetic = EclipseCatalog()
+        synthetic.index([
+            {"eclipse_type": "SOLAR", "subtype": "TOTAL", "julian_day": 1.0, "longitude": 359.5, "rasi": 12},
+            {"eclipse_type": "LUNAR", "subtype": "TOTAL", "julian_day": 2.0, "longitude": 0.5, "rasi": 1},
+            {"eclipse_type": "SOLAR", "subtype": "PARTIAL", "julian_day": 3.0, "longitude": 180.0, "rasi": 7},
+        ])
+
+        hits = synthetic.natal_hits({"MARS": 0.2}, 0.0, 1.0, 0.0, 10.0)
+        assert [h["julian_day"] for h in hits] == [1.0, 2.0]
+        assert hits[0]["contacts"][0]["separation"] == pytest.approx(0.7)
+
+    def test_houses_from_ascendant(self, catalog):
+        """Test whole-sign houses counted from the ascendant rasi"""
+        eclipses = catalog.natal_hits({}, 45.0, 1.0, jd(2024, 1, 1), jd(2025, 1, 1), only_hits=False)
+
+        for eclipse in eclipses:
+            assert eclipse["house"] == (eclipse["rasi"] - 2) % 12 + 1
+            assert eclipse["contacts"] == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Test the precomputed Ashtakoot koota tensor"""
+import pytest
+import numpy as np
+from app.modules.compatibility.calculator import (
+    compatibility_calculator, moon_pada_index, KOOTAS, NUM_PADAS
+)
+
+
+class TestKootaTable:
+    """Test koota scores looked up from the tensor"""
+
+    def test_shape_and_dtype(self):
+        """Test a 108 x 108 x 8 int8 tensor"""
+        table = compatibility_calculator.koota_table
+        assert table.half_points.shape == (NUM_PADAS, NUM_PADAS, len(KOOTAS))
+        assert table.half_points.dtype == np.int8
+
+    def test_matches_rules(self):
+        """Test every pair against the koota rules"""
+        table = compatibility_calculator.koota_table
+        for male in range(NUM_PADAS):
+            for female in range(NUM_PADAS):
+                expected = compatibility_calculator.score_kootas(male, female)
+                assert list(table.scores(male, female).values()) == expected
+
+    def test_batch_totals(self):
+        """Test that fancy-indexed totals match pairwise scoring"""
+        table = compatibility_calculator.koota_table
+        males = np.array([0, 17, 54, 107])
+        females = np.arange(NUM_PADAS)
+        totals = table.totals(males[:, None], females[None, :])
+
+        assert totals.shape == (4, NUM_PADAS)
+        for i, male in enumerate(males):
+            for female in (0, 33, 99):
+                assert totals[i, female] == sum(s for s, _ in compatibility_calculator.score_kootas(int(male), female))
+
+    def test_calculate_ashtakoot(self):
+        """Test the full report uses the pada of each Moon longitude"""
+        male = {"planets": {"MOON": {"longitude": 100.0}}}
+        female = {"planets": {"MOON": {"longitude": 250.0}}}
+        report = compatibility_calculator.calculate_ashtakoot(male, female)
+
+        assert moon_pada_index(100.0) == 30
+        assert report["total"] == sum(s for s, _ in compatibility_calculator.score_kootas(30, 75))
+        assert report["scores"]["graha_maitri"] == (2.5, "Neutral lords")  # Moon vs Jupiter
+        assert 0 <= report["total"] <= report["max"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Test KP sub-lord tables"""
+import pytest
+import numpy as np
+import swisseph as swe
+from datetime import datetime
+from app.modules.dasha.calculator import VIMSHOTTARI_PERIODS, VIMSHOTTARI_SEQUENCE
+from app.modules.kp.calculator import kp_calculator
+from app.modules.charts.calculator import chart_calculator
+
+
+def walk_sub_lord(longitude):
+    """Reference sub lord by walking Vimshottari proportions"""
+    span = 40.0 / 3.0
+    nakshatra = int(longitude / span)
+    offset = longitude - nakshatra * span
+    for i in range(9):
+        lord = VIMSHOTTARI_SEQUENCE[(nakshatra + i) % 9]
+        part = span * VIMSHOTTARI_PERIODS[lord] / 120.0
+        if offset < part:
+            return lord
+        offset -= part
+
+
+class TestKPTables:
+    """Test KP boundary tables and lookups"""
+
+    def test_segment_counts(self):
+        """Test 249 subs and 2187 sub-subs plus sign splits"""
+        assert len(kp_calculator.subs["starts"]) == 249
+        assert len(kp_calculator.sub_subs["starts"]) == 2187 + 6
+        assert np.all(np.diff(kp_calculator.subs["starts"]) > 0)
+
+    def test_known_lords(self):
+        """Test lords at known points of the KP table"""
+        first, aries_end, taurus_start = kp_calculator.lookup([0.0, 29.99, 30.01])
+
+        assert (first["sign_lord"], first["star_lord"], first["sub_lord"]) == ("MARS", "KETU", "KETU")
+        # Krittika's Rahu sub straddles Aries/Taurus and is split into subs 22 and 23
+        assert (aries_end["star_lord"], aries_end["sub_lord"], aries_end["sub_number"]) == ("SUN", "RAHU", 22)
+        assert (taurus_start["sign_lord"], taurus_start["sub_lord"], taurus_start["sub_number"]) == ("VENUS", "RAHU", 23)
+
+    def test_lookup_matches_walk(self):
+        """Test binary-search lookups against walking the proportions"""
+        longitudes = np.random.default_rng(7).uniform(0.0, 360.0, 500)
+        for row, longitude in zip(kp_calculator.lookup(longitudes), longitudes):
+            assert row["sub_lord"] == walk_sub_lord(longitude)
+
+    def test_cusps(self):
+        """Test that the first and tenth cusps are the ascendant and MC"""
+        table = kp_calculator.calculate_table(datetime(1990, 5, 15, 5, 0), 28.6139, 77.2090)
+        jd = kp_calculator.ephemeris.get_julian_day(datetime(1990, 5, 15, 5, 0))
+        _, ascmc = swe.houses(jd, 28.6139, 77.2090, b'P')
+
+        assert len(table["cusps"]) == 12
+        assert table["cusps"][0]["longitude"] == pytest.approx((ascmc[0] - table["ayanamsa_value"]) % 360.0)
+        assert table["cusps"][9]["longitude"] == pytest.approx((ascmc[1] - table["ayanamsa_value"]) % 360.0)
+
+    def test_natal_chart_mc(self):
+        """Test that the natal chart MC is the tenth cusp"""
+        chart = chart_calculator.calculate_natal_chart(datetime(1990, 5, 15, 5, 0), 28.6139, 77.2090)
+        _, ascmc = swe.houses(chart["julian_day"], 28.6139, 77.2090, b'P')
+
+        assert chart["house_cusps"][0] == pytest.approx(chart["ascendant"])
+        assert chart["mc"] == pytest.approx((ascmc[1] - chart["ayanamsa_value"]) % 360.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Test the columnar matchmaking index"""
+import time
+import pytest
+import numpy as np
+from app.modules.compatibility.calculator import compatibility_calculator
+from app.modules.compatibility.matching import MatchIndex
+
+PLANETS = ["SUN", "MOON", "MARS", "MERCURY", "JUPITER", "VENUS", "SATURN", "RAHU", "KETU"]
+
+
+def make_chart(rng):
+    longitudes = rng.uniform(0.0, 360.0, len(PLANETS) + 1)
+    return {
+        "ascendant": longitudes[0],
+        "planets": {
+            planet: {"longitude": lon, "rasi": int(lon / 30.0) + 1, "dignity": "Neutral"}
+            for planet, lon in zip(PLANETS, longitudes[1:])
+        }
+    }
+
+
+@pytest.fixture(scope="module")
+def index():
+    rng = np.random.default_rng(3)
+    index = MatchIndex()
+    charts = {}
+    for profile_id in range(1, 1001):
+        charts[profile_id] = make_chart(rng)
+        index.upsert(profile_id, f"P{profile_id}", str(profile_id), charts[profile_id])
+    index.charts = charts
+    return index
+
+
+class TestMatchIndex:
+    """Test vectorized match ranking"""
+
+    def test_scores_match_ashtakoot(self, index):
+        """Test that ranked totals equal the pairwise Ashtakoot total"""
+        matches = index.search(1, limit=20)
+        assert len(matches) == 20
+        for match in matches:
+            report = compatibility_calculator.calculate_ashtakoot(index.charts[1], index.charts[match["profile_id"]])
+            assert match["total_score"] == report["total"]
+        assert [m["total_score"] for m in matches] == sorted((m["total_score"] for m in matches), reverse=True)
+
+    def test_female_side(self, index):
+        """Test scoring the seeker as the female chart"""
+        match = index.search(1, seeker_side="female", limit=1)[0]
+        report = compatibility_calculator.calculate_ashtakoot(index.charts[match["profile_id"]], index.charts[1])
+        assert match["total_score"] == report["total"]
+
+    def test_filters(self, index):
+        """Test minimum score, Nadi dosha and Manglik filters"""
+        seeker_manglik = bool(index.manglik[index.row(1)])
+        matches = index.search(1, limit=1000, min_score=20, manglik_match=True, exclude_nadi_dosha=True)
+
+        assert matches
+        assert all(m["total_score"] >= 20 for m in matches)
+        assert all(not m["nadi_dosha"] and m["kootas"]["nadi"] == 8 for m in matches)
+        assert all(m["manglik"] == seeker_manglik for m in matches)
+        assert all(m["profile_id"] != 1 for m in matches)
+
+    def test_speed(self, index):
+        """Test that a thousand candidates are ranked in milliseconds"""
+        compatibility_calculator.koota_table
+        started = time.perf_counter()
+        index.search(1, limit=50)
+        assert time.perf_counter() - started < 0.1
+
+    def test_incremental_updates(self):
+        """Test replacing and removing candidates"""
+        rng = np.random.default_rng(5)
+        index = MatchIndex()
+        for profile_id in (1, 2, 3):
+            index.upsert(profile_id, f"P{profile_id}", "a", make_chart(rng))
+
+        replacement = make_chart(rng)
+        index.upsert(2, "Renamed", "b", replacement)
+        assert len(index) == 3
+        assert index.names[index.row(2)] == "Renamed"
+        assert index.longitudes[index.row(2), 0] == replacement["ascendant"]
+
+        index.remove({3})
+        assert index.row(3) is None
+        assert [m["profile_id"] for m in index.search(1)] == [2]
+
+    def test_capacity_grows(self):
+        """Test columns double when full and rows stay addressable"""
+        rng = np.random.default_rng(7)
+        index = MatchIndex(capacity=2)
+        for profile_id in range(10, 15):
+            index.upsert(profile_id, f"P{profile_id}", "a", make_chart(rng))
+
+        assert len(index) == 5 and len(index._profile_ids) == 8
+        assert index.profile_ids.tolist() == [10, 11, 12, 13, 14]
+        index.remove({11, 13})
+        assert [index.row(profile_id) for profile_id in (10, 11, 12, 14)] == [0, None, 1, 2]
+
+    def test_sync_reloads_only_changed_profiles(self, db, add_profile, monkeypatch):
+        """Test syncing skips unchanged users and recomputes only edited profiles"""
+        from app.api.compatibility import sync_match_index
+        from app.modules.compatibility.matching import match_indexes
+
+        match_indexes.clear()
+        profiles = [add_profile(f"P{i}", birth_time=f"{8 + i:02d}:15:00") for i in range(4)]
+        index = sync_match_index(1, db)
+        assert sorted(index.profile_ids.tolist()) == [profile.id for profile in profiles]
+
+        upserted = []
+        upsert = index.upsert
+        monkeypatch.setattr(index, "upsert", lambda profile_id, *args: (upserted.append(profile_id), upsert(profile_id, *args)))
+
+        assert sync_match_index(1, db) is index and upserted == []
+
+        profiles[1].birth_time = "23:40:00"
+        profiles[2].name = "Renamed"
+        db.commit()
+        sync_match_index(1, db)
+        assert upserted == [profiles[1].id]
+        assert index.names[index.row(profiles[2].id)] == "Renamed"
+
+        db.delete(profiles[3])
+        added = add_profile("New")
+        sync_match_index(1, db)
+        assert upserted == [profiles[1].id, added.id]
+        assert index.row(profiles[3].id) is None
+        assert len(index) == 4
+        match_indexes.clear()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
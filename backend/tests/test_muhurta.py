@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Test muhurta search"""
+import pytest
+import numpy as np
+from datetime import date, datetime
+from app.modules.ephemeris.calculator import ephemeris
+from app.modules.muhurta.intervals import IntervalIndex
+from app.modules.muhurta.calculator import (
+    muhurta_calculator, HORA_SEQUENCE, FAVORABLE_TARAS, TARA_NAMES
+)
+from app.modules.panchang.calculator import VARA_LORDS
+
+DELHI = (28.6139, 77.2090, "Asia/Kolkata")
+
+
+class TestIntervalIndex:
+    """Test sorted interval operations"""
+
+    def test_intersect(self):
+        """Test intersection keeps own labels"""
+        a = IntervalIndex([0, 10], [5, 20], [1, 2])
+        b = IntervalIndex([3, 8, 15], [4, 12, 30])
+        result = a.intersect(b)
+
+        assert list(result.starts) == [3, 10, 15]
+        assert list(result.ends) == [4, 12, 20]
+        assert list(result.labels) == [1, 2, 2]
+
+    def test_subtract(self):
+        """Test subtraction splits intervals around removed time"""
+        a = IntervalIndex([0], [10])
+        b = IntervalIndex([2, 6], [3, 7])
+        result = a.subtract(b)
+
+        assert list(zip(result.starts, result.ends)) == [(0, 2), (3, 6), (7, 10)]
+
+    def test_merged_and_lookup(self):
+        """Test merging touching intervals and label lookup"""
+        a = IntervalIndex([0, 5, 12], [5, 8, 15], [1, 2, 3])
+        merged = a.merged()
+
+        assert list(zip(merged.starts, merged.ends)) == [(0, 8), (12, 15)]
+        assert list(a.label_at([1, 6, 10, 13])) == [1, 2, -1, 3]
+        assert a.labels_between(4, 13) == [1, 2, 3]
+
+
+class TestMuhurta:
+    """Test muhurta window index and search"""
+
+    def test_hora_sequence(self):
+        """Test that each day starts with its vara lord's hora in Chaldean order"""
+        index = muhurta_calculator.build_index(date(2024, 4, 1), 7, *DELHI)
+        horas = index["hora"]
+
+        assert len(horas) == 7 * 24
+        for day in range(7):
+            weekday = date(2024, 4, 1 + day).weekday()
+            lords = [HORA_SEQUENCE[label] for label in horas.labels[day * 24:(day + 1) * 24]]
+            assert lords[0] == VARA_LORDS[weekday]
+            # The next day's lord is the 25th hora counted in Chaldean order
+            assert HORA_SEQUENCE[(HORA_SEQUENCE.index(lords[0]) + 24) % 7] == VARA_LORDS[(weekday + 1) % 7]
+
+    def test_rahu_kaal_monday(self):
+        """Test that Monday Rahu Kaal is the second eighth of daytime"""
+        index = muhurta_calculator.build_index(date(2024, 4, 8), 1, *DELHI)
+        rahu = index["RAHU_KAAL"]
+        start = ephemeris.get_datetime(rahu.starts[0])
+
+        # Sunrise 06:06 IST, day length ~12h33m -> 07:40 IST (02:10 UTC)
+        assert start.strftime("%H:%M") in ("02:09", "02:10", "02:11")
+
+    def test_windows_satisfy_constraints(self):
+        """Test that every window meets tithi, hora and avoid constraints"""
+        tithis = [2, 3, 5, 7, 10, 11, 13]
+        lords = ["JUPITER", "VENUS"]
+        index = muhurta_calculator.build_index(date(2024, 4, 1), 30, *DELHI)
+        windows = muhurta_calculator.search(
+            date(2024, 4, 1), 30, *DELHI,
+            tithis=tithis, hora_lords=lords, min_duration_minutes=1, limit=200
+        )
+
+        assert windows
+        for window in windows:
+            start = ephemeris.get_julian_day(datetime.fromisoformat(window["start"]))
+            end = ephemeris.get_julian_day(datetime.fromisoformat(window["end"]))
+            probes = np.linspace(start, end, 5)[1:-1]
+            assert all(t + 1 in tithis for t in index["tithi"].label_at(probes))
+            assert all(HORA_SEQUENCE[h] in lords for h in index["hora"].label_at(probes))
+            assert all(label == -1 for label in index["RAHU_KAAL"].label_at(probes))
+
+    def test_natal_bala_filter(self):
+        """Test that natal search only returns favourable Tara windows"""
+        windows = muhurta_calculator.search(
+            date(2024, 4, 1), 30, *DELHI, natal_moon_longitude=125.0, limit=200
+        )
+
+        assert windows
+        for window in windows:
+            assert TARA_NAMES.index(window["tara"]) + 1 in FAVORABLE_TARAS
+            assert window["chandra_house"] in [1, 3, 6, 7, 10, 11]
+
+    def test_ranked(self):
+        """Test that windows are ranked by score then duration"""
+        windows = muhurta_calculator.search(date(2024, 4, 1), 30, *DELHI, limit=50)
+        keys = [(w["score"], w["duration_minutes"]) for w in windows]
+
+        assert keys == sorted(keys, reverse=True)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
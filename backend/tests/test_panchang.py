@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Test panchang calculations"""
+import pytest
+import threading
+from datetime import date, datetime
+from app.modules.ephemeris.calculator import ephemeris
+from app.modules.panchang.calculator import (
+    panchang_calculator, location_cell, KARANA_NAMES, LIMB_TABLES
+)
+
+DELHI = (28.6139, 77.2090, "Asia/Kolkata")
+
+
+class TestPanchang:
+    """Test panchang limbs and caching"""
+
+    def test_delhi_amavasya(self):
+        """Test panchang for New Delhi on 2024-04-08 against published values"""
+        day = panchang_calculator.calculate_range(date(2024, 4, 8), 1, *DELHI)[0]
+
+        assert day["vara"] == "Somavara"
+        assert day["sunrise"].strftime("%H:%M") == "06:06"
+        assert day["tithi"]["name"] == "Amavasya"
+        assert day["tithi"]["end"].strftime("%Y-%m-%d %H:%M") == "2024-04-08 23:50"
+        assert day["nakshatra"]["name"] == "Uttara Bhadrapada"
+        assert day["nakshatra"]["end"].strftime("%H:%M") == "10:12"
+        assert day["yoga"]["name"] == "Indra"
+        assert day["karana"]["name"] == "Chatushpada"
+
+    def test_limb_ends_after_sunrise(self):
+        """Test that every limb in effect at sunrise ends after sunrise"""
+        days = panchang_calculator.calculate_range(date(2024, 12, 20), 30, *DELHI)
+
+        for day in days:
+            for limb in LIMB_TABLES:
+                assert day[limb]["end"] > day["sunrise"]
+
+    def test_cache_by_location_cell(self):
+        """Test that nearby locations in one cell reuse cached days"""
+        panchang_calculator.calculate_range(date(2025, 3, 1), 10, 12.97, 77.59, "Asia/Kolkata")
+        hits = panchang_calculator.cache.hits
+        again = panchang_calculator.calculate_range(date(2025, 3, 1), 10, 12.98, 77.58, "Asia/Kolkata")
+
+        assert location_cell(12.97, 77.59) == location_cell(12.98, 77.58)
+        assert panchang_calculator.cache.hits == hits + 10
+        assert len(again) == 10
+
+    def test_columns(self):
+        """Test columnar packing"""
+        days = panchang_calculator.calculate_range(date(2024, 4, 1), 30, *DELHI)
+        packed = panchang_calculator.to_columns(days)
+
+        assert all(len(column) == 30 for column in packed["columns"].values())
+        assert packed["names"]["karana"] == KARANA_NAMES
+        assert packed["names"]["tithi"][packed["columns"]["tithi"][7]] == "Amavasya"
+
+    def test_karana_names(self):
+        """Test the 60 half-tithi karana sequence"""
+        assert len(KARANA_NAMES) == 60
+        assert KARANA_NAMES[0] == "Kimstughna"
+        assert KARANA_NAMES[1] == "Bava"
+        assert KARANA_NAMES[56] == "Vishti"
+        assert KARANA_NAMES[57:] == ["Shakuni", "Chatushpada", "Naga"]
+
+    def test_ayanamsa_in_worker_thread(self):
+        """Test that sidereal positions do not depend on the calling thread"""
+        jd = ephemeris.get_julian_day(datetime(2024, 4, 8, 4, 0))
+        expected = ephemeris.get_planet_position(jd, "MOON")["longitude"]
+        result = {}
+
+        worker = threading.Thread(
+            target=lambda: result.update(ephemeris.get_planet_position(jd, "MOON"))
+        )
+        worker.start()
+        worker.join()
+
+        assert result["longitude"] == pytest.approx(expected)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Test Prashna charts and their minute/location cache"""
+import pytest
+from datetime import datetime, timezone, timedelta
+from app.modules.charts.calculator import chart_calculator
+from app.modules.prashna.calculator import PrashnaCalculator
+
+
+@pytest.fixture
+def prashna():
+    return PrashnaCalculator()
+
+
+class TestPrashnaChart:
+    """Test Prashna chart calculation and caching"""
+
+    def test_matches_natal_chart(self, prashna):
+        """Test that a Prashna chart matches a natal chart cast for the cell centre"""
+        chart = prashna.calculate(datetime(2024, 4, 8, 10, 15, 42), 28.6139, 77.2090)
+        natal = chart_calculator.calculate_natal_chart(datetime(2024, 4, 8, 10, 15), chart["latitude"], chart["longitude"])
+
+        assert chart["moment"] == "2024-04-08T10:15:00"
+        assert chart["ascendant"] == pytest.approx(natal["ascendant"])
+        assert chart["planets"]["MOON"]["longitude"] == pytest.approx(natal["planets"]["MOON"]["longitude"])
+
+    def test_same_minute_and_cell_hit_cache(self, prashna):
+        """Test that requests in the same minute and cell share one chart"""
+        first = prashna.calculate(datetime(2024, 4, 8, 10, 15, 5), 28.6139, 77.2090)
+        second = prashna.calculate(datetime(2024, 4, 8, 10, 15, 55), 28.6101, 77.2011)
+
+        assert second is first
+        assert prashna.charts.hits == 1
+
+    def test_planets_shared_across_locations(self, prashna):
+        """Test that a new location reuses the minute's planet snapshot"""
+        delhi = prashna.calculate(datetime(2024, 4, 8, 10, 15), 28.6139, 77.2090)
+        mumbai = prashna.calculate(datetime(2024, 4, 8, 10, 15), 19.0760, 72.8777)
+
+        assert mumbai["planets"] is delhi["planets"]
+        assert mumbai["ascendant"] != delhi["ascendant"]
+        assert len(prashna.snapshots) == 1
+
+    def test_aware_moment_converted_to_utc(self, prashna):
+        """Test that an offset-aware moment is keyed by its UTC minute"""
+        ist = timezone(timedelta(hours=5, minutes=30))
+        chart = prashna.calculate(datetime(2024, 4, 8, 15, 45, tzinfo=ist), 28.6139, 77.2090)
+        assert chart["moment"] == "2024-04-08T10:15:00"
+
+    def test_ayanamsa_in_key(self, prashna):
+        """Test that a different ayanamsa gives a different chart"""
+        lahiri = prashna.calculate(datetime(2024, 4, 8, 10, 15), 28.6139, 77.2090, "LAHIRI")
+        raman = prashna.calculate(datetime(2024, 4, 8, 10, 15), 28.6139, 77.2090, "RAMAN")
+
+        assert raman["ayanamsa_value"] < lahiri["ayanamsa_value"]
+        assert raman["planets"]["SUN"]["longitude"] > lahiri["planets"]["SUN"]["longitude"]
+
+        with pytest.raises(ValueError):
+            prashna.calculate(datetime(2024, 4, 8, 10, 15), 28.6139, 77.2090, "UNKNOWN")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
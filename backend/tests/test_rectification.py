@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Test birth time rectification sweeps"""
+import pytest
+from datetime import datetime, timedelta
+from app.modules.ephemeris.calculator import ephemeris
+from app.modules.rectification.calculator import rectification_calculator
+
+BIRTH = datetime(1990, 5, 15, 10, 30)
+LAT, LON = 28.6139, 77.2090
+REFERENCE = datetime(2024, 1, 1)
+
+
+@pytest.fixture(scope="module")
+def scan():
+    return rectification_calculator.scan(BIRTH, LAT, LON, window_minutes=120, reference=REFERENCE)
+
+
+class TestRectificationScan:
+    """Test chart variants across a birth time window"""
+
+    def test_variants_cover_window(self, scan):
+        """Test that variants tile the window without gaps"""
+        variants = scan["variants"]
+        assert variants[0]["start_offset_minutes"] == -120
+        assert variants[-1]["end_offset_minutes"] == 120
+        for previous, current in zip(variants, variants[1:]):
+            assert previous["end"] == current["start"]
+        assert sum(v["contains_recorded_time"] for v in variants) == 1
+
+    def test_ascendant_changes_sign(self, scan):
+        """Test that a four hour window crosses at least one ascendant sign"""
+        fields = {change["field"] for change in scan["changes"]}
+        assert "ascendant_rasi" in fields
+        assert "d9_ascendant" in fields
+        assert "d10_ascendant" in fields
+
+    def test_changes_are_exact(self, scan):
+        """Test that features differ just before and just after each change"""
+        for change in scan["changes"][:6]:
+            instant = BIRTH + timedelta(minutes=change["offset_minutes"])
+            before = rectification_calculator.chart_features(instant - timedelta(seconds=3), LAT, LON, REFERENCE)
+            after = rectification_calculator.chart_features(instant + timedelta(seconds=3), LAT, LON, REFERENCE)
+            assert before[change["field"]] == change["from"]
+            assert after[change["field"]] == change["to"]
+
+    def test_recorded_variant_matches_chart(self, scan):
+        """Test that the variant holding the recorded time matches the natal chart"""
+        variant = next(v for v in scan["variants"] if v["contains_recorded_time"])
+        jd = ephemeris.get_julian_day(BIRTH)
+        moon = ephemeris.get_planet_position(jd, "MOON")["longitude"]
+        ascendant = (ephemeris.get_houses(jd, LAT, LON)[0] - ephemeris.get_ayanamsa(jd)) % 360.0
+
+        assert variant["ascendant_rasi"] == ephemeris.get_rasi(ascendant)
+        assert (variant["moon_nakshatra"], variant["moon_pada"]) == ephemeris.get_nakshatra(moon)
+        assert variant["maha_dasha"] is not None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Test Sade Sati timeline from Saturn ingress tables"""
+import pytest
+from datetime import datetime, timedelta
+from app.modules.ephemeris.calculator import ephemeris
+from app.modules.transits.ingress import ingress_table
+from app.modules.transits.calculator import transit_calculator
+
+
+def jd(year, month, day):
+    return ephemeris.get_julian_day(datetime(year, month, day))
+
+
+class TestSaturnIngress:
+    """Test exact Saturn sign ingresses"""
+
+    def test_known_ingresses(self):
+        """Test Saturn's Lahiri ingresses into Capricorn (2020) and Pisces (2025)"""
+        rasi_index, start, _ = ingress_table("SATURN").lookup(jd(2020, 6, 1))
+        assert rasi_index == 9
+        assert abs(ephemeris.get_datetime(start) - datetime(2020, 1, 24)) < timedelta(days=1)
+
+        rasi_index, start, _ = ingress_table("SATURN").lookup(jd(2025, 6, 1))
+        assert rasi_index == 11
+        assert abs(ephemeris.get_datetime(start) - datetime(2025, 3, 29)) < timedelta(days=1)
+
+    def test_intervals_match_positions(self):
+        """Test that Saturn is in the tabulated sign inside every interval"""
+        for rasi_index, start, end in ingress_table("SATURN").intervals(jd(1950, 1, 1), jd(2050, 1, 1)):
+            middle = (start + end) / 2
+            longitude = ephemeris.get_planet_position(middle, "SATURN")["longitude"]
+            assert int(longitude / 30.0) == rasi_index
+
+    def test_retrograde_reentry(self):
+        """Test that a retrograde return to the previous sign appears as its own interval"""
+        # Saturn entered Capricorn Jan 2020, Aquarius Apr 2022, back to Capricorn Jul 2022
+        signs = [i for i, _, _ in ingress_table("SATURN").intervals(jd(2020, 6, 1), jd(2023, 6, 1))]
+        assert signs == [9, 10, 9, 10]
+
+
+class TestSadeSatiTimeline:
+    """Test lifetime Sade Sati and Dhaiya periods"""
+
+    def test_aquarius_moon(self):
+        """Test Sade Sati for an Aquarius Moon spans Capricorn to Pisces"""
+        timeline = transit_calculator.saturn_moon_timeline(11, jd(2000, 1, 1), jd(2040, 1, 1))
+        period = timeline["sade_sati"][0]
+
+        assert period["start"].startswith("2020-01-24")
+        assert period["end"].startswith("2028-02")
+        assert [p["phase"] for p in period["phases"]][0] == "rising"
+        assert {p["phase"] for p in period["phases"]} == {"rising", "peak", "setting"}
+
+    def test_phases_follow_saturn_house(self):
+        """Test that each phase matches Saturn's house from the Moon"""
+        moon_rasi = 4
+        timeline = transit_calculator.saturn_moon_timeline(moon_rasi, jd(1950, 1, 1), jd(2050, 1, 1))
+        houses = {"rising": 12, "peak": 1, "setting": 2, "dhaiya": 4, "kantaka": 8}
+
+        assert len(timeline["sade_sati"]) >= 3
+        for kind in ("sade_sati", "dhaiya"):
+            for period in timeline[kind]:
+                for phase in period["phases"]:
+                    assert (phase["saturn_rasi"] - moon_rasi) % 12 + 1 == houses[phase["phase"]]
+                    assert phase["start"] < phase["end"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Test vectorized Shadbala against the per-planet loops"""
+import time
+import pytest
+import numpy as np
+from app.modules.strength.calculator import StrengthCalculator, SHADBALA_PLANETS, DRIK_PLANETS, round2
+
+DIGNITIES = ["Exalted", "Own", "Friend", "Neutral", "Enemy", "Debilitated"]
+
+
+def random_charts(count, seed=5):
+    rng = np.random.default_rng(seed)
+    charts = []
+    for _ in range(count):
+        planets = {}
+        for planet in DRIK_PLANETS:
+            if rng.random() < 0.03:
+                continue
+            longitude = float(rng.uniform(0, 360))
+            planets[planet] = {
+                "longitude": longitude,
+                "rasi": int(longitude // 30) + 1,
+                "dignity": str(rng.choice(DIGNITIES)),
+                "is_retrograde": bool(rng.random() < 0.2)
+            }
+        charts.append(planets)
+    return charts
+
+
+STHANA_FIELDS = ["uccha_bala", "saptavargaja_bala", "ojhayugma_bala", "kendradi_bala", "drekkana_bala"]
+SCALAR_FIELDS = ["dig_bala", "chesta_bala", "naisargika_bala", "drik_bala",
+                 "total_shashtiamsas", "total_rupas", "strength_ratio", "is_strong"]
+
+
+class TestShadbalaBatch:
+    """Test batched strength calculations"""
+
+    def test_round2_matches_round(self):
+        """Test array rounding agrees with round() including half-cent cases"""
+        values = np.concatenate([
+            np.random.default_rng(3).uniform(-100, 400, 20000),
+            [2.675, 1.005, 0.125, 0.375, -2.675, 10.045, 59.995]
+        ])
+        assert round2(values).tolist() == [round(v, 2) for v in values.tolist()]
+
+    def test_matches_loops(self):
+        """Test every chart, planet and component against calculate_shadbala"""
+        calculator = StrengthCalculator()
+        charts = random_charts(1500)
+        batch = calculator.calculate_shadbala_batch(calculator.planet_arrays(charts))
+
+        assert batch["total_shashtiamsas"].shape == (1500, len(SHADBALA_PLANETS))
+        for i, planets in enumerate(charts):
+            shadbala = calculator.calculate_shadbala(planets, 2451545.0)
+            for j, planet in enumerate(SHADBALA_PLANETS):
+                assert batch["present"][i, j] == (planet in shadbala)
+                if planet not in shadbala:
+                    continue
+                expected = shadbala[planet]
+                for field in STHANA_FIELDS:
+                    assert batch[field][i, j] == expected["sthana_bala"][field]
+                assert batch["sthana_bala"][i, j] == expected["sthana_bala"]["total"]
+                assert batch["kala_bala"][i, j] == expected["kala_bala"]["total"]
+                for field in SCALAR_FIELDS:
+                    assert batch[field][i, j] == expected[field], field
+
+    def test_bhavabala_batch(self):
+        """Test batched Bhavabala totals"""
+        calculator = StrengthCalculator()
+        bhavabala = calculator.calculate_bhavabala(None)
+        totals = calculator.calculate_bhavabala_batch(3)
+        assert totals.shape == (3, 12)
+        assert totals[2].tolist() == [bhavabala[house]["total"] for house in range(1, 13)]
+
+    def test_batch_speed(self):
+        """Test ten thousand charts are computed in well under a second"""
+        calculator = StrengthCalculator()
+        arrays = calculator.planet_arrays(random_charts(10000, seed=9))
+        started = time.perf_counter()
+        calculator.calculate_shadbala_batch(arrays)
+        assert time.perf_counter() - started < 0.5
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
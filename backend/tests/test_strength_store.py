@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Test the layout of persisted strength results"""
+import pytest
+from app.modules.strength.calculator import strength_calculator
+from app.models.strength import Strength
+from app.modules.strength.store import STRENGTH_TYPES, StrengthStore, strength_store
+
+PLANETS = {
+    planet: {"longitude": rasi * 30.0 - 12.5, "rasi": rasi, "dignity": "Neutral",
+             "is_retrograde": planet == "SATURN", "is_combust": planet == "MERCURY"}
+    for planet, rasi in {
+        "SUN": 10, "MOON": 4, "MARS": 7, "MERCURY": 10, "JUPITER": 3,
+        "VENUS": 11, "SATURN": 9, "RAHU": 10, "KETU": 4
+    }.items()
+}
+
+
+class TestStrengthStore:
+    """Test every strength type maps onto Strength rows"""
+
+    def test_row_keys_and_values(self):
+        """Test each result is keyed by planet or house and carries its value field"""
+        results = {
+            "shadbala": strength_calculator.calculate_shadbala(PLANETS, 2451545.0),
+            "bhavabala": strength_calculator.calculate_bhavabala(None),
+            "vargabala": strength_calculator.calculate_vargabala({1: {"SUN": 10}, 9: {"SUN": 4}}),
+            "ishtakashta": strength_calculator.calculate_ishtakashta(PLANETS),
+            "avasthas": strength_calculator.calculate_avasthas(PLANETS),
+        }
+        assert set(results) == set(STRENGTH_TYPES)
+
+        for strength_type, (key, value_field) in STRENGTH_TYPES.items():
+            assert results[strength_type], strength_type
+            for name, components in results[strength_type].items():
+                assert isinstance(name, int if key == "house" else str)
+                assert isinstance(components[value_field], (int, float)), (strength_type, name)
+
+    def test_engine_version(self):
+        """Test the store serves the current engine version"""
+        from app.modules.strength.store import STRENGTH_ENGINE_VERSION
+        assert strength_store.version == STRENGTH_ENGINE_VERSION
+
+
+class TestStrengthPersistence:
+    """Test strength results stored in and served from the database"""
+
+    @pytest.fixture
+    def chart(self, db, add_profile):
+        from app.api.charts import get_or_compute_chart
+        return get_or_compute_chart(add_profile("Stored"), db)
+
+    def test_cached_equals_reloaded(self, db, chart):
+        """Test results served from the cache equal those reloaded from Strength rows"""
+        store = StrengthStore(version="test")
+        store.store_charts(db, [chart])
+        cached = store.get(db, chart)
+
+        reloaded = StrengthStore(version="test").get(db, chart)
+        assert reloaded == cached == store.compute(db, chart)
+        assert list(reloaded["bhavabala"]) == list(range(1, 13))
+        assert list(reloaded["shadbala"]) == list(cached["shadbala"])
+
+    def test_refresh_recomputes_older_versions(self, db, chart):
+        """Test refresh moves charts stored by another engine version to the current one"""
+        StrengthStore(version="old").store_charts(db, [chart])
+        assert chart.strength_engine_version == "old"
+
+        store = StrengthStore(version="new")
+        assert store.refresh(db) == 1
+        assert chart.strength_engine_version == "new"
+        assert {row[0] for row in db.query(Strength.engine_version)} == {"new"}
+        assert store.refresh(db) == 0
+
+    def test_load_ignores_other_versions(self, db, chart):
+        """Test rows of another engine version are never served"""
+        StrengthStore(version="old").store_charts(db, [chart])
+
+        assert StrengthStore(version="new").load(db, chart) == {strength_type: {} for strength_type in STRENGTH_TYPES}
+        assert StrengthStore(version="old").load(db, chart)["shadbala"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Test vectorized synastry"""
+import time
+import pytest
+import numpy as np
+from app.modules.synastry.calculator import synastry_calculator, SYNASTRY_POINTS, ASPECTS
+
+
+@pytest.fixture
+def charts():
+    rng = np.random.default_rng(11)
+    return rng.uniform(0.0, 360.0, len(SYNASTRY_POINTS)), rng.uniform(0.0, 360.0, (1000, len(SYNASTRY_POINTS)))
+
+
+def closest_aspect(lon1, lon2):
+    """Reference aspect by looping over the aspect list"""
+    separation = abs(lon1 - lon2) % 360.0
+    separation = min(separation, 360.0 - separation)
+    best = None
+    for index, (_, angle, orb, _) in enumerate(ASPECTS):
+        strength = 1.0 - abs(separation - angle) / orb
+        if strength > 0 and (best is None or strength > best[1]):
+            best = (index, strength)
+    return best
+
+
+class TestSynastry:
+    """Test cross-chart aspect matrices, overlays and rankings"""
+
+    def test_aspects_match_loop(self, charts):
+        """Test the aspect matrix against a pairwise loop"""
+        chart, others = charts
+        kind, strength = synastry_calculator.aspect_matrix(chart, others[:20])
+
+        for n in range(20):
+            for i in range(len(chart)):
+                for j in range(len(chart)):
+                    expected = closest_aspect(chart[i], others[n, j])
+                    if expected is None:
+                        assert kind[n, i, j] == -1
+                    else:
+                        assert kind[n, i, j] == expected[0]
+                        assert strength[n, i, j] == pytest.approx(expected[1])
+
+    def test_exact_conjunction_across_zero(self):
+        """Test that separations wrap at 0 degrees Aries"""
+        chart = np.array([10.0, 359.0] + [100.0] * 8)
+        other = np.array([200.0, 1.0] + [260.0] * 8)
+        result = synastry_calculator.compare(chart, other)
+
+        top = result["contacts"][0]
+        assert (top["point1"], top["point2"], top["aspect"]) == ("SUN", "SUN", "CONJUNCTION")
+        assert top["orb"] == pytest.approx(2.0)
+
+    def test_overlays(self):
+        """Test whole-sign house overlays in both directions"""
+        chart = np.array([15.0] + [45.0] * 9)   # Aries ascendant, planets in Taurus
+        other = np.array([100.0] + [5.0] * 9)   # Cancer ascendant, planets in Aries
+        others_in_chart, chart_in_other = synastry_calculator.overlays(chart, other)
+
+        assert others_in_chart[0, 1] == 1
+        assert chart_in_other[0, 1] == 11
+
+    def test_one_against_thousand(self, charts):
+        """Test that ranking a thousand charts is fast and consistent with compare"""
+        chart, others = charts
+        started = time.perf_counter()
+        ranking = synastry_calculator.rank(chart, others, limit=5)
+        assert time.perf_counter() - started < 0.5
+
+        best, score = ranking[0]
+        assert synastry_calculator.compare(chart, others[best])["score"] == pytest.approx(score, abs=1e-3)
+        assert [s for _, s in ranking] == sorted([s for _, s in ranking], reverse=True)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
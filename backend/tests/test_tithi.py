@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Test tithi table"""
+import pytest
+import numpy as np
+from datetime import date, datetime, timedelta
+from app.modules.ephemeris.calculator import ephemeris
+from app.modules.ephemeris.tithi import get_tithi, get_tithis, elongation, tithi_table
+from app.modules.align27.calculator import align27_calculator
+
+
+class TestTithi:
+    """Test tithi calculation from Sun-Moon elongation"""
+
+    def test_new_moon_starts_shukla_pratipada(self):
+        """Test that the 2024-04-08 new moon (18:21 UTC) begins tithi 1"""
+        tithi = get_tithi(datetime(2024, 4, 8, 20, 0))
+
+        assert tithi["tithi"] == 1
+        assert tithi["paksha"] == "Shukla"
+        assert abs(tithi["start"] - datetime(2024, 4, 8, 18, 21)) < timedelta(minutes=2)
+
+    def test_full_moon_starts_krishna_pratipada(self):
+        """Test that the 2024-04-23 full moon (23:49 UTC) begins tithi 16"""
+        tithi = get_tithi(datetime(2024, 4, 24, 6, 0))
+
+        assert tithi["tithi"] == 16
+        assert tithi["paksha"] == "Krishna"
+        assert abs(tithi["start"] - datetime(2024, 4, 23, 23, 49)) < timedelta(minutes=2)
+
+    def test_lookup_matches_elongation(self):
+        """Test that table lookups agree with direct elongation"""
+        jds = np.linspace(
+            ephemeris.get_julian_day(datetime(2024, 1, 1)),
+            ephemeris.get_julian_day(datetime(2024, 12, 31)),
+            500
+        )
+        expected = np.floor(elongation(jds) / 12.0).astype(int)
+
+        assert [tithi_table.lookup(jd)[0] for jd in jds] == list(expected)
+
+    def test_consecutive_tithis_across_year_boundary(self):
+        """Test that tithis are contiguous and sequential across blocks"""
+        tithis = get_tithis(datetime(2024, 12, 20), datetime(2025, 1, 15))
+
+        assert tithis[0]["start"] <= datetime(2024, 12, 20)
+        assert tithis[-1]["end"] >= datetime(2025, 1, 15)
+        for current, following in zip(tithis, tithis[1:]):
+            assert current["end"] == following["start"]
+            assert following["tithi"] == current["tithi"] % 30 + 1
+
+    def test_amavasya_scores_unfavorable(self):
+        """Test that Align27 scores Amavasya at 06:00 as unfavorable"""
+        # Tithi 30 runs from 2024-04-07 ~15:10 to 2024-04-08 18:21 UTC
+        assert get_tithi(datetime(2024, 4, 8, 6, 0))["tithi"] == 30
+        assert align27_calculator._calculate_moon_phase_score(date(2024, 4, 8)) == -3.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Test transit-to-natal contact finder"""
+import pytest
+from datetime import datetime, timedelta
+from app.modules.ephemeris.calculator import ephemeris
+from app.modules.transits.calculator import transit_calculator
+
+
+def jd(year, month, day):
+    return ephemeris.get_julian_day(datetime(year, month, day))
+
+
+def separation(planet, date_iso, target):
+    longitude = ephemeris.get_planet_position(ephemeris.get_julian_day(datetime.fromisoformat(date_iso)), planet)["longitude"]
+    diff = (longitude - target) % 360.0
+    return min(diff, 360.0 - diff)
+
+
+class TestTransitContacts:
+    """Test contact entry, exact and exit instants"""
+
+    def test_retrograde_triple_pass(self):
+        """Test that Saturn over a point in its 2023 retrograde arc makes three exact hits"""
+        target = ephemeris.get_planet_position(jd(2023, 8, 15), "SATURN")["longitude"]
+        result = transit_calculator.find_contacts(
+            [{"transit_planet": "SATURN", "natal_point": "MOON", "orb": 1.0}],
+            {"MOON": target}, jd(2022, 1, 1), jd(2025, 1, 1)
+        )[0]
+
+        exact = [hit for contact in result["contacts"] for hit in contact["exact"]]
+        assert len(exact) == 3
+        assert [hit["retrograde"] for hit in exact] == [False, True, False]
+        assert abs(datetime.fromisoformat(exact[1]["date"]) - datetime(2023, 8, 15)) < timedelta(hours=1)
+
+    def test_entry_exit_at_orb(self):
+        """Test that contacts start and end at the orb and stay inside it"""
+        target = 100.0
+        result = transit_calculator.find_contacts(
+            [{"transit_planet": "JUPITER", "natal_point": "ASCENDANT", "orb": 3.0}],
+            {"ASCENDANT": target}, jd(1990, 1, 1), jd(2040, 1, 1)
+        )[0]
+
+        assert len(result["contacts"]) >= 4
+        for contact in result["contacts"]:
+            assert separation("JUPITER", contact["start"], target) == pytest.approx(3.0, abs=1e-3)
+            assert separation("JUPITER", contact["end"], target) == pytest.approx(3.0, abs=1e-3)
+            for hit in contact["exact"]:
+                assert separation("JUPITER", hit["date"], target) < 1e-3
+            assert contact["passes"] == len(contact["exact"])
+
+    def test_contact_open_at_range_start(self):
+        """Test that a contact already in orb at the start has no entry date"""
+        target = ephemeris.get_planet_position(jd(2010, 1, 1), "SATURN")["longitude"]
+        result = transit_calculator.find_contacts(
+            [{"transit_planet": "SATURN", "natal_point": "SUN", "orb": 2.0}],
+            {"SUN": target}, jd(2010, 1, 1), jd(2012, 1, 1)
+        )[0]
+
+        assert result["contacts"][0]["start"] is None
+
+    def test_shared_sampling_keeps_spec_order(self):
+        """Test that results come back in request order across planets"""
+        specs = [
+            {"transit_planet": "SATURN", "natal_point": "MOON", "orb": 2.0},
+            {"transit_planet": "JUPITER", "natal_point": "MOON", "orb": 2.0},
+            {"transit_planet": "SATURN", "natal_point": "SUN", "orb": 2.0},
+        ]
+        results = transit_calculator.find_contacts(
+            specs, {"MOON": 10.0, "SUN": 200.0}, jd(2000, 1, 1), jd(2030, 1, 1)
+        )
+
+        assert [(r["transit_planet"], r["natal_point"]) for r in results] == [
+            ("SATURN", "MOON"), ("JUPITER", "MOON"), ("SATURN", "SUN")
+        ]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
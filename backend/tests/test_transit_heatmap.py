@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Test the monthly transit heatmap"""
+import pytest
+from datetime import date, datetime
+from app.modules.ephemeris.calculator import ephemeris
+from app.modules.ashtakavarga.calculator import ashtakavarga_calculator
+from app.modules.transits.heatmap import transit_heatmap, HEATMAP_ROWS
+
+NATAL = {
+    planet: {"rasi": rasi}
+    for planet, rasi in {
+        "SUN": 10, "MOON": 11, "MARS": 7, "MERCURY": 10, "JUPITER": 3,
+        "VENUS": 11, "SATURN": 9, "RAHU": 10, "KETU": 4, "ASCENDANT": 1
+    }.items()
+}
+
+DASHAS = [
+    {"lord": "JUPITER", "level": "maha", "start_date": "2010-01-01T00:00:00", "end_date": "2026-01-01T00:00:00"},
+    {"lord": "JUPITER", "level": "antar", "start_date": "2010-01-01T00:00:00", "end_date": "2024-06-15T00:00:00"},
+    {"lord": "SATURN", "level": "antar", "start_date": "2024-06-15T00:00:00", "end_date": "2026-01-01T00:00:00"},
+]
+
+
+class TestTransitHeatmap:
+    """Test monthly aggregation of transit strength"""
+
+    def test_matrix_shape_and_cache(self):
+        """Test axis labels and that a window is computed once per chart"""
+        heatmap = transit_heatmap.build("test-shape", NATAL, DASHAS, date(2024, 11, 20), 4)
+
+        assert heatmap["rows"] == HEATMAP_ROWS
+        assert heatmap["columns"] == ["2024-11", "2024-12", "2025-01", "2025-02"]
+        assert [len(row) for row in heatmap["matrix"]] == [4] * len(HEATMAP_ROWS)
+        assert transit_heatmap.get("test-shape", date(2024, 11, 1), 4) is heatmap
+        assert transit_heatmap.get("test-shape", date(2024, 12, 1), 4) is None
+
+    def test_monthly_means_match_daily_positions(self):
+        """Test Saturn/Jupiter SAV cells against daily positions at noon"""
+        sav = ashtakavarga_calculator.calculate_all(NATAL)["sav"]
+        heatmap = transit_heatmap.build("test-means", NATAL, DASHAS, date(2024, 1, 1), 12)
+        rows = dict(zip(heatmap["rows"], heatmap["matrix"]))
+
+        for month in (1, 5, 10):
+            days = (date(2024, month + 1, 1) - date(2024, month, 1)).days
+            for planet in ("SATURN", "JUPITER"):
+                values = [
+                    sav[int(ephemeris.get_planet_position(
+                        ephemeris.get_julian_day(datetime(2024, month, day, 12)), planet
+                    )["longitude"] / 30)]
+                    for day in range(1, days + 1)
+                ]
+                assert rows[f"{planet.lower()}_sav"][month - 1] == pytest.approx(sum(values) / days, abs=0.01)
+
+        # Saturn was in Aquarius, the natal Moon sign, throughout 2024
+        assert rows["sade_sati"] == [1.0] * 12
+
+    def test_dasha_rows(self):
+        """Test dasha labels per month and undefined cells outside any dasha"""
+        sav = ashtakavarga_calculator.calculate_all(NATAL)["sav"]
+        heatmap = transit_heatmap.build("test-dashas", NATAL, DASHAS, date(2025, 11, 1), 3)
+        rows = dict(zip(heatmap["rows"], heatmap["matrix"]))
+
+        assert heatmap["maha_dasha"] == ["JUPITER", "JUPITER", None]
+        assert heatmap["antar_dasha"] == ["SATURN", "SATURN", None]
+        assert rows["dasha_sav"][0] == (sav[2] + sav[8]) / 2
+        assert rows["dasha_sav"][2] is None
+        assert rows["score"][2] is not None
+
+    def test_window_outside_ingress_tables(self):
+        """Test windows past the ingress tables raise ValueError"""
+        with pytest.raises(ValueError, match="outside supported range"):
+            transit_heatmap.build("test-range", NATAL, DASHAS, date(2195, 1, 1), 30 * 12)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Test transit-triggered yoga windows"""
+import pytest
+import numpy as np
+from datetime import datetime
+from app.modules.ephemeris.calculator import ephemeris
+from app.modules.yoga.detector import yoga_detector
+from app.modules.yoga.transits import transit_rules, transit_yoga_engine, TRANSIT_PREFIX
+
+NATAL = {
+    planet: {"rasi": rasi, "dignity": ephemeris.get_dignity(planet, rasi)}
+    for planet, rasi in {
+        "SUN": 10, "MOON": 4, "MARS": 7, "MERCURY": 10, "JUPITER": 3,
+        "VENUS": 11, "SATURN": 9, "RAHU": 10, "KETU": 4
+    }.items()
+}
+ASCENDANT = 15.0
+
+
+class TestTransitYogas:
+    """Test transit variants evaluated over ingress intervals"""
+
+    def test_transit_rules(self):
+        """Test Gaja Kesari yields a variant per planet and lordship rules none"""
+        rules = {r["name"]: r for r in transit_rules(yoga_detector.rule_set, ["JUPITER", "MOON"])}
+
+        jupiter = rules["Gaja Kesari Yoga (transit Jupiter)"]
+        assert jupiter["conditions"] == [
+            {"type": "kendra_from", "planet1": TRANSIT_PREFIX + "JUPITER", "planet2": "MOON"}
+        ]
+        assert "Gaja Kesari Yoga (transit Moon)" in rules
+        assert all(r["base_yoga"] not in ("Lakshmi Yoga", "Kahala Yoga") for r in rules.values())
+
+    def test_windows_match_daily_positions(self):
+        """Test every window against sign placements sampled daily"""
+        jd_start = ephemeris.get_julian_day(datetime(2024, 1, 1))
+        jd_end = jd_start + 3 * 365.25
+        windows = transit_yoga_engine.find_windows(NATAL, ASCENDANT, jd_start, jd_end, ["JUPITER", "SATURN"])
+
+        gaja_kesari = [w for w in windows if w["name"] == "Gaja Kesari Yoga (transit Jupiter)"]
+        assert gaja_kesari
+
+        days = np.arange(jd_start + 0.5, jd_end, 1.0)
+        jupiter_rasi = (ephemeris.get_longitudes(days, "JUPITER")[0] // 30).astype(int) + 1
+        expected = (jupiter_rasi - NATAL["MOON"]["rasi"]) % 3 == 0
+        inside = np.zeros(len(days), dtype=bool)
+        for window in gaja_kesari:
+            inside |= (days >= window["start_jd"]) & (days < window["end_jd"])
+
+        assert np.array_equal(inside, expected)
+
+    def test_windows_are_merged(self):
+        """Test a yoga is reported once per continuous window"""
+        jd_start = ephemeris.get_julian_day(datetime(2024, 1, 1))
+        windows = transit_yoga_engine.find_windows(NATAL, ASCENDANT, jd_start, jd_start + 3650)
+
+        by_name = {}
+        for window in windows:
+            by_name.setdefault(window["name"], []).append(window)
+        for name, group in by_name.items():
+            for earlier, later in zip(group, group[1:]):
+                assert earlier["end_jd"] < later["start_jd"], name
+
+        assert all(w["open_start"] == (w["start_jd"] == jd_start) for w in windows)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""Test compiled yoga rules"""
+import time
+import pytest
+import numpy as np
+from app.modules.yoga.compiler import ChartFeatures, FeatureMatrix, RuleSet, YogaRuleError, GRAHAS
+from app.modules.yoga.detector import yoga_detector, YogaDetector, content_hash
+from sqlalchemy import func
+
+
+def chart(**rasis):
+    """Planets keyed by name, each placed at the start of the given rasi"""
+    return {
+        planet: {"rasi": rasi, "longitude": (rasi - 1) * 30.0, "dignity": "Neutral"}
+        for planet, rasi in rasis.items()
+    }
+
+
+class TestYogaCompiler:
+    """Test rule compilation and evaluation"""
+
+    def test_unknown_condition_rejected(self):
+        """Test that an unknown condition type fails at load"""
+        rule = {"name": "Bogus", "conditions": [{"type": "moon_is_cheese"}]}
+        with pytest.raises(YogaRuleError, match="Bogus"):
+            RuleSet([rule])
+
+    def test_malformed_condition_rejected(self):
+        """Test that a condition missing its arguments fails at load"""
+        with pytest.raises(YogaRuleError, match="in_kendra"):
+            RuleSet([{"name": "Broken", "conditions": [{"type": "in_kendra"}]}])
+
+    def test_index_by_planet_and_house(self):
+        """Test rules are indexed by the planets and houses they reference"""
+        rule_set = yoga_detector.rule_set
+        assert {r.name for r in rule_set.by_planet["JUPITER"]} >= {"Gaja Kesari Yoga", "Hamsa Yoga"}
+        assert "Sasa Yoga" not in {r.name for r in rule_set.by_planet["JUPITER"]}
+        assert "Vipreet Raja Yoga - Sarala" in {r.name for r in rule_set.by_house[8]}
+
+    def test_detect_selected_rules(self):
+        """Test detection restricted to indexed planets and houses matches filtering full detection"""
+        rule_set = yoga_detector.rule_set
+        rng = np.random.default_rng(11)
+        charts = [
+            ({planet: {"rasi": int(rng.integers(1, 13)), "dignity": "Neutral"} for planet in GRAHAS}, float(rng.uniform(0, 360)))
+            for _ in range(200)
+        ]
+        matrix = FeatureMatrix(charts)
+        full = rule_set.detect_batch(matrix)
+
+        selected = rule_set.select(["JUPITER"], [8])
+        assert [r.name for r in selected] == [
+            r.name for r in rule_set.rules if "JUPITER" in r.planets or 8 in r.houses
+        ]
+        columns = [rule_set.rules.index(r) for r in selected]
+        assert np.array_equal(rule_set.detect_batch(matrix, ["JUPITER"], [8]), full[:, columns])
+
+        for planets, ascendant in charts[:20]:
+            features = ChartFeatures(planets, ascendant)
+            assert rule_set.detect(features, ["JUPITER"], [8]) == [
+                r for r in rule_set.detect(features) if r in selected
+            ]
+        assert rule_set.select() == rule_set.rules
+
+    def test_house_lords(self):
+        """Test whole-sign house lords from an Aries ascendant"""
+        features = ChartFeatures(chart(MOON=1), 5.0)
+        assert features.lord[1] == "MARS"
+        assert features.lord[9] == "JUPITER"
+        assert features.lord[12] == "JUPITER"
+
+    def test_amala_uses_tenth_house(self):
+        """Test Amala Yoga for a benefic in the 10th, not the 11th"""
+        names = lambda planets: {y["name"] for y in yoga_detector.detect_yogas(planets, 5.0)}
+        assert "Amala Yoga" in names(chart(VENUS=10, MOON=2))
+        assert "Amala Yoga" not in names(chart(VENUS=11, MOON=5))
+        # 10th from the Moon
+        assert "Amala Yoga" in names(chart(VENUS=11, MOON=2, SUN=5))
+
+    def test_lord_conditions(self):
+        """Test house-lord conditions that previously passed unchecked"""
+        # Aries ascendant: 6th lord Mercury, 9th lord Jupiter, 5th lord Sun
+        yogas = {y["name"]: y for y in yoga_detector.detect_yogas(
+            chart(MERCURY=8, JUPITER=4, SUN=11, MOON=3, MARS=2, VENUS=2, SATURN=2), 5.0
+        )}
+        assert yogas["Vipreet Raja Yoga - Harsha"]["forming_planets"] == ["MERCURY"]
+        assert "Lakshmi Yoga" in yogas
+        assert "Dhana Yoga - 5th & 9th" not in yogas
+
+        yogas = {y["name"] for y in yoga_detector.detect_yogas(
+            chart(MERCURY=2, JUPITER=11, SUN=5, MOON=3, MARS=2, VENUS=2, SATURN=2), 5.0
+        )}
+        assert "Dhana Yoga - 5th & 9th" in yogas
+        assert "Vipreet Raja Yoga - Harsha" not in yogas
+
+    def test_many_rules_fast(self):
+        """Test that a few hundred rules evaluate in milliseconds"""
+        rules = yoga_detector.get_default_rules() * 20
+        rule_set = RuleSet(rules)
+        features = ChartFeatures(chart(SUN=1, MOON=4, MARS=7, MERCURY=1, JUPITER=10,
+                                       VENUS=2, SATURN=11, RAHU=3, KETU=9), 5.0)
+        started = time.perf_counter()
+        rule_set.detect(features)
+        assert time.perf_counter() - started < 0.01
+
+
+
+def random_charts(count, seed=11):
+    rng = np.random.default_rng(seed)
+    dignities = ["Exalted", "Own", "Friend", "Neutral", "Enemy", "Debilitated"]
+    charts = []
+    for _ in range(count):
+        planets = {
+            planet: {"rasi": int(rng.integers(1, 13)), "dignity": str(rng.choice(dignities, p=[.15, .15, .2, .2, .15, .15]))}
+            for planet in GRAHAS if rng.random() > 0.02
+        }
+        charts.append((planets, float(rng.uniform(0, 360))))
+    return charts
+
+
+class TestBatchDetection:
+    """Test vectorized yoga detection over many charts"""
+
+    def test_matches_single_chart_detection(self):
+        """Test that every [chart, rule] cell agrees with detect_yogas"""
+        charts = random_charts(2000)
+        flags = yoga_detector.detect_batch(charts)
+        names = yoga_detector.rule_set.names
+
+        assert flags.shape == (2000, len(names))
+        assert flags.any(axis=0).all()
+        for row, (planets, ascendant) in enumerate(charts):
+            detected = {y["name"] for y in yoga_detector.detect_yogas(planets, ascendant)}
+            assert detected == {name for name, flag in zip(names, flags[row]) if flag}
+
+    def test_boolean_features(self):
+        """Test named placement features"""
+        planets = chart(SUN=1, MOON=4, MERCURY=1, JUPITER=12)
+        planets["JUPITER"]["dignity"] = "Own"
+        names, features = FeatureMatrix([(planets, 5.0)]).boolean_features()
+        row = dict(zip(names, features[0]))
+
+        assert row["SUN_in_kendra"] and row["MOON_in_kendra"]
+        assert row["JUPITER_in_dusthana"] and row["JUPITER_own"]
+        assert row["SUN_MERCURY_conjunct"] and not row["SUN_MOON_conjunct"]
+        assert row["lord_9_in_dusthana"]  # Jupiter rules Sagittarius
+        assert not row["MARS_in_kendra"]
+
+    def test_ml_features(self):
+        """Test the ML feature matrix appends yoga flags"""
+        from app.modules.ml.engine import ml_engine
+
+        charts = [{"planets": planets, "ascendant": asc} for planets, asc in random_charts(50)]
+        names, matrix = ml_engine.extract_yoga_features(charts)
+        assert matrix.shape == (50, len(names))
+        assert "yoga_gaja_kesari_yoga" in names
+        assert set(np.unique(matrix)) <= {0.0, 1.0}
+
+    def test_batch_speed(self):
+        """Test ten thousand charts are evaluated well under a second"""
+        matrix = FeatureMatrix(random_charts(10000, seed=2))
+        started = time.perf_counter()
+        yoga_detector.rule_set.detect_batch(matrix)
+        assert time.perf_counter() - started < 0.5
+
+
+
+class TestRuleVersions:
+    """Test rule set versioning"""
+
+    def test_content_hash(self):
+        """Test the version ignores key order but not content"""
+        rules = yoga_detector.get_default_rules()
+        reordered = [dict(reversed(list(rule.items()))) for rule in rules]
+        assert content_hash(rules) == content_hash(reordered) == yoga_detector.version
+
+        rules[0]["strength"] = 1
+        assert content_hash(rules) != yoga_detector.version
+
+    def test_activate_keeps_rules_on_error(self):
+        """Test a rule set that fails to compile does not replace the active one"""
+        detector = YogaDetector()
+        version = detector.version
+        with pytest.raises(YogaRuleError):
+            detector.activate([{"name": "Bad", "conditions": [{"type": "nope"}]}])
+        assert detector.version == version
+        assert len(detector.rule_set) == len(detector.rules) == 20
+
+    def test_diff_rules(self):
+        """Test reloads are diffed by rule name and definition"""
+        from app.modules.yoga.index import yoga_index
+
+        old = yoga_detector.get_default_rules()
+        new = [rule for rule in yoga_detector.get_default_rules() if rule["name"] != "Kahala Yoga"]
+        new[0]["strength"] = 1
+        new.append({"name": "New Yoga", "type": "Raja", "description": "", "strength": 5, "conditions": []})
+
+        assert yoga_index.diff_rules(old, new) == {
+            "added": ["New Yoga"],
+            "removed": ["Kahala Yoga"],
+            "changed": ["Gaja Kesari Yoga"]
+        }
+
+
+
+class TestYogaSearch:
+    """Test finding profiles by materialized yogas"""
+
+    def test_profiles_resolved_by_chart_hash(self, db, add_profile):
+        """Test profiles sharing birth data share a chart, and edited profiles use their new chart"""
+        from app.api.charts import get_or_compute_chart
+        from app.modules.yoga.index import yoga_index
+
+        first, twin, edited = add_profile("First"), add_profile("Twin"), add_profile("Edited")
+        chart = get_or_compute_chart(first, db)
+        assert get_or_compute_chart(twin, db).id == chart.id
+
+        # A chart computed for other birth data, then reverted
+        edited.birth_time = "22:10:00"
+        other = get_or_compute_chart(edited, db)
+        edited.birth_time = "10:30:00"
+        db.commit()
+
+        pairs = yoga_index.profile_charts(db, [first, twin, edited])
+        assert [(profile.name, c.id) for profile, c in pairs] == [("First", chart.id), ("Twin", chart.id), ("Edited", chart.id)]
+        assert other.id != chart.id
+
+        names = [yoga["name"] for yoga in yoga_detector.detect_yogas(
+            yoga_index.load_planets(db, [chart.id])[chart.id], chart.ascendant
+        )]
+        results = yoga_index.search(db, [first, twin, edited], names[:1])
+        assert [(r["name"], r["natal_chart_id"]) for r in results] == [("First", chart.id), ("Twin", chart.id), ("Edited", chart.id)]
+        assert yoga_index.search(db, [first, twin], names[:1] + ["No Such Yoga"]) == []
+
+    def test_refresh_skips_charts_restamped_meanwhile(self, db, add_profile, monkeypatch):
+        """Test a chart re-indexed while a refresh runs keeps a single set of rows"""
+        from app.api.charts import get_or_compute_chart
+        from app.models.yoga import Yoga
+        from app.modules.yoga import index as yoga_index_module
+        from app.modules.yoga.index import yoga_index
+
+        first = get_or_compute_chart(add_profile("First"), db)
+        second = get_or_compute_chart(add_profile("Second", birth_time="22:10:00"), db)
+        yoga_index.index_charts(db, [first, second])
+
+        old = yoga_detector.get_default_rules()
+        new = yoga_detector.get_default_rules()
+        new.append({"name": "Always Yoga", "type": "Raja", "description": "", "strength": 5, "conditions": []})
+
+        # One chart per batch; the second is re-indexed in full during the first
+        monkeypatch.setattr(yoga_index_module, "BATCH_SIZE", 1)
+        materialize = yoga_index.materialize
+
+        def materialize_and_reindex(db, charts, rules=None):
+            materialize(db, charts, rules)
+            if second not in charts:
+                materialize(db, [second], rules)
+                second.yoga_rule_set = content_hash(new)
+
+        monkeypatch.setattr(yoga_index, "materialize", materialize_and_reindex)
+        assert yoga_index.refresh_rules(db, old, new) == 1
+
+        counts = dict(db.query(Yoga.natal_chart_id, func.count(Yoga.id)).filter(
+            Yoga.yoga_name == "Always Yoga"
+        ).group_by(Yoga.natal_chart_id).all())
+        assert counts == {first.id: 1, second.id: 1}
+        assert first.yoga_rule_set == second.yoga_rule_set == content_hash(new)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])